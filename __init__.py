@@ -4,7 +4,7 @@ This package provides classes and functions for interacting with the Civitai API
 including models, images, creators, and error handling.
 """
 
-from .civitai_api import Civitai, CivitaiAPIClient
+from .civitai_api import AsyncCivitai, Civitai, CivitaiAPIClient
 from .civitai_api.api.images import ImagePeriod, ImageSort
 from .civitai_api.api.models import (
     CommercialUse,
@@ -13,31 +13,61 @@ from .civitai_api.api.models import (
     ModelPeriod,
     ModelSort,
 )
-from .civitai_api.exceptions import CivitaiAPIError, RateLimitError
+from .civitai_api.cache import HTTPCache, ObjectCache
+from .civitai_api.columnar import ColumnBatch
+from .civitai_api.disk_cache import DiskCache
+from .civitai_api.download import Downloader
+from .civitai_api.download_manager import DownloadManager, DownloadStatus, DownloadTask
+from .civitai_api.exceptions import CivitaiAPIError, DownloadError, RateLimitError
+from .civitai_api.hash_resolver import HashResolver
+from .civitai_api.hashing import FileHasher, hash_file
+from .civitai_api.mirror import ModelMirror
+from .civitai_api.offline import OfflineModels
 from .civitai_api.models import Creator, Image, Model, ModelVersion, Tag
 from .civitai_api.models.model import BaseModel, ModelMode, ModelStats, ModelType
+from .civitai_api.ratelimit import RateLimiter
+from .civitai_api.retry import RetryPolicy
+from .civitai_api.transport import Transport
 
 __version__ = "0.1.0"
 
 __all__ = [
+    "AsyncCivitai",
     "BaseModel",
     "Civitai",
     "CivitaiAPIClient",
     "CivitaiAPIError",
+    "ColumnBatch",
     "CommercialUse",
     "Creator",
+    "DiskCache",
+    "DownloadError",
+    "DownloadManager",
+    "DownloadStatus",
+    "DownloadTask",
+    "Downloader",
+    "FileHasher",
+    "HTTPCache",
+    "HashResolver",
     "Image",
     "ImagePeriod",
     "ImageSort",
     "Model",
     "ModelCategory",
     "ModelCreator",
+    "ModelMirror",
     "ModelMode",
     "ModelPeriod",
     "ModelSort",
     "ModelStats",
     "ModelType",
     "ModelVersion",
+    "ObjectCache",
+    "OfflineModels",
     "RateLimitError",
+    "RateLimiter",
+    "RetryPolicy",
     "Tag",
+    "Transport",
+    "hash_file",
 ]
@@ -0,0 +1,116 @@
+"""Decoding speed of /models pages for each installed JSON backend.
+
+Builds a realistic 200-item page (the model in the test fixtures, with description
+HTML and generation metadata on every image), then times ``response.json()`` as
+requests does it (bytes to text, then the standard library) against each backend
+decoding the raw bytes, and the fastest backend fed the page in 64 KiB chunks through
+the streaming ItemSplitter (``iter_models(stream=True)``).
+
+Run from the repository root:
+
+    PYTHONPATH=. python benchmarks/json_decode.py --repeat 20
+"""
+
+import argparse
+import copy
+import gc
+import json
+import time
+from pathlib import Path
+
+import requests
+
+from civitai_api.json_decoder import available_backends, get_decoder
+from civitai_api.streaming import ItemSplitter
+
+FIXTURE = json.loads(
+    (
+        Path(__file__).parent.parent / "tests" / "fixtures" / "api_responses.json"
+    ).read_text()
+)["model_get_1102"]
+
+META = {
+    "prompt": "masterpiece, best quality, synthwave, neon city at night, " * 8,
+    "negativePrompt": "lowres, bad anatomy, bad hands, text, error, missing fingers, "
+    * 4,
+    "seed": 1234567890,
+    "steps": 30,
+    "sampler": "DPM++ 2M Karras",
+    "cfgScale": 7,
+    "Size": "512x768",
+    "Model": "synthwavePunk_v2",
+    "Clip skip": "2",
+    "resources": [{"name": "synthwavePunk", "type": "model", "hash": "dc4c67171e"}],
+}
+
+
+def page(size: int = 200) -> bytes:
+    """Serialize a /models page of ``size`` items."""
+    items = []
+    for i in range(size):
+        item = copy.deepcopy(FIXTURE)
+        item["id"] = i
+        item["description"] = (item.get("description") or "") * 4
+        for version in item["modelVersions"]:
+            for image in version.get("images") or []:
+                image["meta"] = META
+        items.append(item)
+    return json.dumps({"items": items, "metadata": {"nextPage": None}}).encode()
+
+
+def timed(decode, repeat: int) -> float:
+    """Return the best time of ``repeat`` runs of ``decode``, with GC off as in timeit."""
+    best = float("inf")
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            decode()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return best
+
+
+def streamed(body: bytes, loads, chunk_size: int = 64 * 1024) -> int:
+    """Split and decode ``body`` item by item, returning the largest buffer held."""
+    splitter = ItemSplitter()
+    peak = 0
+    for start in range(0, len(body), chunk_size):
+        for raw in splitter.feed(body[start : start + chunk_size]):
+            loads(raw)
+        peak = max(peak, len(splitter._buffer))
+    splitter.close(loads)
+    return peak
+
+
+def main() -> None:
+    """Print decoding times per backend."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    body = page()
+    response = requests.Response()
+    response._content = body
+    response.headers["Content-Type"] = "application/json"
+    print(f"page: {len(body) / 2**20:.1f} MiB")
+
+    baseline = timed(response.json, args.repeat)
+    print(f"{'response.json()':>16}: {baseline * 1000:7.1f} ms")
+    for backend in available_backends():
+        loads = get_decoder(backend)
+        took = timed(lambda loads=loads: loads(body), args.repeat)
+        print(f"{backend:>16}: {took * 1000:7.1f} ms ({baseline / took:4.1f}x)")
+
+    loads = get_decoder()
+    took = timed(lambda: streamed(body, loads), args.repeat)
+    peak = streamed(body, loads)
+    print(
+        f"{'streamed':>16}: {took * 1000:7.1f} ms ({baseline / took:4.1f}x),"
+        f" peak buffer {peak / 2**10:.0f} KiB"
+    )
+
+
+if __name__ == "__main__":
+    main()
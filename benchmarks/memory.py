@@ -0,0 +1,89 @@
+"""Memory used by a catalog of parsed models, regular versus compact.
+
+Builds a catalog from synthetic /models pages (the model in the test fixtures, with
+varied IDs and names), decoding each page separately as a crawl would, and reports the
+memory retained by the regular dataclasses, the slotted variants and the frozen ones.
+
+Run from the repository root:
+
+    PYTHONPATH=. python benchmarks/memory.py --models 20000
+"""
+
+import argparse
+import copy
+import gc
+import json
+import tracemalloc
+from pathlib import Path
+
+from civitai_api.api.models import parse_model
+from civitai_api.models.compact import compact
+
+FIXTURE = json.loads(
+    (
+        Path(__file__).parent.parent / "tests" / "fixtures" / "api_responses.json"
+    ).read_text()
+)["model_get_1102"]
+
+
+def pages(count: int, page_size: int = 100) -> list[bytes]:
+    """Serialize ``count`` synthetic models into /models pages."""
+    result = []
+    for start in range(0, count, page_size):
+        items = []
+        for i in range(start, min(count, start + page_size)):
+            item = copy.deepcopy(FIXTURE)
+            item["id"] = i
+            item["name"] = f"{FIXTURE['name']} {i}"
+            for version in item["modelVersions"]:
+                version["id"] = i * 10 + version["id"]
+            items.append(item)
+        result.append(json.dumps({"items": items}).encode())
+    return result
+
+
+def catalog(raw_pages: list[bytes], mode: str) -> list:
+    """Parse every page and convert it for ``mode``, fully resolving lazy fields."""
+    models = []
+    for raw in raw_pages:
+        for item in json.loads(raw)["items"]:
+            model = parse_model(item)
+            for version in model.modelVersions:
+                version.files, version.images  # noqa: B018 - resolve lazy fields
+            if mode != "regular":
+                model = compact(model, frozen=mode == "frozen")
+            models.append(model)
+    return models
+
+
+def measure(raw_pages: list[bytes], mode: str) -> int:
+    """Return the bytes retained by a catalog built in ``mode``."""
+    gc.collect()
+    tracemalloc.start()
+    models = catalog(raw_pages, mode)
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del models
+    return size
+
+
+def main() -> None:
+    """Print the memory of each kind of catalog."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--models", type=int, default=10_000)
+    args = parser.parse_args()
+
+    raw_pages = pages(args.models)
+    baseline = None
+    for mode in ("regular", "slotted", "frozen"):
+        size = measure(raw_pages, mode)
+        baseline = baseline or size
+        print(
+            f"{mode:>8}: {size / 2**20:8.1f} MiB"
+            f" ({size / args.models:7.0f} B/model, {size / baseline:4.0%})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Latency of offline list_models queries over a mirror of synthetic models.
+
+Fills a temporary mirror with ``--models`` models (two versions each, with a file
+and an image per version), then times typical list_models calls against it. Each
+row is the median of ``--repeat`` runs, including building the Model dataclasses
+of the returned page.
+
+Run from the repository root:
+
+    PYTHONPATH=. python benchmarks/offline_query.py --models 20000
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from civitai_api import ModelMirror, OfflineModels
+from civitai_api.api.models import (
+    CommercialUse,
+    ModelCategory,
+    ModelSort,
+    parse_model,
+)
+from civitai_api.models.model import BaseModel, ModelType
+
+WORDS = [
+    "anime",
+    "synthwave",
+    "portrait",
+    "castle",
+    "neon",
+    "forest",
+    "robot",
+    "pastel",
+    "ink",
+    "armor",
+]
+TYPES = ["LORA", "Checkpoint", "TextualInversion"]
+BASES = ["SD 1.5", "SDXL 1.0", "Pony"]
+
+
+def model(i: int) -> dict:
+    """Return a raw list_models item for model ``i``."""
+    words = [WORDS[i % len(WORDS)], WORDS[i * 7 % len(WORDS)]]
+    return {
+        "id": i,
+        "name": f"{words[0].title()} {words[1]} {i}",
+        "description": f"<p>A <b>{words[0]}</b> model about {words[1]}.</p>" * 5,
+        "type": TYPES[i % len(TYPES)],
+        "nsfw": False,
+        "tags": [*words, "character" if i % 4 else "style"],
+        "creator": {"username": f"user{i % 500}", "image": None},
+        "stats": {
+            "downloadCount": i * 37 % 100000,
+            "favoriteCount": 0,
+            "commentCount": 0,
+            "ratingCount": i % 50,
+            "rating": (i % 50) / 10,
+        },
+        "allowNoCredit": bool(i % 2),
+        "allowCommercialUse": ["Image", "Sell"] if i % 3 else ["None"],
+        "allowDerivatives": True,
+        "allowDifferentLicense": bool(i % 5),
+        "modelVersions": [
+            {
+                "id": i * 10 + v,
+                "name": f"v{v}",
+                "createdAt": f"2024-{i % 12 + 1:02d}-01T00:00:00Z",
+                "downloadUrl": f"http://dl/{i * 10 + v}",
+                "trainedWords": words,
+                "baseModel": BASES[(i + v) % len(BASES)],
+                "stats": {"downloadCount": 1, "ratingCount": 1, "rating": 5.0},
+                "files": [
+                    {
+                        "id": i * 10 + v,
+                        "name": "model.safetensors",
+                        "sizeKB": 144000.0,
+                        "hashes": {"SHA256": f"{i:064X}"},
+                        "primary": True,
+                    }
+                ],
+                "images": [{"url": f"http://img/{i}/{v}", "width": 512}],
+            }
+            for v in range(2)
+        ],
+    }
+
+
+QUERIES = {
+    "newest page": {},
+    "search": {"query": "synthw castle"},
+    "search + type": {"query": "anime", "types": [ModelType.LORA]},
+    "tag, most downloaded": {"tag": "neon", "sort": ModelSort.MOST_DOWNLOADED},
+    "username": {"username": "user42"},
+    "base model + license": {
+        "base_models": [BaseModel.SDXL_1_0],
+        "allow_commercial_use": [CommercialUse.SELL],
+        "allow_no_credit": True,
+    },
+    "category, top rated": {
+        "categories": [ModelCategory.STYLE],
+        "sort": ModelSort.HIGHEST_RATED,
+    },
+    "page 50": {"page": 50, "limit": 20},
+}
+
+
+def main() -> None:
+    """Print the median milliseconds per query."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--models", type=int, default=20000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    with (
+        tempfile.TemporaryDirectory() as tmp,
+        ModelMirror(Path(tmp) / "mirror.db") as mirror,
+    ):
+        start = time.perf_counter()
+        for first in range(1, args.models + 1, 1000):
+            last = min(first + 1000, args.models + 1)
+            mirror.write([parse_model(model(i)) for i in range(first, last)])
+        print(f"mirrored {args.models:,} models in {time.perf_counter() - start:.1f}s")
+
+        offline = OfflineModels(mirror)
+        print(f"{'query':>22} {'ms':>8} {'models':>7}")
+        for name, kwargs in QUERIES.items():
+            kwargs = {"limit": args.limit, **kwargs}
+            times = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                page = offline.list_models(**kwargs)
+                times.append(time.perf_counter() - start)
+            median = statistics.median(times) * 1000
+            print(f"{name:>22} {median:8.2f} {len(page):7}")
+
+
+if __name__ == "__main__":
+    main()
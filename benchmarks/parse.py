@@ -0,0 +1,90 @@
+"""Parse throughput of the compiled schema decoders against the builder tables.
+
+Both paths build the same objects from the same raw items: "builders" runs the
+per-attribute builder functions one by one (the parse path before the schemas were
+compiled), "compiled" runs the decoder each Schema generates. Nested lists (versions
+of a model, files and images of a version) are deferred until read, so each has its
+own row.
+
+Run from the repository root:
+
+    PYTHONPATH=. python benchmarks/parse.py --items 20000
+"""
+
+import argparse
+import gc
+import json
+import time
+from pathlib import Path
+
+from civitai_api.api import creators, images, models, tags
+from civitai_api.projection import build
+
+FIXTURES = json.loads(
+    (
+        Path(__file__).parent.parent / "tests" / "fixtures" / "api_responses.json"
+    ).read_text()
+)
+MODEL = FIXTURES["model_get_1102"]
+VERSION = MODEL["modelVersions"][0]
+IMAGE = {
+    "id": 7,
+    "url": "http://img",
+    "hash": "h",
+    "width": 512,
+    "height": 768,
+    "nsfw": False,
+    "createdAt": "2025-08-14T12:34:56Z",
+    "postId": 1,
+    "stats": {"likeCount": 3, "heartCount": 2},
+    "meta": {"prompt": "masterpiece"},
+    "username": "u",
+}
+
+CASES = {
+    "Model": (models._MODEL, MODEL),
+    "ModelVersion": (models._MODEL_VERSION, VERSION),
+    "ModelVersionFile": (models._FILE, VERSION["files"][0]),
+    "ModelVersionImage": (models._IMAGE, (VERSION.get("images") or [IMAGE])[0]),
+    "Image": (images._IMAGE, IMAGE),
+    "Creator": (creators._CREATOR, {"username": "u", "modelCount": 3, "link": "l"}),
+    "Tag": (tags._TAG, {"name": "t", "modelCount": 3, "link": "l"}),
+}
+
+
+def rate(parse, item, count: int, repeat: int) -> float:
+    """Return the best items per second of ``repeat`` runs parsing ``item`` ``count`` times."""
+    best = float("inf")
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(count):
+                parse(item)
+            best = min(best, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return count / best
+
+
+def main() -> None:
+    """Print items per second per class, before and after compiling."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'class':>18} {'builders/s':>12} {'compiled/s':>12}")
+    for name, (schema, item) in CASES.items():
+        before = rate(
+            lambda item, schema=schema: build(schema.cls, item, None, schema.builders),
+            item,
+            args.items,
+            args.repeat,
+        )
+        after = rate(schema, item, args.items, args.repeat)
+        print(f"{name:>18} {before:12,.0f} {after:12,.0f} ({after / before:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,33 +1,145 @@
 """Civitai API Client."""
 
+from types import TracebackType
+from typing import Self
+
+from .aio import AsyncCivitai
 from .api.creators import CreatorsAPI
 from .api.images import ImagesAPI
 from .api.model_versions import ModelVersionsAPI
 from .api.models import ModelsAPI
 from .api.tags import TagsAPI
+from .bulk import BulkResult
+from .cache import HTTPCache, ObjectCache
 from .client import CivitaiAPIClient, CivitaiAPIError, RateLimitError
+from .columnar import IMAGE_COLUMNS, MODEL_COLUMNS, ColumnBatch
+from .disk_cache import DiskCache
+from .download import Downloader
+from .download_manager import DownloadManager, DownloadStatus, DownloadTask
+from .exceptions import DownloadError
+from .hash_resolver import HashResolver
+from .hashing import FileHasher
+from .json_decoder import JSONDecoder
+from .mirror import ModelMirror, SyncStats
+from .offline import OfflineModels
+from .ratelimit import RateLimiter
+from .retry import RetryBudget, RetryEvent, RetryPolicy
+from .transport import Transport
 
 
 class Civitai:
-    """Civitai API client providing access to creators, images, models, model versions, and tags."""
+    """Civitai API client providing access to creators, images, models, model versions, tags, and file downloads.
+
+    All endpoint APIs share one Transport, so they reuse the same pooled connections.
+    Use it as a context manager (or call ``close``) to release those connections.
+    """
 
-    def __init__(self, api_key: str | None = None) -> None:
+    def __init__(
+        self,
+        api_key: str | None = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        keep_alive_idle: int | None = None,
+        requests_per_second: float | None = None,
+        burst: int = 1,
+        retry_policy: RetryPolicy | None = None,
+        http_cache: HTTPCache | None = None,
+        object_cache: ObjectCache | None = None,
+        coalesce: bool = True,
+        disk_cache: DiskCache | None = None,
+        json_decoder: str | JSONDecoder | None = None,
+        transport: Transport | None = None,
+    ) -> None:
         """Initialize the Civitai API client with optional API key.
 
         Args:
             api_key (str | None): Optional API key for authentication.
+            pool_connections (int): Number of per-host connection pools to keep.
+            pool_maxsize (int): Maximum number of connections kept open per host.
+            pool_block (bool): Block when a host's pool is exhausted instead of opening extra connections.
+            keep_alive (bool): Keep connections open between requests.
+            keep_alive_idle (int | None): Idle seconds before TCP keep-alive probes are sent.
+            requests_per_second (float | None): Client-side request budget shared by all endpoints. None disables rate limiting.
+            burst (int): Requests that may be sent back to back within the budget.
+            retry_policy (RetryPolicy | None): Retry policy shared by all endpoints. Defaults to RetryPolicy().
+            http_cache (HTTPCache | None): Conditional-request cache for GET responses. None disables it.
+            object_cache (ObjectCache | None): In-process cache of objects returned by the single-entity getters. None disables it.
+            coalesce (bool): Let concurrent identical GETs share one request and one parsed result.
+            disk_cache (DiskCache | None): Persistent SQLite cache for GET responses. None disables it.
+            json_decoder (str | JSONDecoder | None): JSON backend (``"orjson"``, ``"msgspec"`` or ``"json"``) or decoding function. Defaults to the fastest one installed.
+            transport (Transport | None): Existing transport to use. The other settings are ignored when given.
 
         """
-        # TODO: Implement global session singleton
-        # TODO: Modify the parent class (CivitAPIClient) to take the session object
-        # TODO: Implement context managers to handle session lifecycle and close connections after use.
         # TODO: Clean up the use of abstract methods. I think this code may be have been generated a bit,
         #   it has no consistent style.
-        self.creators = CreatorsAPI(api_key)
-        self.images = ImagesAPI(api_key)
-        self.models = ModelsAPI(api_key)
-        self.model_versions = ModelVersionsAPI(api_key)
-        self.tags = TagsAPI(api_key)
+        self.transport = transport or Transport(
+            api_key,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+            keep_alive_idle=keep_alive_idle,
+            rate_limiter=(
+                RateLimiter(requests_per_second, burst) if requests_per_second else None
+            ),
+            retry_policy=retry_policy,
+            http_cache=http_cache,
+            object_cache=object_cache,
+            coalesce=coalesce,
+            disk_cache=disk_cache,
+            json_decoder=json_decoder,
+        )
+        self.creators = CreatorsAPI(api_key, transport=self.transport)
+        self.images = ImagesAPI(api_key, transport=self.transport)
+        self.models = ModelsAPI(api_key, transport=self.transport)
+        self.model_versions = ModelVersionsAPI(api_key, transport=self.transport)
+        self.tags = TagsAPI(api_key, transport=self.transport)
+        self.downloads = Downloader(api_key, transport=self.transport)
+
+    def close(self) -> None:
+        """Close the shared transport and its pooled connections."""
+        self.transport.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
 
 
-__all__ = ["Civitai", "CivitaiAPIClient", "CivitaiAPIError", "RateLimitError"]
+__all__ = [
+    "IMAGE_COLUMNS",
+    "MODEL_COLUMNS",
+    "AsyncCivitai",
+    "BulkResult",
+    "Civitai",
+    "CivitaiAPIClient",
+    "CivitaiAPIError",
+    "ColumnBatch",
+    "DiskCache",
+    "DownloadError",
+    "DownloadManager",
+    "DownloadStatus",
+    "DownloadTask",
+    "Downloader",
+    "FileHasher",
+    "HTTPCache",
+    "HashResolver",
+    "ModelMirror",
+    "ObjectCache",
+    "OfflineModels",
+    "RateLimitError",
+    "RateLimiter",
+    "RetryBudget",
+    "RetryEvent",
+    "RetryPolicy",
+    "SyncStats",
+    "Transport",
+]
@@ -0,0 +1,118 @@
+"""Asyncio client for the Civitai API.
+
+Requires the optional ``httpx`` dependency (``pip install civitai-api[async]``).
+"""
+
+from types import TracebackType
+from typing import Self
+
+from ..cache import HTTPCache, ObjectCache
+from ..client import CivitaiAPIClient
+from ..json_decoder import JSONDecoder
+from ..ratelimit import RateLimiter
+from ..retry import RetryPolicy
+from .api import (
+    AsyncCreatorsAPI,
+    AsyncImagesAPI,
+    AsyncModelsAPI,
+    AsyncModelVersionsAPI,
+    AsyncTagsAPI,
+)
+from .client import AsyncCivitaiAPIClient
+from .transport import AsyncTransport
+
+
+class AsyncCivitai:
+    """Async Civitai API client providing access to creators, images, models, model versions, and tags.
+
+    All endpoint APIs share one AsyncTransport. Use it as an async context manager
+    (or await ``aclose``) to release its connections.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        max_concurrency: int = 100,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float | None = 5.0,
+        timeout: float | None = 30.0,
+        base_url: str = CivitaiAPIClient.BASE_URL,
+        requests_per_second: float | None = None,
+        burst: int = 1,
+        retry_policy: RetryPolicy | None = None,
+        http_cache: HTTPCache | None = None,
+        object_cache: ObjectCache | None = None,
+        coalesce: bool = True,
+        json_decoder: str | JSONDecoder | None = None,
+        transport: AsyncTransport | None = None,
+    ) -> None:
+        """Initialize the async client.
+
+        Args:
+            api_key (str | None): Optional API key for authentication.
+            max_concurrency (int): Maximum number of requests allowed in flight at once.
+            max_connections (int): Maximum number of open connections.
+            max_keepalive_connections (int): Maximum number of idle connections kept alive.
+            keepalive_expiry (float | None): Seconds an idle connection is kept alive.
+            timeout (float | None): Per-request timeout in seconds.
+            base_url (str): Root URL endpoints are resolved against.
+            requests_per_second (float | None): Client-side request budget shared by all endpoints. None disables rate limiting.
+            burst (int): Requests that may be sent back to back within the budget.
+            retry_policy (RetryPolicy | None): Retry policy shared by all endpoints. Defaults to RetryPolicy().
+            http_cache (HTTPCache | None): Conditional-request cache for GET responses. None disables it.
+            object_cache (ObjectCache | None): In-process cache of objects returned by the single-entity getters. None disables it.
+            coalesce (bool): Let concurrent identical GETs share one request and one parsed result.
+            json_decoder (str | JSONDecoder | None): JSON backend or decoding function. Defaults to the fastest one installed.
+            transport (AsyncTransport | None): Existing transport to use. The other settings are ignored when given.
+
+        """
+        self.transport = transport or AsyncTransport(
+            api_key,
+            max_concurrency=max_concurrency,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            timeout=timeout,
+            base_url=base_url,
+            rate_limiter=(
+                RateLimiter(requests_per_second, burst) if requests_per_second else None
+            ),
+            retry_policy=retry_policy,
+            http_cache=http_cache,
+            object_cache=object_cache,
+            coalesce=coalesce,
+            json_decoder=json_decoder,
+        )
+        self.creators = AsyncCreatorsAPI(api_key, transport=self.transport)
+        self.images = AsyncImagesAPI(api_key, transport=self.transport)
+        self.models = AsyncModelsAPI(api_key, transport=self.transport)
+        self.model_versions = AsyncModelVersionsAPI(api_key, transport=self.transport)
+        self.tags = AsyncTagsAPI(api_key, transport=self.transport)
+
+    async def aclose(self) -> None:
+        """Close the shared transport and its pooled connections."""
+        await self.transport.aclose()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+
+__all__ = [
+    "AsyncCivitai",
+    "AsyncCivitaiAPIClient",
+    "AsyncCreatorsAPI",
+    "AsyncImagesAPI",
+    "AsyncModelVersionsAPI",
+    "AsyncModelsAPI",
+    "AsyncTagsAPI",
+    "AsyncTransport",
+]
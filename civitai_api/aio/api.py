@@ -0,0 +1,315 @@
+"""Async endpoint APIs mirroring CreatorsAPI, ImagesAPI, ModelsAPI, ModelVersionsAPI and TagsAPI.
+
+Responses are parsed with the same functions the synchronous APIs use.
+"""
+
+from collections.abc import AsyncGenerator, AsyncIterator, Iterable
+from typing import Any
+from urllib.parse import parse_qsl, urlparse
+
+from ..api.creators import parse_creator
+from ..api.images import (
+    ImagePeriod,
+    ImageSort,
+    construct_image_params,
+    parse_image,
+)
+from ..api.models import (
+    CommercialUse,
+    ModelCategory,
+    ModelPeriod,
+    ModelSort,
+    construct_model_params,
+    parse_model,
+    parse_model_version,
+)
+from ..api.tags import parse_tag
+from ..bulk import BulkResult, bulk_fetch_async
+from ..columnar import IMAGE_COLUMNS, MODEL_COLUMNS, ColumnBatch
+from ..models.creator import Creator
+from ..models.image import Image
+from ..models.model import BaseModel, Model, ModelType
+from ..models.model_version import ModelVersion
+from ..models.tag import Tag
+from ..prefetch import read_ahead_async
+from ..projection import parse_fields, projected
+from ..utils import parse_response
+from .client import AsyncCivitaiAPIClient
+
+
+class AsyncCreatorsAPI(AsyncCivitaiAPIClient):
+    """Async API class for interacting with Civitai creators."""
+
+    async def list_creators(
+        self,
+        limit: int | None = None,
+        page: int | None = None,
+        query: str | None = None,
+    ) -> list[Creator]:
+        """Get a list of creators.
+
+        :param limit: The number of results to be returned per page (1-200, default 20)
+        :param page: The page from which to start fetching creators
+        :param query: Search query to filter creators by username
+        :return: A list of Creator objects
+        """
+        params = {"limit": limit, "page": page, "query": query}
+        response = await self.get(
+            "creators", params={k: v for k, v in params.items() if v is not None}
+        )
+        return [parse_creator(item) for item in parse_response(response)["items"]]
+
+    def iter_creators(
+        self,
+        limit: int | None = None,
+        page: int | None = None,
+        query: str | None = None,
+        max_items: int | None = None,
+    ) -> AsyncIterator[Creator]:
+        """Iterate over creators one at a time across every page.
+
+        Accepts the same arguments as CreatorsAPI.iter_creators.
+        """
+        params = {"limit": limit, "page": page, "query": query}
+        return self._paginate(
+            "creators",
+            {k: v for k, v in params.items() if v is not None},
+            parse_creator,
+            max_items,
+        )
+
+
+class AsyncImagesAPI(AsyncCivitaiAPIClient):
+    """Async API class for interacting with Civitai images."""
+
+    async def list_images(
+        self,
+        limit: int | None = None,
+        post_id: int | None = None,
+        model_id: int | None = None,
+        model_version_id: int | None = None,
+        username: str | None = None,
+        nsfw: bool | None = None,
+        sort: ImageSort | None = None,
+        period: ImagePeriod | None = None,
+        page: int | None = None,
+        fields: list[str] | None = None,
+        columnar: bool = False,
+    ) -> list[Image] | ColumnBatch[Image]:
+        """Get a list of images.
+
+        Accepts the same arguments as ImagesAPI.list_images.
+
+        :return: A list of Image objects, or a ColumnBatch of them
+        """
+        response = await self.get("images", params=construct_image_params(locals()))
+        items = parse_response(response)["items"]
+        if columnar:
+            return ColumnBatch.from_rows(
+                items, IMAGE_COLUMNS, projected(parse_image, fields)
+            )
+        projection = parse_fields(fields)
+        return [parse_image(item, projection) for item in items]
+
+    def iter_images(
+        self,
+        limit: int | None = None,
+        post_id: int | None = None,
+        model_id: int | None = None,
+        model_version_id: int | None = None,
+        username: str | None = None,
+        nsfw: bool | None = None,
+        sort: ImageSort | None = None,
+        period: ImagePeriod | None = None,
+        page: int | None = None,
+        cursor: str | None = None,
+        max_items: int | None = None,
+        fields: list[str] | None = None,
+        stream: bool = False,
+    ) -> AsyncIterator[Image]:
+        """Iterate over images one at a time, following the cursor across every page.
+
+        Accepts the same arguments as ImagesAPI.iter_images.
+        """
+        params = construct_image_params(locals())
+        return self._paginate(
+            "images", params, projected(parse_image, fields), max_items, stream
+        )
+
+
+class AsyncModelsAPI(AsyncCivitaiAPIClient):
+    """Async API class for interacting with Civitai models."""
+
+    async def list_models(
+        self,
+        limit: int | None = 100,
+        page: int | None = 1,
+        query: str | None = None,
+        tag: str | None = None,
+        username: str | None = None,
+        types: list[ModelType] | None = None,
+        sort: ModelSort | None = None,
+        period: ModelPeriod | None = None,
+        rating: int | None = None,
+        favorites: bool | None = None,
+        hidden: bool | None = None,
+        primary_file_only: bool | None = None,
+        allow_no_credit: bool | None = None,
+        allow_derivatives: bool | None = None,
+        allow_different_licenses: bool | None = None,
+        base_models: list[BaseModel] | None = None,
+        categories: list[ModelCategory] | None = None,
+        allow_commercial_use: list[CommercialUse] | None = None,
+        prefetch: int = 0,
+        fields: list[str] | None = None,
+        columnar: bool = False,
+    ) -> AsyncGenerator[list[Model] | ColumnBatch[Model], None]:
+        """Yield pages of models, following ``metadata.nextPage`` until exhausted.
+
+        Accepts the same arguments as ModelsAPI.list_models.
+        """
+        url = f"{self.base_url}/models"
+        params = construct_model_params(locals())
+        pages: AsyncIterator[list[Model] | ColumnBatch[Model]] = self._iter_pages(
+            url, params, fields, columnar
+        )
+        if prefetch > 0:
+            pages = read_ahead_async(pages, prefetch)
+        async for models in pages:
+            yield models
+
+    def iter_models(
+        self,
+        max_items: int | None = None,
+        fields: list[str] | None = None,
+        stream: bool = False,
+        **filters: Any,
+    ) -> AsyncIterator[Model]:
+        """Iterate over models one at a time across every page.
+
+        Accepts the same arguments as ModelsAPI.iter_models.
+        """
+        return self._paginate(
+            "models",
+            construct_model_params(filters),
+            projected(parse_model, fields),
+            max_items,
+            stream,
+        )
+
+    async def _iter_pages(
+        self,
+        url: str,
+        params: dict[str, Any],
+        fields: list[str] | None = None,
+        columnar: bool = False,
+    ) -> AsyncGenerator[list[Model] | ColumnBatch[Model], None]:
+        projection = parse_fields(fields)
+        while True:
+            data = await self.get(url, params=params)
+            items = data.get("items", [])
+            if columnar:
+                yield ColumnBatch.from_rows(
+                    items, MODEL_COLUMNS, projected(parse_model, fields)
+                )
+            else:
+                yield [parse_model(item, projection) for item in items]
+
+            next_page_url = data.get("metadata", {}).get("nextPage")
+            if not next_page_url:
+                break
+            parsed_url = urlparse(next_page_url)
+            url = f"{parsed_url.scheme}://{parsed_url.netloc}{parsed_url.path}"
+            params = dict(parse_qsl(parsed_url.query))
+
+    async def get_model(
+        self, model_id: int | str, fields: list[str] | None = None
+    ) -> Model:
+        """Fetch a model by its ID, optionally projected as in ModelsAPI.get_model."""
+        return await self._get_parsed(f"/models/{model_id}", parse_model, fields)
+
+    def get_models(
+        self, model_ids: Iterable[int | str], max_concurrency: int = 8
+    ) -> AsyncIterator[BulkResult[Model]]:
+        """Fetch many models by ID concurrently, yielding each as soon as it arrives."""
+        return bulk_fetch_async(self.get_model, model_ids, max_concurrency)
+
+
+class AsyncModelVersionsAPI(AsyncCivitaiAPIClient):
+    """Async API class for interacting with Civitai model versions."""
+
+    async def get_model_version(
+        self, version_id: int, fields: list[str] | None = None
+    ) -> ModelVersion:
+        """Get a specific model version by ID.
+
+        :param version_id: The ID of the model version to retrieve
+        :param fields: Only build these dotted attributes, leaving the others None
+        :return: A ModelVersion object
+        """
+        return await self._get_parsed(
+            f"model-versions/{version_id}", parse_model_version, fields
+        )
+
+    async def get_model_version_by_hash(self, hash: str) -> ModelVersion:
+        """Get a specific model version by hash.
+
+        :param hash: The hash of the model version to retrieve (AutoV1, AutoV2, SHA256, CRC32, or Blake3)
+        :return: A ModelVersion object
+        """
+        return await self._get_parsed(
+            f"model-versions/by-hash/{hash}", parse_model_version
+        )
+
+    def get_model_versions(
+        self, version_ids: Iterable[int], max_concurrency: int = 8
+    ) -> AsyncIterator[BulkResult[ModelVersion]]:
+        """Fetch many model versions by ID concurrently, yielding each as soon as it arrives.
+
+        :param version_ids: The IDs of the model versions to retrieve
+        :param max_concurrency: Number of requests awaited concurrently
+        :return: An async iterator of BulkResult objects in completion order
+        """
+        return bulk_fetch_async(self.get_model_version, version_ids, max_concurrency)
+
+
+class AsyncTagsAPI(AsyncCivitaiAPIClient):
+    """Async API class for interacting with Civitai tags."""
+
+    async def list_tags(
+        self,
+        limit: int | None = None,
+        page: int | None = None,
+        query: str | None = None,
+    ) -> list[Tag]:
+        """Get a list of tags.
+
+        :param limit: The number of results to be returned per page (1-200, default 20)
+        :param page: The page from which to start fetching tags
+        :param query: Search query to filter tags by name
+        :return: A list of Tag objects
+        """
+        params = {"limit": limit, "page": page, "query": query}
+        response = await self.get(
+            "tags", params={k: v for k, v in params.items() if v is not None}
+        )
+        return [parse_tag(item) for item in parse_response(response)["items"]]
+
+    def iter_tags(
+        self,
+        limit: int | None = None,
+        page: int | None = None,
+        query: str | None = None,
+        max_items: int | None = None,
+    ) -> AsyncIterator[Tag]:
+        """Iterate over tags one at a time across every page.
+
+        Accepts the same arguments as TagsAPI.iter_tags.
+        """
+        params = {"limit": limit, "page": page, "query": query}
+        return self._paginate(
+            "tags",
+            {k: v for k, v in params.items() if v is not None},
+            parse_tag,
+            max_items,
+        )
@@ -0,0 +1,303 @@
+"""Base class for the asyncio endpoint APIs."""
+
+import asyncio
+import urllib.parse
+from collections.abc import AsyncIterator, Callable
+from contextlib import aclosing
+from typing import Any, TypeVar
+
+from ..cache import HTTPCache, ObjectCache
+from ..exceptions import CivitaiAPIError, RateLimitError
+from ..json_decoder import decode_response
+from ..projection import fields_key, projected
+from ..ratelimit import parse_retry_after
+from ..retry import RetryEvent
+from ..streaming import ItemSplitter
+from ..utils import next_page
+from .transport import AsyncTransport, httpx
+
+T = TypeVar("T")
+
+
+class AsyncCivitaiAPIClient:
+    """Async counterpart of CivitaiAPIClient.
+
+    Sends requests through a shared AsyncTransport and decodes the JSON responses.
+    """
+
+    def __init__(
+        self, api_key: str | None = None, transport: AsyncTransport | None = None
+    ) -> None:
+        """Initialize the client with an optional API key.
+
+        Args:
+            api_key (str | None): The API key for authentication.
+            transport (AsyncTransport | None): Shared transport to send requests through. A private one is created when omitted.
+
+        """
+        self.api_key = api_key
+        self.transport = transport if transport is not None else AsyncTransport(api_key)
+
+    @property
+    def base_url(self) -> str:
+        """Root URL endpoints are resolved against."""
+        return self.transport.base_url
+
+    async def get(
+        self,
+        endpoint_or_url: str,
+        params: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Send a GET request to the specified endpoint or URL.
+
+        Args:
+            endpoint_or_url (str): The API endpoint or full URL to send the request to.
+            params (Optional[dict[str, Any]]): Optional query parameters to include in the request.
+
+        Returns:
+            dict[str, Any]: The JSON response from the API.
+
+        Raises:
+            CivitaiAPIError: If an HTTP or request error occurs.
+            RateLimitError: If the API rate limit is exceeded.
+
+        """
+        if endpoint_or_url.startswith("http"):
+            url = endpoint_or_url
+        else:
+            url = f"{self.base_url}/{endpoint_or_url.lstrip('/')}"
+
+        query = urllib.parse.urlencode(params, doseq=True) if params else None
+        flight = self.transport.single_flight
+        if flight is None:
+            return await self._request("GET", url, params=query)
+        return await flight.do(
+            HTTPCache.key(url, query), lambda: self._request("GET", url, params=query)
+        )
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        params: str | None = None,
+    ) -> dict[str, Any]:
+        """Send specified HTTP request and return decoded JSON response.
+
+        GET requests are revalidated against the transport's HTTP cache, as in
+        CivitaiAPIClient._request.
+        """
+        cache = self.transport.http_cache if method == "GET" else None
+        key = cache.key(url, params) if cache is not None else None
+        entry = cache.lookup(key) if cache is not None else None
+        headers = entry.validators() if entry is not None else None
+        try:
+            response = await self._send(method, url, params, headers)
+            if entry is not None and response.status_code == 304:
+                return cache.not_modified(entry)
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 429:
+                msg = "Rate limit exceeded"
+                raise RateLimitError(
+                    msg, retry_after=parse_retry_after(e.response.headers)
+                ) from e
+            msg = f"HTTP error occurred: {e}"
+            raise CivitaiAPIError(msg, status_code=e.response.status_code) from e
+        except httpx.HTTPError as e:
+            msg = f"An error occurred: {e}"
+            raise CivitaiAPIError(msg) from e
+        try:
+            payload = decode_response(response, self.transport.json_loads)
+        except ValueError as e:
+            msg = f"Invalid JSON response: {e}"
+            raise CivitaiAPIError(msg) from e
+        if cache is not None:
+            cache.store(key, response.headers, payload)
+        return payload
+
+    async def _get_parsed(
+        self,
+        endpoint: str,
+        parse: Callable[..., T],
+        fields: list[str] | None = None,
+    ) -> T:
+        """GET ``endpoint`` and parse the response, as in CivitaiAPIClient._get_parsed."""
+        key = endpoint if fields is None else f"{endpoint}?fields={fields_key(fields)}"
+        parse = projected(parse, fields)
+        objects = self.transport.object_cache
+        if objects is not None:
+            cached = objects.get(key)
+            if cached is not None:
+                return cached
+        flight = self.transport.single_flight
+        if flight is None:
+            return await self._fetch_parsed(endpoint, parse, key)
+        return await flight.do(
+            ("parsed", ObjectCache.key(key)),
+            lambda: self._fetch_parsed(endpoint, parse, key),
+        )
+
+    async def _fetch_parsed(
+        self, endpoint: str, parse: Callable[[dict[str, Any]], T], key: str
+    ) -> T:
+        objects = self.transport.object_cache
+        response = await self.get(endpoint)
+        cache = self.transport.http_cache
+        result = parse(response) if cache is None else cache.parsed(response, parse)
+        if objects is not None:
+            objects.put(key, result)
+        return result
+
+    async def _stream_items(
+        self,
+        endpoint_or_url: str,
+        params: dict[str, Any] | None,
+        rest: dict[str, Any],
+    ) -> AsyncIterator[Any]:
+        """GET a list page and yield its raw items as they arrive.
+
+        See CivitaiAPIClient._stream_items.
+        """
+        if endpoint_or_url.startswith("http"):
+            url = endpoint_or_url
+        else:
+            url = f"{self.base_url}/{endpoint_or_url.lstrip('/')}"
+        query = urllib.parse.urlencode(params, doseq=True) if params else None
+        loads = self.transport.json_loads
+        splitter = ItemSplitter()
+        try:
+            response = await self._send("GET", url, query, stream=True)
+            try:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes():
+                    for raw in splitter.feed(chunk):
+                        yield loads(raw)
+            finally:
+                await response.aclose()
+            rest.update(splitter.close(loads))
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 429:
+                msg = "Rate limit exceeded"
+                raise RateLimitError(
+                    msg, retry_after=parse_retry_after(e.response.headers)
+                ) from e
+            msg = f"HTTP error occurred: {e}"
+            raise CivitaiAPIError(msg, status_code=e.response.status_code) from e
+        except httpx.HTTPError as e:
+            msg = f"An error occurred: {e}"
+            raise CivitaiAPIError(msg) from e
+        except (ValueError, TypeError) as e:
+            msg = f"Invalid JSON response: {e}"
+            raise CivitaiAPIError(msg) from e
+
+    async def _paginate(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        parse: Callable[[dict[str, Any]], T],
+        max_items: int | None = None,
+        stream: bool = False,
+    ) -> AsyncIterator[T]:
+        """Yield parsed items from every page of a list endpoint, one page in memory at a time.
+
+        See CivitaiAPIClient._paginate.
+        """
+        if max_items is not None and max_items <= 0:
+            return
+        request: tuple[str, dict[str, Any] | None] | None = (endpoint, params)
+        count = 0
+        while request is not None:
+            url, query = request
+            seen = count
+            if stream:
+                data: dict[str, Any] = {}
+                async with aclosing(self._stream_items(url, query, data)) as items:
+                    async for item in items:
+                        yield parse(item)
+                        count += 1
+                        if max_items is not None and count >= max_items:
+                            return
+            else:
+                data = await self.get(url, params=query)
+                for item in data.get("items") or []:
+                    yield parse(item)
+                    count += 1
+                    if max_items is not None and count >= max_items:
+                        return
+            # An empty page ends the listing, whatever its metadata says.
+            following = (
+                next_page(data.get("metadata") or {}, url, query)
+                if count > seen
+                else None
+            )
+            # Drop the page before fetching the next one.
+            del data
+            request = None if following == request else following
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        params: str | None,
+        headers: dict[str, str] | None = None,
+        stream: bool = False,
+    ) -> "httpx.Response":
+        """Send a request through the transport's rate limiter and retry policy.
+
+        Mirrors CivitaiAPIClient._send. The concurrency bound is only held while a
+        request is on the wire, not while backing off. With ``stream`` the body is
+        left unread, and the caller must close the response.
+        """
+        limiter = self.transport.rate_limiter
+        policy = self.transport.retry_policy
+        attempt, delay = 1, None
+        while True:
+            if limiter is not None:
+                await limiter.acquire_async()
+            policy.record_request()
+            try:
+                async with self.transport.semaphore:
+                    client = self.transport.client
+                    if stream:
+                        response = await client.send(
+                            client.build_request(
+                                method, url, params=params, headers=headers
+                            ),
+                            stream=True,
+                        )
+                    else:
+                        response = await client.request(
+                            method, url, params=params, headers=headers
+                        )
+            except Exception as e:
+                if not policy.should_retry(method, attempt, exception=e):
+                    raise
+                status_code, exception, retry_after = None, e, None
+            else:
+                if limiter is not None:
+                    limiter.observe(response.status_code, response.headers)
+                if not policy.should_retry(
+                    method, attempt, status_code=response.status_code
+                ):
+                    return response
+                await response.aclose()
+                status_code, exception = response.status_code, None
+                # With a limiter, Retry-After is already enforced on every caller.
+                retry_after = (
+                    parse_retry_after(response.headers) if limiter is None else None
+                )
+
+            delay = policy.backoff(delay)
+            wait = max(delay, retry_after or 0)
+            policy.notify(
+                RetryEvent(
+                    method=method,
+                    url=url,
+                    attempt=attempt,
+                    delay=wait,
+                    status_code=status_code,
+                    exception=exception,
+                )
+            )
+            await asyncio.sleep(wait)
+            attempt += 1
@@ -0,0 +1,113 @@
+"""Shared asyncio HTTP transport for the async Civitai client.
+
+Requires the optional ``httpx`` dependency (``pip install civitai-api[async]``).
+"""
+
+import asyncio
+from types import TracebackType
+from typing import Self
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the extra installed
+    httpx = None
+
+from ..cache import HTTPCache, ObjectCache
+from ..client import CivitaiAPIClient
+from ..json_decoder import JSONDecoder, get_decoder
+from ..ratelimit import RateLimiter
+from ..retry import RetryPolicy
+from ..singleflight import AsyncSingleFlight
+
+
+class AsyncTransport:
+    """Pooled httpx.AsyncClient plus a concurrency bound, shared by all async endpoint APIs.
+
+    Attributes:
+        client (httpx.AsyncClient): The client every request is sent through.
+        semaphore (asyncio.Semaphore): Bounds the number of requests in flight.
+        base_url (str): Root URL endpoints are resolved against.
+        rate_limiter (RateLimiter | None): Limiter every request waits on, if any.
+        retry_policy (RetryPolicy): Policy deciding which failed requests are retried.
+        http_cache (HTTPCache | None): Cache GET requests are revalidated against, if any.
+        object_cache (ObjectCache | None): Cache of parsed objects returned by single-entity getters, if any.
+        single_flight (AsyncSingleFlight | None): Coalesces concurrent identical GETs, unless disabled.
+
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        max_concurrency: int = 100,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float | None = 5.0,
+        timeout: float | None = 30.0,
+        base_url: str = CivitaiAPIClient.BASE_URL,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        http_cache: HTTPCache | None = None,
+        object_cache: ObjectCache | None = None,
+        coalesce: bool = True,
+        json_decoder: str | JSONDecoder | None = None,
+    ) -> None:
+        """Create the shared async client.
+
+        Args:
+            api_key (str | None): Optional API key sent as a Bearer token on every request.
+            max_concurrency (int): Maximum number of requests allowed in flight at once.
+            max_connections (int): Maximum number of open connections.
+            max_keepalive_connections (int): Maximum number of idle connections kept alive.
+            keepalive_expiry (float | None): Seconds an idle connection is kept alive.
+            timeout (float | None): Per-request timeout in seconds.
+            base_url (str): Root URL endpoints are resolved against, e.g. a local stand-in server.
+            rate_limiter (RateLimiter | None): Limiter shared by every request sent through this transport.
+            retry_policy (RetryPolicy | None): Retry policy, and with it the retry budget, shared by every
+                request. A default policy is used when omitted; pass ``RetryPolicy(max_attempts=1)`` to disable retries.
+            http_cache (HTTPCache | None): Conditional-request cache for GET responses.
+            object_cache (ObjectCache | None): Cache of parsed Model / ModelVersion objects returned by getters.
+            coalesce (bool): Let concurrent identical GETs share one request and one parsed result.
+            json_decoder (str | JSONDecoder | None): JSON backend or decoding function for response bodies. Defaults to
+                the fastest one installed.
+
+        Raises:
+            ImportError: If httpx is not installed.
+
+        """
+        if httpx is None:
+            msg = "The async client requires httpx: pip install 'civitai-api[async]'"
+            raise ImportError(msg)
+        headers = {"Authorization": f"Bearer {api_key}"} if api_key else None
+        self.base_url = base_url.rstrip("/")
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.http_cache = http_cache
+        self.object_cache = object_cache
+        self.single_flight = AsyncSingleFlight() if coalesce else None
+        self.json_loads = get_decoder(json_decoder)
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.client = httpx.AsyncClient(
+            headers=headers,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+        )
+
+    async def aclose(self) -> None:
+        """Close the client and every pooled connection."""
+        await self.client.aclose()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
@@ -3,11 +3,13 @@
 Provides the CreatorsAPI class for listing and searching creators.
 """
 
+from collections.abc import Iterator
 from typing import Optional
 
 from ..client import CivitaiAPIClient
 from ..models.creator import Creator
-from ..utils import parse_response, safe_get
+from ..schema import Field, Schema
+from ..utils import parse_response
 
 
 class CreatorsAPI(CivitaiAPIClient):
@@ -40,11 +42,42 @@ class CreatorsAPI(CivitaiAPIClient):
         )
         parsed_response = parse_response(response)
 
-        return [
-            Creator(
-                username=safe_get(item, "username") or "",
-                modelCount=int(safe_get(item, "modelCount") or 0),
-                link=safe_get(item, "link") or "",
-            )
-            for item in parsed_response["items"]
-        ]
+        return [parse_creator(item) for item in parsed_response["items"]]
+
+    def iter_creators(
+        self,
+        limit: int | None = None,
+        page: int | None = None,
+        query: str | None = None,
+        max_items: int | None = None,
+    ) -> Iterator[Creator]:
+        """Iterate over creators one at a time across every page.
+
+        :param limit: The number of results to be fetched per page (1-200, default 20)
+        :param page: The page from which to start fetching creators
+        :param query: Search query to filter creators by username
+        :param max_items: Stop after this many creators (default: all of them)
+        :return: An iterator of Creator objects holding one page in memory at a time
+        """
+        params = {"limit": limit, "page": page, "query": query}
+        return self._paginate(
+            "creators",
+            {k: v for k, v in params.items() if v is not None},
+            parse_creator,
+            max_items,
+        )
+
+
+def parse_creator(item: dict) -> Creator:
+    """Build a Creator from a raw API item."""
+    return _CREATOR(item)
+
+
+_CREATOR: Schema[Creator] = Schema(
+    Creator,
+    {
+        "username": Field(default=""),
+        "modelCount": Field(convert=int, default=0),
+        "link": Field(default=""),
+    },
+)
@@ -3,12 +3,17 @@
 Includes functionality for listing images and specifying sorting/filtering options.
 """
 
+from collections.abc import Iterator
 from enum import Enum
-from typing import Optional
+from typing import Any, Optional
 
 from ..client import CivitaiAPIClient
+from ..columnar import IMAGE_COLUMNS, ColumnBatch
 from ..models.image import Image, ImageStats
-from ..utils import parse_datetime, parse_response, safe_get
+from ..projection import Projection, parse_fields, projected
+from ..schema import Field, Schema
+from ..timestamps import parse_timestamp
+from ..utils import parse_response
 
 
 class ImageSort(Enum):
@@ -46,7 +51,9 @@ class ImagesAPI(CivitaiAPIClient):
         sort: ImageSort | None = None,
         period: ImagePeriod | None = None,
         page: int | None = None,
-    ) -> list[Image]:
+        fields: list[str] | None = None,
+        columnar: bool = False,
+    ) -> list[Image] | ColumnBatch[Image]:
         """Get a list of images.
 
         :param limit: The number of results to be returned per page (1-200, default 100)
@@ -58,45 +65,93 @@ class ImagesAPI(CivitaiAPIClient):
         :param sort: The order in which to sort the results
         :param period: The time frame in which the images will be sorted
         :param page: The page from which to start fetching images
-        :return: A list of Image objects
+        :param fields: Only build these dotted attributes, e.g. ``["id", "url", "stats.likeCount"]``, leaving the others (such as ``meta``) None
+        :param columnar: Return a ColumnBatch over IMAGE_COLUMNS, parsing images only when they are read
+        :return: A list of Image objects, or a ColumnBatch of them
         """
-        params = {
-            "limit": limit,
-            "postId": post_id,
-            "modelId": model_id,
-            "modelVersionId": model_version_id,
-            "username": username,
-            "nsfw": nsfw,
-            "sort": sort.value if sort else None,
-            "period": period.value if period else None,
-            "page": page,
-        }
-        response = self.get(
-            "images", params={k: v for k, v in params.items() if v is not None}
-        )
+        response = self.get("images", params=construct_image_params(locals()))
         parsed_response = parse_response(response)
 
-        images = [
-            Image(
-                id=safe_get(item, "id"),
-                url=safe_get(item, "url"),
-                hash=safe_get(item, "hash"),
-                width=safe_get(item, "width"),
-                height=safe_get(item, "height"),
-                nsfw=safe_get(item, "nsfw"),
-                createdAt=parse_datetime(safe_get(item, "createdAt")),
-                postId=safe_get(item, "postId"),
-                stats=ImageStats(
-                    cryCount=safe_get(item["stats"], "cryCount"),
-                    laughCount=safe_get(item["stats"], "laughCount"),
-                    likeCount=safe_get(item["stats"], "likeCount"),
-                    heartCount=safe_get(item["stats"], "heartCount"),
-                    commentCount=safe_get(item["stats"], "commentCount"),
-                ),
-                meta=safe_get(item, "meta"),
-                username=safe_get(item, "username"),
+        if columnar:
+            return ColumnBatch.from_rows(
+                parsed_response["items"], IMAGE_COLUMNS, projected(parse_image, fields)
             )
-            for item in parsed_response["items"]
-        ]
+        projection = parse_fields(fields)
+        return [parse_image(item, projection) for item in parsed_response["items"]]
+
+    def iter_images(
+        self,
+        limit: int | None = None,
+        post_id: int | None = None,
+        model_id: int | None = None,
+        model_version_id: int | None = None,
+        username: str | None = None,
+        nsfw: bool | None = None,
+        sort: ImageSort | None = None,
+        period: ImagePeriod | None = None,
+        page: int | None = None,
+        cursor: str | None = None,
+        max_items: int | None = None,
+        fields: list[str] | None = None,
+        stream: bool = False,
+    ) -> Iterator[Image]:
+        """Iterate over images one at a time, following the cursor across every page.
+
+        Accepts the same filters as list_images.
+
+        :param cursor: The cursor from which to start fetching images
+        :param max_items: Stop after this many images (default: all of them)
+        :param fields: Only build these dotted attributes, leaving the others None
+        :param stream: Parse each page image by image as it downloads, holding one image in memory instead of the page
+        :return: An iterator of Image objects holding one page in memory at a time
+        """
+        params = construct_image_params(locals())
+        return self._paginate(
+            "images", params, projected(parse_image, fields), max_items, stream
+        )
 
-        return images
+
+def construct_image_params(kwargs: dict) -> dict[str, Any]:
+    """Map ``list_images`` keyword arguments onto the /images query parameters."""
+    params = {
+        "limit": kwargs.get("limit"),
+        "postId": kwargs.get("post_id"),
+        "modelId": kwargs.get("model_id"),
+        "modelVersionId": kwargs.get("model_version_id"),
+        "username": kwargs.get("username"),
+        "nsfw": kwargs.get("nsfw"),
+        "sort": kwargs.get("sort").value if kwargs.get("sort") else None,
+        "period": kwargs.get("period").value if kwargs.get("period") else None,
+        "page": kwargs.get("page"),
+        "cursor": kwargs.get("cursor"),
+    }
+    return {k: v for k, v in params.items() if v is not None}
+
+
+def parse_image(item: dict, fields: Projection | None = None) -> Image:
+    """Build an Image from a raw API item.
+
+    :param item: The raw API item
+    :param fields: Only build these attributes (see ``projection.parse_fields``), leaving the others None
+    :return: An Image object
+    """
+    return _IMAGE(item, fields)
+
+
+_IMAGE_STATS: Schema[ImageStats] = Schema(
+    ImageStats,
+    dict.fromkeys(
+        ("cryCount", "laughCount", "likeCount", "heartCount", "commentCount")
+    ),
+)
+
+_IMAGE: Schema[Image] = Schema(
+    Image,
+    {
+        **dict.fromkeys(("id", "url", "hash", "width", "height", "nsfw", "postId")),
+        "createdAt": Field(convert=parse_timestamp),
+        "stats": Field(schema=_IMAGE_STATS),
+        "meta": None,
+        "username": None,
+    },
+)
@@ -1,8 +1,11 @@
 """Provides the ModelVersionsAPI class for interacting with model version endpoints of the Civitai API.
 
-It includes methods to retrieve model versions by ID or hash.
+It includes methods to retrieve model versions by ID or hash, one at a time or in bulk.
 """
 
+from collections.abc import Iterable, Iterator
+
+from ..bulk import BulkResult, bulk_fetch
 from ..client import CivitaiAPIClient
 from ..models.model_version import ModelVersion
 from .models import ModelsAPI
@@ -17,17 +20,21 @@ class ModelVersionsAPI(CivitaiAPIClient):
     def __init__(self, *args, **kwargs) -> None:
         """Initialize ModelVersions endpoint API."""
         super().__init__(*args, **kwargs)
-        self._models_api = ModelsAPI(*args, **kwargs)
+        self._models_api = ModelsAPI(self.api_key, transport=self.transport)
 
-    def get_model_version(self, version_id: int) -> ModelVersion:
+    def get_model_version(
+        self, version_id: int, fields: list[str] | None = None
+    ) -> ModelVersion:
         """Get a specific model version by ID.
 
         :param version_id: The ID of the model version to retrieve
+        :param fields: Only build these dotted attributes, e.g. ``["id", "files.hashes"]``, leaving the others None
         :return: A ModelVersion object
         """
-        response = self.get(f"model-versions/{version_id}")
-        return self._models_api._parse_model_version(
-            response
+        return self._get_parsed(
+            f"model-versions/{version_id}",
+            self._models_api._parse_model_version,
+            fields,
         )  # TODO: Fix accessing a private method of a private attribute.
 
     def get_model_version_by_hash(self, hash: str) -> ModelVersion:
@@ -36,7 +43,17 @@ class ModelVersionsAPI(CivitaiAPIClient):
         :param hash: The hash of the model version to retrieve (AutoV1, AutoV2, SHA256, CRC32, or Blake3)
         :return: A ModelVersion object
         """
-        response = self.get(f"model-versions/by-hash/{hash}")
-        return self._models_api._parse_model_version(
-            response
+        return self._get_parsed(
+            f"model-versions/by-hash/{hash}", self._models_api._parse_model_version
         )  # TODO: Fix accessing a private method of a private attribute.
+
+    def get_model_versions(
+        self, version_ids: Iterable[int], max_workers: int = 8
+    ) -> Iterator[BulkResult[ModelVersion]]:
+        """Fetch many model versions by ID concurrently, yielding each as soon as it arrives.
+
+        :param version_ids: The IDs of the model versions to retrieve
+        :param max_workers: Number of requests run concurrently
+        :return: An iterator of BulkResult objects in completion order, each holding a ModelVersion or the error raised for its ID
+        """
+        return bulk_fetch(self.get_model_version, version_ids, max_workers)
@@ -4,12 +4,19 @@ It includes functionality for listing models, retrieving model details, and pars
 """
 
 import logging
-from collections.abc import Generator
+from collections.abc import Callable, Generator, Iterable, Iterator
 from enum import Enum
+from functools import partial
 from typing import Any, Optional, Union
 from urllib.parse import parse_qsl, urlparse
 
+import requests
+
+from ..bulk import BulkResult, bulk_fetch
 from ..client import CivitaiAPIClient
+from ..columnar import MODEL_COLUMNS, ColumnBatch
+from ..json_decoder import decode_response
+from ..models.lazy import Deferred
 from ..models.model import (
     BaseModel,
     Model,
@@ -24,7 +31,11 @@ from ..models.model_version import (
     ModelVersionImage,
     ModelVersionStats,
 )
-from ..utils import create_enum_list, parse_datetime, parse_response, safe_get
+from ..prefetch import read_ahead
+from ..projection import Projection, parse_fields, projected
+from ..schema import Field, Schema
+from ..timestamps import timestamp_decoder
+from ..utils import create_enum_list, parse_response
 
 
 class ModelSort(Enum):
@@ -114,22 +125,83 @@ class ModelsAPI(CivitaiAPIClient):
         base_models: list[BaseModel] | None = None,
         categories: list[ModelCategory] | None = None,
         allow_commercial_use: list[CommercialUse] | None = None,
-    ) -> Generator[list[Model], None, None]:
-
+        prefetch: int = 0,
+        fields: list[str] | None = None,
+        columnar: bool = False,
+    ) -> Generator[list[Model] | ColumnBatch[Model], None, None]:
+        """Yield pages of models, following ``metadata.nextPage`` until exhausted.
+
+        With ``prefetch`` set, up to that many following pages are fetched and parsed
+        on a background thread while the current page is being processed. With
+        ``fields`` set, e.g. ``["id", "stats.downloadCount", "modelVersions.files.hashes"]``,
+        only those attributes are built and the others are left None. With
+        ``columnar`` set, each page is a ColumnBatch over MODEL_COLUMNS whose models
+        are only parsed when read; join pages with ``ColumnBatch.concat``.
+        """
         print("DEBUG: Entering modified list_models method")
 
         url = f"{self.BASE_URL}/models"
         params = self._construct_params(locals())
+        pages = self._iter_pages(url, params, fields, columnar)
+        if prefetch > 0:
+            pages = read_ahead(pages, prefetch)
+        yield from pages
+
+    def iter_models(
+        self,
+        max_items: int | None = None,
+        fields: list[str] | None = None,
+        stream: bool = False,
+        **filters: Any,
+    ) -> Iterator[Model]:
+        """Iterate over models one at a time across every page.
+
+        Accepts the same filters as list_models, and holds one page in memory at a time.
+
+        Args:
+            max_items (int | None): Stop after this many models. None yields all of them.
+            fields (list[str] | None): Only build these dotted attributes, leaving the others None.
+            stream (bool): Parse each page model by model as it downloads, holding one model in memory instead of the page.
+            **filters (Any): Keyword arguments of list_models, e.g. ``types`` or ``sort``.
+
+        Yields:
+            Model: The matching models, in order.
+
+        """
+        return self._paginate(
+            "models",
+            construct_model_params(filters),
+            projected(parse_model, fields),
+            max_items,
+            stream,
+        )
 
+    def _iter_pages(
+        self,
+        url: str,
+        params: dict[str, Any],
+        fields: list[str] | None = None,
+        columnar: bool = False,
+    ) -> Generator[list[Model] | ColumnBatch[Model], None, None]:
         while True:
             print(f"DEBUG: Fetching URL: {url}")
             print(f"DEBUG: Params: {params}")
 
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-
-            models = self._parse_models(data.get("items", []))
+            try:
+                response = self._send(
+                    "GET", url, partial(self.session.get, url, params=params)
+                )
+                response.raise_for_status()
+                data = decode_response(response, self.transport.json_loads)
+            except (requests.exceptions.RequestException, ValueError) as e:
+                raise self._api_error(e) from e
+
+            if columnar:
+                models = ColumnBatch.from_rows(
+                    data.get("items", []), MODEL_COLUMNS, projected(parse_model, fields)
+                )
+            else:
+                models = self._parse_models(data.get("items", []), fields)
             yield models
 
             metadata = data.get("metadata", {})
@@ -147,164 +219,239 @@ class ModelsAPI(CivitaiAPIClient):
                 break
 
     def _construct_params(self, kwargs: dict) -> dict[str, Any]:
-        params = {
-            "limit": kwargs.get("limit"),
-            "page": kwargs.get("page"),
-            "query": kwargs.get("query"),
-            "tag": kwargs.get("tag"),
-            "username": kwargs.get("username"),
-            "modelType": (
-                [t.value for t in kwargs.get("types", [])]
-                if kwargs.get("types")
-                else None
-            ),
-            "sortBy": kwargs.get("sort").value if kwargs.get("sort") else None,
-            "period": kwargs.get("period").value if kwargs.get("period") else None,
-            "rating": kwargs.get("rating"),
-            "favorites": kwargs.get("favorites"),
-            "hidden": kwargs.get("hidden"),
-            "primaryFileOnly": kwargs.get("primary_file_only"),
-            "allowNoCredit": kwargs.get("allow_no_credit"),
-            "allowDerivatives": kwargs.get("allow_derivatives"),
-            "allowDifferentLicenses": kwargs.get("allow_different_licenses"),
-            "baseModel": (
-                [m.value for m in kwargs.get("base_models", [])]
-                if kwargs.get("base_models")
-                else None
-            ),
-            "category": (
-                [c.value for c in kwargs.get("categories", [])]
-                if kwargs.get("categories")
-                else None
-            ),
-        }
-
-        # Handle allowCommercialUse as a list of values
-        if kwargs.get("allow_commercial_use"):
-            for i, use in enumerate(kwargs["allow_commercial_use"]):
-                params[f"allowCommercialUse[{i}]"] = use.value
-
-        return {k: v for k, v in params.items() if v is not None}
-
-    def get_model(self, model_id: int | str) -> Model:
-        """Fetch a model by its ID."""
-        response = self.get(f"/models/{model_id}")
-
-        m = Model(
-            id=safe_get(response, "id"),
-            name=safe_get(response, "name"),
-            description=safe_get(response, "description"),
-            type=ModelType(safe_get(response, "type")),
-            nsfw=safe_get(response, "nsfw"),
-            tags=safe_get(response, "tags"),
-            mode=(
-                ModelMode(safe_get(response, "mode"))
-                if safe_get(response, "mode")
-                else None
-            ),
-            creator=ModelCreator(
-                username=safe_get(response.get("creator", {}), "username"),
-                image=safe_get(response.get("creator", {}), "image"),
-            ),
-            stats=ModelStats(
-                downloadCount=safe_get(response.get("stats", {}), "downloadCount"),
-                favoriteCount=safe_get(response.get("stats", {}), "favoriteCount"),
-                commentCount=safe_get(response.get("stats", {}), "commentCount"),
-                ratingCount=safe_get(response.get("stats", {}), "ratingCount"),
-                rating=safe_get(response.get("stats", {}), "rating"),
-            ),
-            modelVersions=[
-                self._parse_model_version(v)
-                for v in safe_get(response, "modelVersions")
-            ],
-        )
-        return m
-
-    def _parse_models(self, items: list[dict]) -> list[Model]:
-        models = []
-        for item in items:
-            models.append(
-                Model(
-                    id=safe_get(item, "id"),
-                    name=safe_get(item, "name"),
-                    description=safe_get(item, "description"),
-                    type=ModelType(safe_get(item, "type")),
-                    nsfw=safe_get(item, "nsfw"),
-                    tags=safe_get(item, "tags"),
-                    mode=(
-                        ModelMode(safe_get(item, "mode"))
-                        if safe_get(item, "mode")
-                        else None
-                    ),
-                    creator=ModelCreator(
-                        username=safe_get(item.get("creator", {}), "username"),
-                        image=safe_get(item.get("creator", {}), "image"),
-                    ),
-                    stats=ModelStats(
-                        downloadCount=safe_get(item.get("stats", {}), "downloadCount"),
-                        favoriteCount=safe_get(item.get("stats", {}), "favoriteCount"),
-                        commentCount=safe_get(item.get("stats", {}), "commentCount"),
-                        ratingCount=safe_get(item.get("stats", {}), "ratingCount"),
-                        rating=safe_get(item.get("stats", {}), "rating"),
-                    ),
-                    modelVersions=[
-                        self._parse_model_version(v)
-                        for v in safe_get(item, "modelVersions")
-                    ],
-                )
+        return construct_model_params(kwargs)
+
+    def get_model(self, model_id: int | str, fields: list[str] | None = None) -> Model:
+        """Fetch a model by its ID.
+
+        Args:
+            model_id (int | str): ID of the model.
+            fields (list[str] | None): Only build these dotted attributes, leaving the others None.
+
+        Returns:
+            Model: The model.
+
+        """
+        return self._get_parsed(f"/models/{model_id}", parse_model, fields)
+
+    def get_models(
+        self, model_ids: Iterable[int | str], max_workers: int = 8
+    ) -> Iterator[BulkResult[Model]]:
+        """Fetch many models by ID concurrently, yielding each as soon as it arrives.
+
+        Requests share this client's transport, so they respect its rate limiter and
+        caches. Keep ``max_workers`` at or below the transport's ``pool_maxsize`` so
+        every worker can reuse a pooled connection.
+
+        Args:
+            model_ids (Iterable[int | str]): IDs of the models to fetch.
+            max_workers (int): Number of requests run concurrently.
+
+        Yields:
+            BulkResult[Model]: One result per ID, in completion order, holding either the model or the error raised for it.
+
+        """
+        return bulk_fetch(self.get_model, model_ids, max_workers)
+
+    def _parse_models(
+        self, items: list[dict], fields: list[str] | None = None
+    ) -> list[Model]:
+        projection = parse_fields(fields)
+        return [parse_model(item, projection) for item in items]
+
+    def _parse_model_version(
+        self, version: dict, fields: Projection | None = None
+    ) -> ModelVersion:
+        return parse_model_version(version, fields)
+
+
+def parse_model(item: dict, fields: Projection | None = None) -> Model:
+    """Build a Model, including its versions, from a raw API item.
+
+    Args:
+        item (dict): The raw API item.
+        fields (Projection | None): Only build these attributes (see ``projection.parse_fields``), leaving the others None.
+
+    Returns:
+        Model: The parsed model.
+
+    """
+    return _MODEL(item, fields)
+
+
+def parse_model_versions(
+    versions: list[dict], fields: Projection | None = None
+) -> list[ModelVersion]:
+    """Build the ModelVersions of a model from its raw ``modelVersions``."""
+    return [parse_model_version(v, fields) for v in versions]
+
+
+def parse_model_version(
+    version: dict, fields: Projection | None = None
+) -> ModelVersion:
+    """Build a ModelVersion from a raw API item.
+
+    Without a projection of its own, files and images are parsed on first access.
+
+    Args:
+        version (dict): The raw API item.
+        fields (Projection | None): Only build these attributes, leaving the others None.
+
+    Returns:
+        ModelVersion: The parsed model version.
+
+    """
+    return _MODEL_VERSION(version, fields)
+
+
+def parse_model_version_files(
+    files: list[dict], fields: Projection | None = None
+) -> list[ModelVersionFile]:
+    """Build the ModelVersionFiles of a version from its raw ``files``."""
+    return [_FILE(f, fields) for f in files]
+
+
+def parse_model_version_images(
+    images: list[dict] | None, fields: Projection | None = None
+) -> list[ModelVersionImage] | None:
+    """Build the ModelVersionImages of a version from its raw ``images``, or None if it has none."""
+    if not images:
+        return None
+    return [_IMAGE(i, fields) for i in images]
+
+
+def _lazy(
+    parse: Callable[[Any, Projection | None], Any], raw: Any, fields: Projection | None
+) -> Any:
+    # A projected sub-list is small, so it is built right away rather than keeping
+    # the whole raw list alive until first access.
+    return Deferred(parse, raw) if fields is None else parse(raw, fields)
+
+
+_CREATOR: Schema[ModelCreator] = Schema(ModelCreator, {"username": None, "image": None})
+
+_MODEL_STATS: Schema[ModelStats] = Schema(
+    ModelStats,
+    dict.fromkeys(
+        ("downloadCount", "favoriteCount", "commentCount", "ratingCount", "rating")
+    ),
+)
+
+_MODEL: Schema[Model] = Schema(
+    Model,
+    {
+        "id": None,
+        "name": None,
+        "description": None,
+        "type": Field(convert=ModelType),
+        "nsfw": None,
+        "tags": None,
+        "mode": Field(convert=ModelMode, optional=True),
+        "creator": Field(schema=_CREATOR),
+        "stats": Field(schema=_MODEL_STATS),
+        "modelVersions": Field(
+            builder=lambda item, fields: _lazy(
+                parse_model_versions, item.get("modelVersions"), fields
             )
-        return models
-
-    def _parse_model_version(self, version: dict) -> ModelVersion:
-        created_at_str = safe_get(version, "createdAt")
-        created_at = parse_datetime(created_at_str) if created_at_str else None
-        if safe_get(version, "images"):
-            images = [
-                ModelVersionImage(
-                    url=safe_get(i, "url"),
-                    nsfw=safe_get(i, "nsfw"),
-                    width=safe_get(i, "width"),
-                    height=safe_get(i, "height"),
-                    hash=safe_get(i, "hash"),
-                    meta=safe_get(i, "meta"),
-                )
-                for i in safe_get(version, "images")
-            ]
-        else:
-            images = None
-        return ModelVersion(
-            id=safe_get(version, "id"),
-            modelId=safe_get(version, "modelId"),
-            name=safe_get(version, "name"),
-            createdAt=created_at,
-            downloadUrl=safe_get(version, "downloadUrl"),
-            trainedWords=safe_get(version, "trainedWords"),
-            baseModel=safe_get(version, "baseModel"),
-            files=[
-                ModelVersionFile(
-                    name=safe_get(f, "name"),
-                    id=safe_get(f, "id"),
-                    sizeKb=safe_get(f, "sizeKB"),
-                    type=safe_get(f, "type"),
-                    format=safe_get(f, "format"),
-                    pickleScanResult=safe_get(f, "pickleScanResult"),
-                    pickleScanMessage=safe_get(f, "pickleScanMessage"),
-                    virusScanResult=safe_get(f, "virusScanResult"),
-                    scannedAt=(
-                        parse_datetime(safe_get(f, "scannedAt"))
-                        if safe_get(f, "scannedAt")
-                        else None
-                    ),
-                    hashes=safe_get(f, "hashes"),
-                    downloadUrl=safe_get(f, "downloadUrl"),
-                    primary=safe_get(f, "primary"),
-                )
-                for f in safe_get(version, "files")
-            ],
-            images=images,
-            stats=ModelVersionStats(
-                downloadCount=safe_get(version.get("stats", {}), "downloadCount"),
-                ratingCount=safe_get(version.get("stats", {}), "ratingCount"),
-                rating=safe_get(version.get("stats", {}), "rating"),
-            ),
-        )
+        ),
+        "allowNoCredit": None,
+        "allowCommercialUse": None,
+        "allowDerivatives": None,
+        "allowDifferentLicense": None,
+    },
+)
+
+# Version and file timestamps recur on every page listing the same model; remember
+# recent ones instead of decoding and allocating them again.
+_timestamp = timestamp_decoder(memo=4096)
+
+_VERSION_STATS: Schema[ModelVersionStats] = Schema(
+    ModelVersionStats, dict.fromkeys(("downloadCount", "ratingCount", "rating"))
+)
+
+_MODEL_VERSION: Schema[ModelVersion] = Schema(
+    ModelVersion,
+    {
+        "id": None,
+        "modelId": None,
+        "name": None,
+        "createdAt": Field(convert=_timestamp, optional=True),
+        "downloadUrl": None,
+        "trainedWords": None,
+        "baseModel": None,
+        "files": Field(
+            builder=lambda version, fields: _lazy(
+                parse_model_version_files, version.get("files"), fields
+            )
+        ),
+        "images": Field(
+            builder=lambda version, fields: _lazy(
+                parse_model_version_images, version.get("images"), fields
+            )
+        ),
+        "stats": Field(schema=_VERSION_STATS),
+    },
+)
+
+_FILE: Schema[ModelVersionFile] = Schema(
+    ModelVersionFile,
+    {
+        "name": None,
+        "id": None,
+        "sizeKb": Field(key="sizeKB"),
+        "type": None,
+        "format": None,
+        "pickleScanResult": None,
+        "pickleScanMessage": None,
+        "virusScanResult": None,
+        "scannedAt": Field(convert=_timestamp, optional=True),
+        "hashes": None,
+        "downloadUrl": None,
+        "primary": None,
+    },
+)
+
+_IMAGE: Schema[ModelVersionImage] = Schema(
+    ModelVersionImage,
+    dict.fromkeys(("url", "nsfw", "width", "height", "hash", "meta")),
+)
+
+
+def construct_model_params(kwargs: dict) -> dict[str, Any]:
+    """Map ``list_models`` keyword arguments onto the /models query parameters."""
+    params = {
+        "limit": kwargs.get("limit"),
+        "page": kwargs.get("page"),
+        "query": kwargs.get("query"),
+        "tag": kwargs.get("tag"),
+        "username": kwargs.get("username"),
+        "modelType": (
+            [t.value for t in kwargs.get("types", [])] if kwargs.get("types") else None
+        ),
+        "sortBy": kwargs.get("sort").value if kwargs.get("sort") else None,
+        "period": kwargs.get("period").value if kwargs.get("period") else None,
+        "rating": kwargs.get("rating"),
+        "favorites": kwargs.get("favorites"),
+        "hidden": kwargs.get("hidden"),
+        "primaryFileOnly": kwargs.get("primary_file_only"),
+        "allowNoCredit": kwargs.get("allow_no_credit"),
+        "allowDerivatives": kwargs.get("allow_derivatives"),
+        "allowDifferentLicenses": kwargs.get("allow_different_licenses"),
+        "baseModel": (
+            [m.value for m in kwargs.get("base_models", [])]
+            if kwargs.get("base_models")
+            else None
+        ),
+        "category": (
+            [c.value for c in kwargs.get("categories", [])]
+            if kwargs.get("categories")
+            else None
+        ),
+    }
+
+    # Handle allowCommercialUse as a list of values
+    if kwargs.get("allow_commercial_use"):
+        for i, use in enumerate(kwargs["allow_commercial_use"]):
+            params[f"allowCommercialUse[{i}]"] = use.value
+
+    return {k: v for k, v in params.items() if v is not None}
@@ -3,11 +3,13 @@
 Listing tags and parsing tag responses.
 """
 
+from collections.abc import Iterator
 from typing import Optional
 
 from ..client import CivitaiAPIClient
 from ..models.tag import Tag
-from ..utils import parse_response, safe_get
+from ..schema import Schema
+from ..utils import parse_response
 
 
 class TagsAPI(CivitaiAPIClient):
@@ -32,11 +34,35 @@ class TagsAPI(CivitaiAPIClient):
         )
         parsed_response = parse_response(response)
 
-        return [
-            Tag(
-                name=safe_get(item, "name"),
-                modelCount=safe_get(item, "modelCount"),
-                link=safe_get(item, "link"),
-            )
-            for item in parsed_response["items"]
-        ]
+        return [parse_tag(item) for item in parsed_response["items"]]
+
+    def iter_tags(
+        self,
+        limit: int | None = None,
+        page: int | None = None,
+        query: str | None = None,
+        max_items: int | None = None,
+    ) -> Iterator[Tag]:
+        """Iterate over tags one at a time across every page.
+
+        :param limit: The number of results to be fetched per page (1-200, default 20)
+        :param page: The page from which to start fetching tags
+        :param query: Search query to filter tags by name
+        :param max_items: Stop after this many tags (default: all of them)
+        :return: An iterator of Tag objects holding one page in memory at a time
+        """
+        params = {"limit": limit, "page": page, "query": query}
+        return self._paginate(
+            "tags",
+            {k: v for k, v in params.items() if v is not None},
+            parse_tag,
+            max_items,
+        )
+
+
+def parse_tag(item: dict) -> Tag:
+    """Build a Tag from a raw API item."""
+    return _TAG(item)
+
+
+_TAG: Schema[Tag] = Schema(Tag, {"name": None, "modelCount": None, "link": None})
@@ -0,0 +1,120 @@
+"""Concurrent bulk fetching for the single-entity getters.
+
+Work is fanned out to a bounded pool and results are streamed back in completion
+order. Only a small window of IDs is in flight at a time, so arbitrarily long (or
+lazy) iterables of IDs can be processed in constant memory. Each result carries either
+the fetched object or the exception raised for that ID; one failure does not stop the
+rest. Requests still go through the client's transport and so respect its rate limiter.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class BulkResult(Generic[T]):
+    """Outcome of fetching one ID in a bulk call.
+
+    Attributes:
+        id (Any): The requested ID.
+        value (T | None): The fetched object, if the request succeeded.
+        error (Exception | None): The exception raised for this ID, if it failed.
+
+    """
+
+    id: Any
+    value: T | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the fetch succeeded."""
+        return self.error is None
+
+
+def _fetch_one(fetch: Callable[[Any], T], item_id: Any) -> BulkResult[T]:
+    try:
+        return BulkResult(item_id, value=fetch(item_id))
+    except Exception as e:  # noqa: BLE001 - reported per item
+        return BulkResult(item_id, error=e)
+
+
+def bulk_fetch(
+    fetch: Callable[[Any], T], ids: Iterable[Any], max_workers: int = 8
+) -> Iterator[BulkResult[T]]:
+    """Call ``fetch`` for every ID on a thread pool, yielding results as they complete.
+
+    Args:
+        fetch (Callable[[Any], T]): Fetches one object by ID.
+        ids (Iterable[Any]): IDs to fetch; consumed lazily.
+        max_workers (int): Number of requests run concurrently.
+
+    Yields:
+        BulkResult[T]: One result per ID, in completion order.
+
+    """
+    ids = iter(ids)
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending: set[Future] = set()
+    try:
+        while True:
+            for item_id in ids:
+                pending.add(executor.submit(_fetch_one, fetch, item_id))
+                if len(pending) >= max_workers * 2:
+                    break
+            if not pending:
+                return
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def bulk_fetch_async(
+    fetch: Callable[[Any], Awaitable[T]], ids: Iterable[Any], max_concurrency: int = 8
+) -> AsyncIterator[BulkResult[T]]:
+    """Await ``fetch`` for every ID concurrently, yielding results as they complete.
+
+    Args:
+        fetch (Callable[[Any], Awaitable[T]]): Fetches one object by ID.
+        ids (Iterable[Any]): IDs to fetch; consumed lazily.
+        max_concurrency (int): Number of fetches awaited concurrently.
+
+    Yields:
+        BulkResult[T]: One result per ID, in completion order.
+
+    """
+
+    async def fetch_one(item_id: Any) -> BulkResult[T]:
+        try:
+            return BulkResult(item_id, value=await fetch(item_id))
+        except Exception as e:  # noqa: BLE001 - reported per item
+            return BulkResult(item_id, error=e)
+
+    ids = iter(ids)
+    pending: set[asyncio.Task] = set()
+    try:
+        while True:
+            for item_id in ids:
+                pending.add(asyncio.ensure_future(fetch_one(item_id)))
+                if len(pending) >= max_concurrency:
+                    break
+            if not pending:
+                return
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+__all__ = ["BulkResult", "bulk_fetch", "bulk_fetch_async"]
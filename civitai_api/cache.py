@@ -0,0 +1,228 @@
+"""Caches used by the Civitai API client.
+
+HTTPCache keeps the validators (``ETag`` / ``Last-Modified``) and decoded body of GET
+responses so that repeat requests can be made conditional. When the server answers
+``304 Not Modified`` the cached body is served as is, with no JSON decoding, and the
+object parsed from it the first time is reused as well.
+
+ObjectCache keeps parsed Model / ModelVersion objects returned by the single-entity
+getters, so hot IDs are answered without any request at all until they expire.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class CacheEntry:
+    """A cached GET response.
+
+    Attributes:
+        data (Any): The decoded JSON body.
+        etag (str | None): The ``ETag`` the server sent with it.
+        last_modified (str | None): The ``Last-Modified`` the server sent with it.
+        parsed (dict[Callable, Any]): Objects already parsed from ``data``, by parse function.
+
+    """
+
+    data: Any
+    etag: str | None = None
+    last_modified: str | None = None
+    parsed: dict[Callable, Any] = field(default_factory=dict)
+
+    def validators(self) -> dict[str, str]:
+        """Return the conditional request headers for revalidating this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HTTPCache:
+    """Thread-safe, bounded LRU cache of GET responses revalidated with conditional requests.
+
+    Attributes:
+        max_entries (int): Maximum number of responses kept.
+        revalidations (int): Number of requests answered with 304 Not Modified.
+
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        """Create an empty cache holding at most ``max_entries`` responses."""
+        self.max_entries = max_entries
+        self.revalidations = 0
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._by_data: dict[int, CacheEntry] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(url: str, params: str | None = None) -> str:
+        """Return the cache key of a request."""
+        return f"{url}?{params}" if params else url
+
+    def lookup(self, key: str) -> CacheEntry | None:
+        """Return the entry stored under ``key``, marking it recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def not_modified(self, entry: CacheEntry) -> Any:
+        """Record a 304 answer for ``entry`` and return its cached body."""
+        with self._lock:
+            self.revalidations += 1
+        return entry.data
+
+    def store(self, key: str, headers: Mapping[str, str], data: Any) -> None:
+        """Cache ``data`` under ``key`` if the response carried validators.
+
+        Responses without ``ETag`` or ``Last-Modified`` cannot be revalidated, so they
+        drop any previous entry instead.
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        with self._lock:
+            self._remove(key)
+            if not etag and not last_modified:
+                return
+            entry = CacheEntry(data, etag, last_modified)
+            self._entries[key] = entry
+            self._by_data[id(data)] = entry
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def parsed(self, data: Any, parse: Callable[[Any], T]) -> T:
+        """Return ``parse(data)``, reusing the earlier result if ``data`` is a cached body.
+
+        A 304 answer returns the very same body object, so an object parsed from it
+        before is still current.
+        """
+        with self._lock:
+            entry = self._by_data.get(id(data))
+        if entry is None or entry.data is not data:
+            return parse(data)
+        if parse not in entry.parsed:
+            entry.parsed[parse] = parse(data)
+        return entry.parsed[parse]
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._entries.clear()
+            self._by_data.clear()
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._by_data.pop(id(entry.data), None)
+
+
+class ObjectCache:
+    """Thread-safe LRU cache with time to live for parsed objects, keyed by endpoint path.
+
+    Keys are endpoint paths without a leading slash, e.g. ``models/1102`` or
+    ``model-versions/by-hash/ABCDEF``.
+
+    Attributes:
+        max_entries (int): Maximum number of objects kept.
+        ttl (float | None): Seconds an object stays valid. None keeps objects until evicted.
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups not found or expired.
+
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: float | None = 300,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create an empty cache.
+
+        Args:
+            max_entries (int): Maximum number of objects kept.
+            ttl (float | None): Seconds an object stays valid. None keeps objects until evicted.
+            clock (Callable[[], float]): Monotonic clock, overridable in tests.
+
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float | None, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(endpoint: str) -> str:
+        """Return the cache key of an endpoint path."""
+        return endpoint.lstrip("/")
+
+    def get(self, endpoint: str) -> Any | None:
+        """Return the object cached for ``endpoint``, or None if absent or expired."""
+        key = self.key(endpoint)
+        with self._lock:
+            item = self._entries.get(key)
+            if item is not None:
+                expires, value = item
+                if expires is None or expires > self._clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, endpoint: str, value: Any) -> None:
+        """Cache ``value`` for ``endpoint``, evicting the least recently used object if full."""
+        expires = self._clock() + self.ttl if self.ttl is not None else None
+        key = self.key(endpoint)
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, endpoint: str) -> bool:
+        """Drop the object cached for ``endpoint``.
+
+        Returns:
+            bool: True if an object was cached.
+
+        """
+        with self._lock:
+            return self._entries.pop(self.key(endpoint), None) is not None
+
+    def invalidate_prefix(self, prefix: str) -> int:
+        """Drop every object whose endpoint starts with ``prefix``, e.g. ``models/``.
+
+        Returns:
+            int: Number of objects dropped.
+
+        """
+        prefix = self.key(prefix)
+        with self._lock:
+            doomed = [key for key in self._entries if key.startswith(prefix)]
+            for key in doomed:
+                del self._entries[key]
+            return len(doomed)
+
+    def clear(self) -> None:
+        """Drop every cached object."""
+        with self._lock:
+            self._entries.clear()
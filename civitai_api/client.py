@@ -1,10 +1,22 @@
+import time
 import urllib.parse
 from abc import abstractmethod
-from typing import TYPE_CHECKING, Any, Optional, Union
+from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING, Any, Optional, TypeVar, Union
 
 import requests
 
+from .cache import HTTPCache, ObjectCache
 from .exceptions import CivitaiAPIError, RateLimitError
+from .json_decoder import decode_response
+from .projection import fields_key, projected
+from .ratelimit import parse_retry_after
+from .retry import RetryEvent
+from .streaming import ItemSplitter
+from .transport import Transport
+from .utils import next_page
+
+T = TypeVar("T")
 
 if TYPE_CHECKING:
     from civitai_api.models import (
@@ -26,18 +38,21 @@ class CivitaiAPIClient:
     """
 
     BASE_URL = "https://civitai.com/api/v1"
+    STREAM_CHUNK_SIZE = 64 * 1024
 
-    def __init__(self, api_key: str | None = None) -> None:
+    def __init__(
+        self, api_key: str | None = None, transport: Transport | None = None
+    ) -> None:
         """Initialize the CivitaiAPIClient with an optional API key.
 
         Args:
             api_key (str | None): The API key for authentication. If provided, requests will include the Authorization header.
+            transport (Transport | None): Shared transport to send requests through. A private one is created when omitted.
 
         """
         self.api_key = api_key
-        self.session = requests.Session()
-        if api_key:
-            self.session.headers.update({"Authorization": f"Bearer {api_key}"})
+        self.transport = transport if transport is not None else Transport(api_key)
+        self.session = self.transport.session
 
     def get(
         self,
@@ -64,7 +79,12 @@ class CivitaiAPIClient:
             url = f"{self.BASE_URL}/{endpoint_or_url.lstrip('/')}"
 
         params = self._url_encode_query(params) if params else None
-        return self._request("GET", url, params=params)
+        flight = self.transport.single_flight
+        if flight is None:
+            return self._request("GET", url, params=params)
+        return flight.do(
+            HTTPCache.key(url, params), lambda: self._request("GET", url, params=params)
+        )
 
     def _request(
         self,
@@ -73,20 +93,248 @@ class CivitaiAPIClient:
         params: dict[str, Any] | None = None,
         data: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        """Send specified HTTP request and return decoded JSON response."""
+        """Send specified HTTP request and return decoded JSON response.
+
+        GET requests are answered from the transport's disk cache while fresh, and
+        otherwise made conditional when the HTTP cache holds validators for the URL;
+        a 304 answer returns the cached body without decoding. A cached body that no
+        longer decodes is dropped and fetched again.
+        """
+        key = HTTPCache.key(url, params) if method == "GET" else None
+        disk = self.transport.disk_cache if key is not None else None
+        if disk is not None:
+            body = disk.get(key)
+            if body is not None:
+                try:
+                    return self.transport.json_loads(body)
+                except ValueError:
+                    disk.delete(key)
+        cache = self.transport.http_cache if key is not None else None
+        entry = cache.lookup(key) if cache is not None else None
+        headers = entry.validators() if entry is not None else None
         try:
-            response = self.session.request(method, url, params=params, json=data)
+            response = self._send(
+                method,
+                url,
+                lambda: self.session.request(
+                    method, url, params=params, json=data, headers=headers
+                ),
+            )
+            if entry is not None and response.status_code == 304:
+                return cache.not_modified(entry)
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.HTTPError as e:
+            payload = decode_response(response, self.transport.json_loads)
+            if cache is not None:
+                cache.store(key, response.headers, payload)
+            if disk is not None:
+                disk.set(key, response.content)
+            return payload
+        except (requests.exceptions.RequestException, ValueError) as e:
+            raise self._api_error(e) from e
+
+    @staticmethod
+    def _api_error(e: Exception) -> CivitaiAPIError:
+        """Return the error to raise for a failed request or an undecodable body.
+
+        Args:
+            e (Exception): A requests exception, or the ValueError (or TypeError) of a body that is not the expected JSON.
+
+        Returns:
+            CivitaiAPIError: A RateLimitError for a 429 answer, a CivitaiAPIError otherwise.
+
+        """
+        if isinstance(e, requests.exceptions.HTTPError):
             if e.response.status_code == 429:
                 msg = "Rate limit exceeded"
-                raise RateLimitError(msg) from e
+                return RateLimitError(
+                    msg, retry_after=parse_retry_after(e.response.headers)
+                )
             msg = f"HTTP error occurred: {e}"
-            raise CivitaiAPIError(msg) from e
-        except requests.exceptions.RequestException as e:
+            return CivitaiAPIError(msg, status_code=e.response.status_code)
+        if isinstance(e, requests.exceptions.RequestException):
             msg = f"An error occurred: {e}"
-            raise CivitaiAPIError(msg) from e
+            return CivitaiAPIError(msg)
+        msg = f"Invalid JSON response: {e}"
+        return CivitaiAPIError(msg)
+
+    def _get_parsed(
+        self,
+        endpoint: str,
+        parse: Callable[..., T],
+        fields: list[str] | None = None,
+    ) -> T:
+        """GET ``endpoint`` and parse the response.
+
+        Objects still held by the transport's object cache are returned without a
+        request, and concurrent calls for the same endpoint share one request and one
+        parsed object. When the HTTP cache answers from a 304, the object parsed from
+        the cached body earlier is returned instead of being built again. Projected
+        objects (see ``projection``) are cached apart from full ones.
+        """
+        key = endpoint if fields is None else f"{endpoint}?fields={fields_key(fields)}"
+        parse = projected(parse, fields)
+        objects = self.transport.object_cache
+        if objects is not None:
+            cached = objects.get(key)
+            if cached is not None:
+                return cached
+        flight = self.transport.single_flight
+        if flight is None:
+            return self._fetch_parsed(endpoint, parse, key)
+        return flight.do(
+            ("parsed", ObjectCache.key(key)),
+            lambda: self._fetch_parsed(endpoint, parse, key),
+        )
+
+    def _fetch_parsed(
+        self, endpoint: str, parse: Callable[[dict[str, Any]], T], key: str
+    ) -> T:
+        objects = self.transport.object_cache
+        response = self.get(endpoint)
+        cache = self.transport.http_cache
+        result = parse(response) if cache is None else cache.parsed(response, parse)
+        if objects is not None:
+            objects.put(key, result)
+        return result
+
+    def _stream_items(
+        self,
+        endpoint_or_url: str,
+        params: dict[str, Any] | None,
+        rest: dict[str, Any],
+    ) -> Iterator[Any]:
+        """GET a list page and yield its raw items as they arrive (see ``streaming``).
+
+        Only the item being received is buffered. The other fields of the page
+        (``metadata``) are added to ``rest`` once the body has been read. Streamed
+        pages bypass the transport's caches and single flight.
+
+        Raises:
+            CivitaiAPIError: If an HTTP or request error occurs or the body is not a valid JSON object.
+            RateLimitError: If the API rate limit is exceeded.
+
+        """
+        if endpoint_or_url.startswith("http"):
+            url = endpoint_or_url
+        else:
+            url = f"{self.BASE_URL}/{endpoint_or_url.lstrip('/')}"
+        query = self._url_encode_query(params) if params else None
+        loads = self.transport.json_loads
+        splitter = ItemSplitter()
+        try:
+            response = self._send(
+                "GET",
+                url,
+                lambda: self.session.request("GET", url, params=query, stream=True),
+            )
+            with response:
+                response.raise_for_status()
+                for chunk in response.iter_content(self.STREAM_CHUNK_SIZE):
+                    for raw in splitter.feed(chunk):
+                        yield loads(raw)
+            rest.update(splitter.close(loads))
+        except (requests.exceptions.RequestException, ValueError, TypeError) as e:
+            raise self._api_error(e) from e
+
+    def _paginate(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        parse: Callable[[dict[str, Any]], T],
+        max_items: int | None = None,
+        stream: bool = False,
+    ) -> Iterator[T]:
+        """Yield parsed items from every page of a list endpoint, one page in memory at a time.
+
+        Args:
+            endpoint (str): The list endpoint, e.g. ``images``.
+            params (dict[str, Any]): Query parameters of the first page.
+            parse (Callable[[dict[str, Any]], T]): Builds an object from a raw item.
+            max_items (int | None): Stop after this many items. None follows every page.
+            stream (bool): Parse each page item by item as it downloads instead of decoding it whole (see ``_stream_items``).
+
+        Yields:
+            T: The parsed items, in order.
+
+        """
+        if max_items is not None and max_items <= 0:
+            return
+        request: tuple[str, dict[str, Any] | None] | None = (endpoint, params)
+        count = 0
+        while request is not None:
+            url, query = request
+            if stream:
+                data: dict[str, Any] = {}
+                items = self._stream_items(url, query, data)
+            else:
+                data = self.get(url, params=query)
+                items = data.get("items") or []
+            seen = count
+            for item in items:
+                yield parse(item)
+                count += 1
+                if max_items is not None and count >= max_items:
+                    return
+            # An empty page ends the listing, whatever its metadata says.
+            following = (
+                next_page(data.get("metadata") or {}, url, query)
+                if count > seen
+                else None
+            )
+            # Drop the page before fetching the next one.
+            del data, items
+            request = None if following == request else following
+
+    def _send(
+        self, method: str, url: str, send: Callable[[], requests.Response]
+    ) -> requests.Response:
+        """Call ``send`` through the transport's rate limiter and retry policy.
+
+        Retryable failures are re-sent after a jittered backoff while the policy and
+        its budget allow. The last response is returned (or the last exception raised)
+        once they do not; a 429 answer also pauses the shared rate limiter.
+        """
+        limiter = self.transport.rate_limiter
+        policy = self.transport.retry_policy
+        attempt, delay = 1, None
+        while True:
+            if limiter is not None:
+                limiter.acquire()
+            policy.record_request()
+            try:
+                response = send()
+            except Exception as e:
+                if not policy.should_retry(method, attempt, exception=e):
+                    raise
+                status_code, exception, retry_after = None, e, None
+            else:
+                if limiter is not None:
+                    limiter.observe(response.status_code, response.headers)
+                if not policy.should_retry(
+                    method, attempt, status_code=response.status_code
+                ):
+                    return response
+                response.close()
+                status_code, exception = response.status_code, None
+                # With a limiter, Retry-After is already enforced on every caller.
+                retry_after = (
+                    parse_retry_after(response.headers) if limiter is None else None
+                )
+
+            delay = policy.backoff(delay)
+            wait = max(delay, retry_after or 0)
+            policy.notify(
+                RetryEvent(
+                    method=method,
+                    url=url,
+                    attempt=attempt,
+                    delay=wait,
+                    status_code=status_code,
+                    exception=exception,
+                )
+            )
+            time.sleep(wait)
+            attempt += 1
 
     def post(self, endpoint: str, data: dict[str, Any]) -> dict[str, Any]:
         """Send a POST request to the specified endpoint with the provided data.
@@ -0,0 +1,294 @@
+"""Columnar batches of models and images for vectorized filtering and ranking.
+
+A ColumnBatch keeps the numeric and boolean fields of a list of rows (e.g.
+``stats.downloadCount``, ``width``, ``nsfw``) as contiguous arrays: NumPy arrays when
+NumPy is installed, ``array.array`` otherwise. Filtering, sorting and top-k work on
+those arrays and only reorder row indices. The rows themselves are kept as they came,
+usually raw JSON items, and are parsed into the regular dataclasses only when they
+are read, so ranking a million images builds a dataclass for just the few that make
+the cut.
+
+Timestamp columns hold epoch milliseconds (see ``timestamps.epoch_ms``), so they filter
+and sort as plain integers. Missing values are stored as 0 in integer and timestamp
+columns, NaN in float columns and False in boolean columns. NaN sorts last in both
+directions.
+"""
+
+import array
+import heapq
+import math
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import Any, Generic, TypeVar
+
+from .timestamps import timestamp_decoder
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when numpy is absent
+    np = None
+
+T = TypeVar("T")
+
+INT = "int"
+FLOAT = "float"
+BOOL = "bool"
+TIMESTAMP = "timestamp"
+
+# Column name -> (dotted path in the raw item or object, kind).
+ColumnSpec = dict[str, tuple[str, str]]
+
+MODEL_COLUMNS: ColumnSpec = {
+    "id": ("id", INT),
+    "nsfw": ("nsfw", BOOL),
+    "downloadCount": ("stats.downloadCount", INT),
+    "favoriteCount": ("stats.favoriteCount", INT),
+    "commentCount": ("stats.commentCount", INT),
+    "ratingCount": ("stats.ratingCount", INT),
+    "rating": ("stats.rating", FLOAT),
+}
+
+IMAGE_COLUMNS: ColumnSpec = {
+    "id": ("id", INT),
+    "width": ("width", INT),
+    "height": ("height", INT),
+    "nsfw": ("nsfw", BOOL),
+    "postId": ("postId", INT),
+    "createdAt": ("createdAt", TIMESTAMP),
+    "cryCount": ("stats.cryCount", INT),
+    "laughCount": ("stats.laughCount", INT),
+    "likeCount": ("stats.likeCount", INT),
+    "heartCount": ("stats.heartCount", INT),
+    "commentCount": ("stats.commentCount", INT),
+}
+
+_TYPECODES = {INT: "q", FLOAT: "d", BOOL: "b", TIMESTAMP: "q"}
+_MISSING = {INT: 0, FLOAT: math.nan, BOOL: False, TIMESTAMP: 0}
+_CONVERT = {INT: int, FLOAT: float, BOOL: bool}
+
+# Distinct timestamps remembered while building one column.
+TIMESTAMP_MEMO = 4096
+
+
+def _path_value(row: Any, parts: list[str]) -> Any:
+    for part in parts:
+        if row is None:
+            return None
+        row = row.get(part) if type(row) is dict else getattr(row, part, None)
+    return row
+
+
+def _build_column(rows: Sequence, path: str, kind: str) -> Any:
+    parts = path.split(".")
+    missing = _MISSING[kind]
+    if kind == TIMESTAMP:
+        # The images of a post share their timestamp: decode each one once per column.
+        convert = timestamp_decoder(memo=TIMESTAMP_MEMO, epoch=True)
+    else:
+        convert = _CONVERT[kind]
+    values = [
+        missing if (value := _path_value(row, parts)) is None else convert(value)
+        for row in rows
+    ]
+    if np is not None:
+        # "q" and "d" are int64 and float64 for NumPy too.
+        return np.array(values, dtype=bool if kind == BOOL else _TYPECODES[kind])
+    return array.array(_TYPECODES[kind], values)
+
+
+class ColumnBatch(Generic[T]):
+    """Rows with their numeric and boolean fields stored column by column.
+
+    Attributes:
+        spec (ColumnSpec): The columns and where their values come from.
+        rows (list): The rows, raw JSON items or objects.
+
+    """
+
+    def __init__(
+        self,
+        rows: list,
+        columns: dict[str, Any],
+        spec: ColumnSpec,
+        parse: Callable[[Any], T] | None = None,
+    ) -> None:
+        """Wrap rows and their already built columns. Use ``from_rows`` to build them.
+
+        Args:
+            rows (list): The rows, raw JSON items or objects.
+            columns (dict[str, Any]): One array per column, in row order.
+            spec (ColumnSpec): The columns and where their values come from.
+            parse (Callable[[Any], T] | None): Turns a row into an object. None returns rows as they are.
+
+        """
+        self.rows = rows
+        self.spec = spec
+        self._columns = columns
+        self._parse = parse
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable,
+        spec: ColumnSpec,
+        parse: Callable[[Any], T] | None = None,
+    ) -> "ColumnBatch[T]":
+        """Build the columns of ``spec`` from raw JSON items or from objects.
+
+        Args:
+            rows (Iterable): Raw JSON items or objects such as Model or Image.
+            spec (ColumnSpec): The columns to build, e.g. MODEL_COLUMNS or IMAGE_COLUMNS.
+            parse (Callable[[Any], T] | None): Turns a row into an object, e.g. ``parse_image`` for raw items.
+
+        Returns:
+            ColumnBatch[T]: The batch.
+
+        """
+        rows = list(rows)
+        columns = {
+            name: _build_column(rows, path, kind) for name, (path, kind) in spec.items()
+        }
+        return cls(rows, columns, spec, parse)
+
+    @classmethod
+    def concat(cls, batches: Iterable["ColumnBatch[T]"]) -> "ColumnBatch[T]":
+        """Join batches with the same columns, e.g. the pages of a listing, into one.
+
+        Args:
+            batches (Iterable[ColumnBatch[T]]): The batches, in order. There must be at least one.
+
+        Returns:
+            ColumnBatch[T]: The joined batch.
+
+        Raises:
+            ValueError: If there are no batches or their columns differ.
+
+        """
+        batches = list(batches)
+        if not batches:
+            msg = "concat needs at least one batch"
+            raise ValueError(msg)
+        first = batches[0]
+        if any(batch.spec != first.spec for batch in batches):
+            msg = "Cannot concatenate batches with different columns"
+            raise ValueError(msg)
+        rows = [row for batch in batches for row in batch.rows]
+        columns = {}
+        for name in first.spec:
+            parts = [batch[name] for batch in batches]
+            if np is not None:
+                columns[name] = np.concatenate(parts)
+            else:
+                columns[name] = array.array(parts[0].typecode)
+                for part in parts:
+                    columns[name].extend(part)
+        return cls(rows, columns, first.spec, first._parse)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, column: str) -> Any:
+        """Return a column as a NumPy array, or an ``array.array`` without NumPy."""
+        return self._columns[column]
+
+    def __iter__(self) -> Iterator[T]:
+        for i in range(len(self.rows)):
+            yield self.item(i)
+
+    def __repr__(self) -> str:
+        return f"ColumnBatch({len(self)} rows, columns={list(self.spec)})"
+
+    def item(self, index: int) -> T:
+        """Return the row at ``index`` as an object, parsing it if needed."""
+        row = self.rows[index]
+        return self._parse(row) if self._parse is not None else row
+
+    def to_list(self) -> list[T]:
+        """Return every row as an object, in order."""
+        return list(self)
+
+    def take(self, indices: Iterable[int]) -> "ColumnBatch[T]":
+        """Return a batch of the rows at ``indices``, in that order."""
+        if np is not None:
+            indices = np.asarray(indices, dtype=np.intp)
+            columns = {name: column[indices] for name, column in self._columns.items()}
+        else:
+            indices = list(indices)
+            columns = {
+                name: array.array(column.typecode, [column[i] for i in indices])
+                for name, column in self._columns.items()
+            }
+        rows = self.rows
+        return ColumnBatch([rows[i] for i in indices], columns, self.spec, self._parse)
+
+    def filter(self, mask: Iterable[bool]) -> "ColumnBatch[T]":
+        """Return a batch of the rows where ``mask`` is true.
+
+        With NumPy, masks come straight from the columns, e.g.
+        ``batch.filter((batch["likeCount"] > 100) & ~batch["nsfw"])``.
+
+        Args:
+            mask (Iterable[bool]): One truth value per row.
+
+        Returns:
+            ColumnBatch[T]: The matching rows, in their original order.
+
+        """
+        if np is not None:
+            return self.take(np.flatnonzero(np.asarray(mask, dtype=bool)))
+        return self.take(i for i, keep in enumerate(mask) if keep)
+
+    def sort(self, column: str, descending: bool = False) -> "ColumnBatch[T]":
+        """Return the rows ordered by ``column``. The sort is stable.
+
+        Args:
+            column (str): The column to sort by.
+            descending (bool): Largest values first.
+
+        Returns:
+            ColumnBatch[T]: The sorted rows.
+
+        """
+        if np is not None:
+            return self.take(
+                np.argsort(self._sort_key(column, descending), kind="stable")
+            )
+        return self.take(
+            sorted(range(len(self)), key=self._sort_key(column, descending))
+        )
+
+    def top(self, column: str, k: int) -> "ColumnBatch[T]":
+        """Return the ``k`` rows with the largest values of ``column``, largest first.
+
+        This is faster than a full sort when ``k`` is small.
+
+        Args:
+            column (str): The column to rank by.
+            k (int): Number of rows to keep.
+
+        Returns:
+            ColumnBatch[T]: The top rows, in descending order.
+
+        """
+        k = max(0, min(k, len(self)))
+        if np is not None:
+            if k == 0:
+                return self.take([])
+            key = self._sort_key(column, descending=True)
+            best = np.argpartition(key, k - 1)[:k]
+            return self.take(best[np.argsort(key[best], kind="stable")])
+        return self.take(
+            heapq.nsmallest(k, range(len(self)), key=self._sort_key(column, True))
+        )
+
+    def _sort_key(self, column: str, descending: bool) -> Any:
+        values = self._columns[column]
+        kind = self.spec[column][1]
+        if np is not None:
+            # Ascending order of the key is the requested order, NaN last.
+            if kind == BOOL:
+                values = values.astype(np.int8)
+            return -values if descending else values
+        sign = -1 if descending else 1
+        if kind == FLOAT:
+            return lambda i: (math.isnan(values[i]), sign * values[i])
+        return lambda i: sign * values[i]
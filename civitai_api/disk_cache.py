@@ -0,0 +1,180 @@
+"""Persistent on-disk cache of API responses backed by a single SQLite file.
+
+Bodies are stored zlib-compressed with a per-endpoint time to live. When the file
+grows past its size limit, expired entries and then the least recently used ones are
+evicted. The database runs in WAL mode with a busy timeout, and every thread (and
+process) opens its own connection, so several workers can share one cache file.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from urllib.parse import urlparse
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);
+CREATE INDEX IF NOT EXISTS responses_expires ON responses (expires);
+"""
+
+
+class DiskCache:
+    """SQLite-backed response cache with per-endpoint TTLs and size-based eviction.
+
+    Attributes:
+        path (str): Location of the SQLite file.
+        ttls (dict[str, float]): Time to live in seconds by endpoint prefix, e.g. ``{"model-versions/by-hash": 86400}``.
+        default_ttl (float | None): Time to live for endpoints without an entry in ``ttls``. None leaves them uncached.
+        max_bytes (int): Size of stored bodies above which entries are evicted.
+        hits (int): Lookups served from disk by this instance.
+        misses (int): Lookups not found, or found expired, by this instance.
+
+    """
+
+    EVICTION_INTERVAL = 64
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        ttls: dict[str, float] | None = None,
+        default_ttl: float | None = 3600,
+        max_bytes: int = 512 * 1024 * 1024,
+        compression_level: int = 6,
+    ) -> None:
+        """Open (creating if needed) the cache file.
+
+        Args:
+            path (str | os.PathLike): Location of the SQLite file.
+            ttls (dict[str, float] | None): Time to live in seconds by endpoint prefix.
+            default_ttl (float | None): Time to live for other endpoints. None leaves them uncached.
+            max_bytes (int): Size of stored bodies above which entries are evicted.
+            compression_level (int): zlib compression level for stored bodies.
+
+        """
+        self.path = os.fspath(path)
+        self.ttls = dict(ttls or {})
+        self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
+        self.compression_level = compression_level
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+        self._writes = 0
+        self._connection().executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def ttl_for(self, url: str) -> float | None:
+        """Return the time to live for a request URL, matched on the longest endpoint prefix."""
+        path = urlparse(url).path
+        endpoint = path.split("/api/v1/", 1)[-1].lstrip("/")
+        best = None
+        for prefix in self.ttls:
+            if endpoint.startswith(prefix.strip("/")) and (
+                best is None or len(prefix) > len(best)
+            ):
+                best = prefix
+        return self.ttls[best] if best is not None else self.default_ttl
+
+    def get(self, key: str) -> bytes | None:
+        """Return the stored body for ``key`` if it has not expired."""
+        now = time.time()
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT body FROM responses WHERE key = ? AND expires > ?", (key, now)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        conn.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        self.hits += 1
+        return zlib.decompress(row[0])
+
+    def set(self, key: str, body: bytes, ttl: float | None = None) -> None:
+        """Store ``body`` under ``key`` for ``ttl`` seconds (the URL's TTL when omitted)."""
+        ttl = self.ttl_for(key) if ttl is None else ttl
+        if not ttl:
+            return
+        now = time.time()
+        blob = zlib.compress(body, self.compression_level)
+        self._connection().execute(
+            "INSERT OR REPLACE INTO responses (key, body, size, expires, accessed) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (key, blob, len(blob), now + ttl, now),
+        )
+        self._writes += 1
+        if self._writes % self.EVICTION_INTERVAL == 0:
+            self.evict()
+
+    def delete(self, key: str) -> None:
+        """Remove the entry stored under ``key``."""
+        self._connection().execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def evict(self) -> int:
+        """Drop expired entries, then least recently used ones until under ``max_bytes``.
+
+        Returns:
+            int: Number of entries removed.
+
+        """
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            removed = conn.execute(
+                "DELETE FROM responses WHERE expires <= ?", (time.time(),)
+            ).rowcount
+            total = conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()[0]
+            if total > self.max_bytes:
+                rows = conn.execute(
+                    "SELECT key, size FROM responses ORDER BY accessed"
+                ).fetchall()
+                doomed = []
+                for key, size in rows:
+                    if total <= self.max_bytes:
+                        break
+                    doomed.append((key,))
+                    total -= size
+                conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+                removed += len(doomed)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return removed
+
+    def size(self) -> int:
+        """Return the total size in bytes of the stored (compressed) bodies."""
+        return (
+            self._connection()
+            .execute("SELECT COALESCE(SUM(size), 0) FROM responses")
+            .fetchone()[0]
+        )
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._connection().execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close this thread's connection to the cache file."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
@@ -0,0 +1,383 @@
+"""Streaming downloads of model files.
+
+Files are streamed to ``<dest>.part`` in fixed-size chunks and renamed into place once
+complete, so memory use does not depend on file size. When the server supports HTTP
+Range requests, large files are split into byte-range segments that download in
+parallel. Progress is recorded in ``<dest>.part.json``, so an interrupted download,
+whether from a dropped connection or a killed process, resumes where it stopped.
+
+The SHA256 from ``ModelVersionFile.hashes`` is computed while the bytes arrive, in file
+order. Only bytes that a later segment wrote ahead of the hash are read back, once,
+while they are still in the page cache.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import requests
+
+from .client import CivitaiAPIClient
+from .exceptions import CivitaiAPIError, DownloadError
+from .models.model_version import ModelVersionFile
+from .ratelimit import RateLimiter
+from .retry import RetryEvent
+
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-(\d+)/(\d+)")
+
+
+@dataclass
+class _Segment:
+    start: int
+    end: int  # Exclusive.
+    pos: int
+
+
+class _OrderedHasher:
+    """SHA256 of a file whose segments are written concurrently, fed in file order."""
+
+    def __init__(self, path: Path, segments: list[_Segment], chunk_size: int) -> None:
+        self.sha = hashlib.sha256()
+        self.cursor = 0
+        self._path = path
+        self._segments = sorted(segments, key=lambda s: s.start)
+        self._chunk_size = chunk_size
+        self._lock = threading.Lock()
+        self._reading = False
+
+    def update(self, offset: int, data: bytes) -> None:
+        """Feed bytes just written at ``offset``, if they are next in file order."""
+        with self._lock:
+            if offset == self.cursor and not self._reading:
+                self.sha.update(data)
+                self.cursor += len(data)
+        self._catch_up()
+
+    def hexdigest(self) -> str:
+        """Return the digest once every segment is complete."""
+        self._catch_up()
+        with self._lock:
+            return self.sha.hexdigest()
+
+    def _catch_up(self) -> None:
+        # Read back what the segment at the cursor wrote ahead of it. The lock is only
+        # held to claim a span and to publish the new cursor, so segment writers keep
+        # going during the read; while a span is claimed, only its reader feeds sha.
+        while True:
+            with self._lock:
+                end = None if self._reading else self._written_ahead()
+                if end is None:
+                    return
+                self._reading = True
+                cursor = self.cursor
+            try:
+                with open(self._path, "rb") as f:
+                    f.seek(cursor)
+                    while cursor < end:
+                        data = f.read(min(self._chunk_size, end - cursor))
+                        self.sha.update(data)
+                        cursor += len(data)
+            finally:
+                with self._lock:
+                    self.cursor = cursor
+                    self._reading = False
+
+    def _written_ahead(self) -> int | None:
+        # End of the bytes already on disk past the cursor, if there are any.
+        for segment in self._segments:
+            if segment.start <= self.cursor < segment.end:
+                return segment.pos if segment.pos > self.cursor else None
+        return None
+
+
+class Downloader(CivitaiAPIClient):
+    """Downloads model files with resume, parallel segments and SHA256 verification.
+
+    Requests go through the client's transport, so they share its connection pool,
+    credentials, rate limiter and retry policy.
+    """
+
+    STATE_INTERVAL = 16
+
+    def __init__(
+        self,
+        *args,
+        chunk_size: int = 1024 * 1024,
+        segments: int = 4,
+        min_segment_size: int = 32 * 1024 * 1024,
+        timeout: float = 60.0,
+        bandwidth: RateLimiter | None = None,
+        **kwargs,
+    ) -> None:
+        """Initialize the downloader.
+
+        Args:
+            *args: Passed to CivitaiAPIClient.
+            chunk_size (int): Bytes read from the network and written to disk at a time.
+            segments (int): Maximum number of byte ranges downloaded in parallel per file.
+            min_segment_size (int): Smallest range worth its own connection.
+            timeout (float): Seconds to wait for the server to send data.
+            bandwidth (RateLimiter | None): Bytes-per-second budget shared by every download of this downloader. None leaves downloads unthrottled.
+            **kwargs: Passed to CivitaiAPIClient.
+
+        """
+        super().__init__(*args, **kwargs)
+        self.chunk_size = chunk_size
+        self.segments = segments
+        self.min_segment_size = min_segment_size
+        self.timeout = timeout
+        self.bandwidth = bandwidth
+
+    def download(
+        self,
+        source: ModelVersionFile | str,
+        dest: str | os.PathLike,
+        sha256: str | None = None,
+        progress: Callable[[int, int | None], None] | None = None,
+    ) -> Path:
+        """Download a file, resuming an earlier partial download of it if there is one.
+
+        Args:
+            source (ModelVersionFile | str): The file to download, or its download URL.
+            dest (str | os.PathLike): Where to save it. For a ModelVersionFile, an existing directory is completed with the file's name.
+            sha256 (str | None): Expected SHA256 digest. Defaults to the ModelVersionFile's; None skips verification.
+            progress (Callable[[int, int | None], None] | None): Called with bytes done and total bytes (None if unknown) as chunks arrive.
+
+        Returns:
+            Path: The path of the complete file.
+
+        Raises:
+            DownloadError: If the file fails verification or the server misbehaves.
+            CivitaiAPIError: If a request fails.
+
+        """
+        dest = Path(dest)
+        if isinstance(source, ModelVersionFile):
+            url = source.downloadUrl
+            sha256 = sha256 or (source.hashes or {}).get("SHA256")
+            if dest.is_dir():
+                dest = dest / source.name
+        else:
+            url = source
+        part = dest.with_name(dest.name + ".part")
+        state = dest.with_name(dest.name + ".part.json")
+
+        probe = self._get(url, {"Range": "bytes=0-0"})
+        with probe:
+            match = _CONTENT_RANGE.fullmatch(probe.headers.get("Content-Range", ""))
+            if probe.status_code != 206 or match is None:
+                # No usable range support: nothing can be resumed or split.
+                if probe.status_code == 206:
+                    probe.close()
+                    probe = self._get(url, {})
+                with probe:
+                    total = probe.headers.get("Content-Length")
+                    total = int(total) if total is not None else None
+                    digest = self._stream_whole(probe, part, sha256, total, progress)
+                return self._finish(part, state, dest, sha256, digest)
+            total = int(match[3])
+            # Skip redirects (e.g. to signed storage URLs) from here on.
+            url = probe.url
+
+        segments = self._load_state(state, part, total)
+        if segments is None:
+            with open(part, "wb") as f:
+                f.truncate(total)
+            segments = self._plan(total)
+        hasher = _OrderedHasher(part, segments, self.chunk_size) if sha256 else None
+        self._run_segments(url, part, state, total, segments, hasher, progress)
+        digest = hasher.hexdigest() if hasher is not None else None
+        return self._finish(part, state, dest, sha256, digest)
+
+    def _get(self, url: str, headers: dict[str, str]) -> requests.Response:
+        response = self._send(
+            "GET",
+            url,
+            lambda: self.session.get(
+                url, headers=headers, stream=True, timeout=self.timeout
+            ),
+        )
+        try:
+            response.raise_for_status()
+        except requests.exceptions.HTTPError as e:
+            response.close()
+            msg = f"HTTP error occurred: {e}"
+            raise CivitaiAPIError(msg, status_code=response.status_code) from e
+        return response
+
+    def _plan(self, total: int) -> list[_Segment]:
+        count = max(1, min(self.segments, total // max(1, self.min_segment_size)))
+        bounds = [total * i // count for i in range(count + 1)]
+        return [_Segment(bounds[i], bounds[i + 1], bounds[i]) for i in range(count)]
+
+    def _load_state(self, state: Path, part: Path, total: int) -> list[_Segment] | None:
+        try:
+            saved = json.loads(state.read_text())
+            if saved["size"] != total or part.stat().st_size != total:
+                return None
+            return [_Segment(*segment) for segment in saved["segments"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _save_state(self, state: Path, total: int, segments: list[_Segment]) -> None:
+        tmp = state.with_name(state.name + ".tmp")
+        tmp.write_text(
+            json.dumps(
+                {"size": total, "segments": [[s.start, s.end, s.pos] for s in segments]}
+            )
+        )
+        os.replace(tmp, state)
+
+    def _run_segments(
+        self,
+        url: str,
+        part: Path,
+        state: Path,
+        total: int,
+        segments: list[_Segment],
+        hasher: _OrderedHasher | None,
+        progress: Callable[[int, int | None], None] | None,
+    ) -> None:
+        lock = threading.Lock()
+        abort = threading.Event()
+        done = sum(s.pos - s.start for s in segments)
+        chunks = 0
+
+        def report(n: int) -> None:
+            nonlocal done, chunks
+            with lock:
+                done += n
+                chunks += 1
+                if chunks % self.STATE_INTERVAL == 0:
+                    self._save_state(state, total, segments)
+                if progress is not None:
+                    progress(done, total)
+
+        def run(segment: _Segment) -> None:
+            try:
+                self._fetch_segment(url, part, segment, hasher, report, abort)
+            except BaseException:
+                abort.set()
+                raise
+
+        if progress is not None:
+            progress(done, total)
+        pending = [s for s in segments if s.pos < s.end]
+        try:
+            if len(pending) == 1:
+                run(pending[0])
+            elif pending:
+                with ThreadPoolExecutor(len(pending)) as pool:
+                    for future in [pool.submit(run, s) for s in pending]:
+                        future.result()
+        finally:
+            with lock:
+                self._save_state(state, total, segments)
+
+    def _fetch_segment(
+        self,
+        url: str,
+        part: Path,
+        segment: _Segment,
+        hasher: _OrderedHasher | None,
+        report: Callable[[int], None],
+        abort: threading.Event,
+    ) -> None:
+        policy = self.transport.retry_policy
+        attempt, delay = 1, None
+        # Unbuffered, so progress saved in the state file is never ahead of the data.
+        with open(part, "r+b", buffering=0) as f:
+            while segment.pos < segment.end and not abort.is_set():
+                start = segment.pos
+                try:
+                    response = self._get(
+                        url, {"Range": f"bytes={segment.pos}-{segment.end - 1}"}
+                    )
+                    with response:
+                        if response.status_code != 206:
+                            msg = f"Server ignored the range request for {url}"
+                            raise DownloadError(msg)
+                        f.seek(segment.pos)
+                        for chunk in response.iter_content(self.chunk_size):
+                            if abort.is_set():
+                                return
+                            chunk = chunk[: segment.end - segment.pos]
+                            if self.bandwidth is not None:
+                                self.bandwidth.acquire(len(chunk))
+                            f.write(chunk)
+                            if hasher is not None:
+                                hasher.update(segment.pos, chunk)
+                            segment.pos += len(chunk)
+                            report(len(chunk))
+                except Exception as e:
+                    if segment.pos > start:
+                        attempt, delay = 1, None
+                    if not policy.should_retry("GET", attempt, exception=e):
+                        raise
+                    exception = e
+                else:
+                    if segment.pos >= segment.end or segment.pos > start:
+                        continue
+                    msg = f"Server ended the response early for {url}"
+                    raise DownloadError(msg)
+
+                delay = policy.backoff(delay)
+                policy.notify(
+                    RetryEvent(
+                        method="GET",
+                        url=url,
+                        attempt=attempt,
+                        delay=delay,
+                        exception=exception,
+                    )
+                )
+                time.sleep(delay)
+                attempt += 1
+
+    def _stream_whole(
+        self,
+        response: requests.Response,
+        part: Path,
+        sha256: str | None,
+        total: int | None,
+        progress: Callable[[int, int | None], None] | None,
+    ) -> str | None:
+        sha = hashlib.sha256() if sha256 else None
+        done = 0
+        with open(part, "wb") as f:
+            for chunk in response.iter_content(self.chunk_size):
+                if self.bandwidth is not None:
+                    self.bandwidth.acquire(len(chunk))
+                f.write(chunk)
+                if sha is not None:
+                    sha.update(chunk)
+                done += len(chunk)
+                if progress is not None:
+                    progress(done, total)
+        if total is not None and done != total:
+            msg = f"Expected {total} bytes but received {done}"
+            raise DownloadError(msg)
+        return sha.hexdigest() if sha is not None else None
+
+    def _finish(
+        self,
+        part: Path,
+        state: Path,
+        dest: Path,
+        sha256: str | None,
+        digest: str | None,
+    ) -> Path:
+        state.unlink(missing_ok=True)
+        if sha256 and digest.upper() != sha256.upper():
+            part.unlink(missing_ok=True)
+            msg = f"SHA256 mismatch for {dest.name}: expected {sha256.upper()}, got {digest.upper()}"
+            raise DownloadError(msg)
+        os.replace(part, dest)
+        return dest
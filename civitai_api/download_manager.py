@@ -0,0 +1,305 @@
+"""Queued downloads of many model files.
+
+A DownloadManager runs queued files on a fixed number of worker threads, highest
+priority first, under a bytes-per-second budget shared by all of them. The cap only
+applies to the manager's downloads, so a bulk sync can be held just below link speed
+while interactive requests and downloads through ``Civitai.downloads`` stay responsive.
+
+The queue is saved to a JSON file whenever it changes. A restarted manager picks up the
+unfinished files, and each download resumes from its partial file. Files are
+deduplicated by SHA256 (or URL when no hash is known), so a file shared by several
+versions is only fetched once.
+"""
+
+import heapq
+import itertools
+import json
+import os
+import threading
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from enum import Enum
+from pathlib import Path
+from types import TracebackType
+from typing import Self
+
+from .download import Downloader
+from .models.model_version import ModelVersion, ModelVersionFile
+from .ratelimit import RateLimiter
+
+
+class DownloadStatus(Enum):
+    """Lifecycle of a queued download."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+@dataclass
+class DownloadTask:
+    """A file queued for download.
+
+    Attributes:
+        url (str): The download URL.
+        dest (str): Where the file is saved.
+        sha256 (str | None): Expected SHA256 digest, also used to deduplicate files.
+        size (int | None): Expected size in bytes, once known.
+        priority (int): Higher priorities are started first.
+        status (DownloadStatus): Where the download is in its lifecycle.
+        downloaded (int): Bytes received so far.
+        error (str | None): Why the download failed, if it did.
+
+    """
+
+    url: str
+    dest: str
+    sha256: str | None = None
+    size: int | None = None
+    priority: int = 0
+    status: DownloadStatus = DownloadStatus.QUEUED
+    downloaded: int = 0
+    error: str | None = None
+
+    @property
+    def key(self) -> str:
+        """Identity used to deduplicate files."""
+        return self.sha256.upper() if self.sha256 else self.url
+
+
+class DownloadManager:
+    """Runs a persistent priority queue of downloads with shared concurrency and bandwidth limits.
+
+    Attributes:
+        downloader (Downloader): Performs the individual downloads.
+        directory (Path): Where files are saved by default.
+        max_concurrency (int): Number of files downloaded at the same time.
+        state_path (Path): Where the queue is saved.
+
+    """
+
+    def __init__(
+        self,
+        downloader: Downloader,
+        directory: str | os.PathLike,
+        max_concurrency: int = 3,
+        bytes_per_second: float | None = None,
+        state_path: str | os.PathLike | None = None,
+        on_progress: Callable[[DownloadTask], None] | None = None,
+    ) -> None:
+        """Create a manager, restoring the queue saved at ``state_path`` if there is one.
+
+        Args:
+            downloader (Downloader): Template for the manager's downloader. Its transport and settings are shared, but the bandwidth cap only applies to the manager.
+            directory (str | os.PathLike): Where files are saved by default.
+            max_concurrency (int): Number of files downloaded at the same time.
+            bytes_per_second (float | None): Combined download speed cap. None leaves downloads unthrottled.
+            state_path (str | os.PathLike | None): Where the queue is saved. Defaults to ``downloads.json`` in ``directory``.
+            on_progress (Callable[[DownloadTask], None] | None): Called as a task receives data and when its status changes.
+
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_concurrency = max_concurrency
+        self.state_path = (
+            Path(state_path) if state_path else self.directory / "downloads.json"
+        )
+        self.on_progress = on_progress
+        self.downloader = Downloader(
+            downloader.api_key,
+            transport=downloader.transport,
+            chunk_size=downloader.chunk_size,
+            segments=downloader.segments,
+            min_segment_size=downloader.min_segment_size,
+            timeout=downloader.timeout,
+            bandwidth=(
+                RateLimiter(bytes_per_second, burst=max(1, int(bytes_per_second)))
+                if bytes_per_second
+                else None
+            ),
+        )
+        self._tasks: dict[str, DownloadTask] = {}
+        self._heap: list[tuple[int, int, DownloadTask]] = []
+        self._order = itertools.count()
+        self._running = 0
+        self._closing = False
+        self._workers: list[threading.Thread] = []
+        self._cond = threading.Condition()
+        self._load()
+
+    @property
+    def tasks(self) -> list[DownloadTask]:
+        """Every known task, finished ones included."""
+        with self._cond:
+            return list(self._tasks.values())
+
+    def enqueue(
+        self,
+        source: ModelVersionFile | str,
+        priority: int = 0,
+        dest: str | os.PathLike | None = None,
+    ) -> DownloadTask:
+        """Queue a file, unless a file with the same hash is already queued or downloaded.
+
+        Args:
+            source (ModelVersionFile | str): The file to download, or its download URL.
+            priority (int): Higher priorities are started first.
+            dest (str | os.PathLike | None): Where to save it. Defaults to the file's name in ``directory``.
+
+        Returns:
+            DownloadTask: The new task, or the existing one for the same file.
+
+        Raises:
+            ValueError: If no destination can be derived, or it belongs to a different file.
+
+        """
+        if isinstance(source, ModelVersionFile):
+            url = source.downloadUrl
+            sha256 = (source.hashes or {}).get("SHA256")
+            size = int(source.sizeKb * 1024) if source.sizeKb else None
+            name = source.name
+        else:
+            url, sha256, size, name = source, None, None, None
+        if dest is None:
+            if not name:
+                msg = "dest is required when queueing a bare URL"
+                raise ValueError(msg)
+            dest = self.directory / name
+        task = DownloadTask(url, os.fspath(dest), sha256, size, priority)
+
+        with self._cond:
+            existing = self._tasks.get(task.key)
+            if existing is not None and existing.status != DownloadStatus.FAILED:
+                return existing
+            for other in self._tasks.values():
+                if other.dest == task.dest and other.key != task.key:
+                    msg = f"{task.dest} is already the destination of {other.url}"
+                    raise ValueError(msg)
+            self._tasks[task.key] = task
+            self._push(task)
+            self._save()
+        return task
+
+    def enqueue_version(
+        self, version: ModelVersion, priority: int = 0, primary_only: bool = False
+    ) -> list[DownloadTask]:
+        """Queue the files of a model version.
+
+        Args:
+            version (ModelVersion): The version whose files are downloaded.
+            priority (int): Higher priorities are started first.
+            primary_only (bool): Only queue the version's primary file.
+
+        Returns:
+            list[DownloadTask]: One task per queued file.
+
+        """
+        files = [f for f in version.files or [] if f.primary or not primary_only]
+        return [self.enqueue(f, priority) for f in files]
+
+    def start(self) -> None:
+        """Start the worker threads."""
+        with self._cond:
+            self._closing = False
+            while len(self._workers) < self.max_concurrency:
+                worker = threading.Thread(target=self._work, daemon=True)
+                self._workers.append(worker)
+                worker.start()
+
+    def wait(self) -> None:
+        """Block until no task is queued or running. Call ``start`` first."""
+        with self._cond:
+            while self._heap or self._running:
+                self._cond.wait()
+
+    def close(self) -> None:
+        """Stop starting new tasks and wait for the running ones to finish.
+
+        Queued tasks stay in the saved queue for the next manager.
+        """
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        for worker in self._workers:
+            worker.join()
+        self._workers.clear()
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.wait()
+        self.close()
+
+    def _push(self, task: DownloadTask) -> None:
+        task.status = DownloadStatus.QUEUED
+        task.error = None
+        heapq.heappush(self._heap, (-task.priority, next(self._order), task))
+        self._cond.notify()
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                while not self._heap and not self._closing:
+                    self._cond.wait()
+                if self._closing:
+                    return
+                task = heapq.heappop(self._heap)[2]
+                task.status = DownloadStatus.RUNNING
+                self._running += 1
+                self._save()
+            self._notify(task)
+
+            def progress(
+                done: int, total: int | None, task: DownloadTask = task
+            ) -> None:
+                task.downloaded = done
+                task.size = total or task.size
+                self._notify(task)
+
+            try:
+                self.downloader.download(task.url, task.dest, task.sha256, progress)
+            except Exception as e:  # noqa: BLE001 - recorded on the task
+                status, error = DownloadStatus.FAILED, str(e)
+            else:
+                status, error = DownloadStatus.DONE, None
+            with self._cond:
+                task.status, task.error = status, error
+                self._running -= 1
+                self._save()
+                self._cond.notify_all()
+            self._notify(task)
+
+    def _notify(self, task: DownloadTask) -> None:
+        if self.on_progress is not None:
+            self.on_progress(task)
+
+    def _load(self) -> None:
+        try:
+            saved = json.loads(self.state_path.read_text())
+        except (OSError, ValueError):
+            return
+        with self._cond:
+            for item in saved:
+                status = DownloadStatus(item["status"])
+                task = DownloadTask(**{**item, "status": status})
+                self._tasks[task.key] = task
+                if status in (DownloadStatus.QUEUED, DownloadStatus.RUNNING):
+                    self._push(task)
+
+    def _save(self) -> None:
+        tasks = [
+            {**asdict(task), "status": task.status.value}
+            for task in self._tasks.values()
+        ]
+        tmp = self.state_path.with_name(self.state_path.name + ".tmp")
+        tmp.write_text(json.dumps(tasks))
+        os.replace(tmp, self.state_path)
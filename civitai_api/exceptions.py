@@ -5,8 +5,32 @@ Custom exceptions for handling errors related to the Civitai API.
 
 
 class CivitaiAPIError(Exception):
-    """Base exception for Civitai API errors."""
+    """Base exception for Civitai API errors.
+
+    Attributes:
+        status_code (int | None): HTTP status of the failed response, if one was received.
+
+    """
+
+    def __init__(self, message: str = "", status_code: int | None = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
 
 
 class RateLimitError(CivitaiAPIError):
-    """Raised when rate limit is exceeded."""
+    """Raised when rate limit is exceeded.
+
+    Attributes:
+        retry_after (float | None): Seconds the server asked to wait, when it said.
+
+    """
+
+    def __init__(
+        self, message: str = "Rate limit exceeded", retry_after: float | None = None
+    ) -> None:
+        super().__init__(message, status_code=429)
+        self.retry_after = retry_after
+
+
+class DownloadError(CivitaiAPIError):
+    """Raised when a download cannot be completed or fails verification."""
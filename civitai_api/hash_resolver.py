@@ -0,0 +1,157 @@
+"""Bulk resolution of file hashes to model versions.
+
+A library scan looks up one hash per local file, and most of those hashes give the
+same answer on every scan, often a 404 for files Civitai does not know. HashResolver
+looks them up concurrently and remembers both outcomes. Found versions are kept and
+indexed under every hash of their files, so later lookups by another hash type of a
+known file are answered locally too. Unknown hashes are kept for ``negative_ttl``
+seconds, both in memory and, when a DiskCache is available, on disk across runs.
+"""
+
+import time
+from collections.abc import Callable, Iterable
+
+from .api.model_versions import ModelVersionsAPI
+from .bulk import bulk_fetch
+from .cache import ObjectCache
+from .disk_cache import DiskCache
+from .exceptions import CivitaiAPIError
+from .models.model_version import ModelVersion
+
+_UNKNOWN = object()
+
+
+class HashResolver:
+    """Resolves AutoV1/AutoV2/SHA256/CRC32/Blake3 hashes to model versions in bulk.
+
+    Attributes:
+        model_versions (ModelVersionsAPI): API used for lookups.
+        max_workers (int): Number of lookups run concurrently.
+        negative_ttl (float): Seconds a hash unknown to Civitai is remembered as such.
+        disk_cache (DiskCache | None): Where unknown hashes are persisted across runs.
+        requests (int): Number of lookups sent to the API.
+
+    """
+
+    NEGATIVE_KEY_PREFIX = "negative-hash:"
+
+    def __init__(
+        self,
+        model_versions: ModelVersionsAPI,
+        max_workers: int = 8,
+        positive_ttl: float | None = None,
+        negative_ttl: float = 24 * 3600,
+        max_entries: int = 100_000,
+        disk_cache: DiskCache | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create a resolver.
+
+        Args:
+            model_versions (ModelVersionsAPI): API used for lookups.
+            max_workers (int): Number of lookups run concurrently.
+            positive_ttl (float | None): Seconds a found version is kept. None keeps it until evicted.
+            negative_ttl (float): Seconds a hash unknown to Civitai is remembered as such.
+            max_entries (int): Maximum number of hashes kept in memory for each outcome.
+            disk_cache (DiskCache | None): Where unknown hashes are persisted. Defaults to the client's disk cache.
+            clock (Callable[[], float]): Monotonic clock, overridable in tests.
+
+        """
+        self.model_versions = model_versions
+        self.max_workers = max_workers
+        self.negative_ttl = negative_ttl
+        self.disk_cache = (
+            disk_cache
+            if disk_cache is not None
+            else model_versions.transport.disk_cache
+        )
+        self.requests = 0
+        self._found = ObjectCache(max_entries, positive_ttl, clock)
+        self._unknown = ObjectCache(max_entries, negative_ttl, clock)
+
+    @staticmethod
+    def normalize(hash: str) -> str:
+        """Return the canonical (upper-case hex) form of a hash."""
+        return hash.strip().upper()
+
+    def resolve(self, hashes: Iterable[str]) -> dict[str, ModelVersion | None]:
+        """Resolve hashes to the model versions they belong to.
+
+        Each distinct hash is looked up at most once, and only if no earlier lookup
+        is remembered for it.
+
+        Args:
+            hashes (Iterable[str]): Hashes of local files, of any supported type.
+
+        Returns:
+            dict[str, ModelVersion | None]: The version for each given hash, or None if Civitai does not know it.
+
+        Raises:
+            CivitaiAPIError: For the first lookup that failed other than with a 404, once every lookup has finished. The outcomes of the others are remembered, so calling again only repeats the failed ones.
+
+        """
+        given = {hash: self.normalize(hash) for hash in hashes}
+        resolved: dict[str, ModelVersion | None] = {}
+        pending = []
+        for key in dict.fromkeys(given.values()):
+            version = self._lookup(key)
+            if version is _UNKNOWN:
+                pending.append(key)
+            else:
+                resolved[key] = version
+
+        error = None
+        self.requests += len(pending)
+        for result in bulk_fetch(
+            self.model_versions.get_model_version_by_hash, pending, self.max_workers
+        ):
+            if result.ok:
+                self._remember(result.id, result.value)
+                resolved[result.id] = result.value
+            elif (
+                isinstance(result.error, CivitaiAPIError)
+                and result.error.status_code == 404
+            ):
+                self._remember_unknown(result.id)
+                resolved[result.id] = None
+            elif error is None:
+                error = result.error
+        if error is not None:
+            raise error
+        return {hash: resolved[key] for hash, key in given.items()}
+
+    def forget(self, hash: str) -> None:
+        """Drop what is remembered about ``hash``, so the next resolve looks it up again."""
+        key = self.normalize(hash)
+        self._found.invalidate(key)
+        self._unknown.invalidate(key)
+        if self.disk_cache is not None:
+            self.disk_cache.delete(self.NEGATIVE_KEY_PREFIX + key)
+
+    def _lookup(self, key: str) -> ModelVersion | None | object:
+        version = self._found.get(key)
+        if version is not None:
+            return version
+        if self._unknown.get(key) is not None:
+            return None
+        if (
+            self.disk_cache is not None
+            and self.disk_cache.get(self.NEGATIVE_KEY_PREFIX + key) is not None
+        ):
+            self._unknown.put(key, True)
+            return None
+        return _UNKNOWN
+
+    def _remember(self, key: str, version: ModelVersion) -> None:
+        self._found.put(key, version)
+        for file in version.files or []:
+            for value in (file.hashes or {}).values():
+                if isinstance(value, str):
+                    self._found.put(self.normalize(value), version)
+
+    def _remember_unknown(self, key: str) -> None:
+        self._unknown.put(key, True)
+        if self.disk_cache is not None:
+            self.disk_cache.set(
+                self.NEGATIVE_KEY_PREFIX + key, b"", ttl=self.negative_ttl
+            )
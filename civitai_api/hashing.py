@@ -0,0 +1,200 @@
+"""Local file hashing in the formats Civitai indexes model files by.
+
+Every requested digest is computed in a single pass over the file, read in large
+chunks into one reused buffer. hashlib, zlib and blake3 release the GIL while they
+work on large buffers, so hashing many files on a thread pool keeps every core busy
+and a library scan is bound by disk throughput. Results are cached by
+(path, size, mtime), in memory and optionally in a DiskCache across runs.
+
+Digests are upper-case hex under the same keys as ``ModelVersionFile.hashes``, so they
+can be passed straight to ``get_model_version_by_hash`` or ``HashResolver.resolve``.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import zlib
+from collections.abc import Iterable, Iterator
+
+from .bulk import BulkResult, bulk_fetch
+from .disk_cache import DiskCache
+
+try:
+    import blake3
+except ImportError:  # pragma: no cover - exercised only without blake3 installed
+    blake3 = None
+
+AUTOV1 = "AutoV1"
+AUTOV2 = "AutoV2"
+SHA256 = "SHA256"
+CRC32 = "CRC32"
+BLAKE3 = "BLAKE3"
+ALGORITHMS = (AUTOV1, AUTOV2, SHA256, CRC32, BLAKE3)
+DEFAULT_ALGORITHMS = tuple(a for a in ALGORITHMS if a != BLAKE3 or blake3 is not None)
+
+# AutoV1 is the SHA256 of the 64 KiB that start 1 MiB into the file, cut to 8 digits.
+_AUTOV1_START = 0x100000
+_AUTOV1_END = _AUTOV1_START + 0x10000
+
+
+def hash_file(
+    path: str | os.PathLike,
+    algorithms: Iterable[str] = DEFAULT_ALGORITHMS,
+    chunk_size: int = 8 * 1024 * 1024,
+) -> dict[str, str]:
+    """Compute the requested digests of a file in one pass.
+
+    Args:
+        path (str | os.PathLike): File to hash.
+        algorithms (Iterable[str]): Any of ``AutoV1``, ``AutoV2``, ``SHA256``, ``CRC32`` and ``BLAKE3``.
+        chunk_size (int): Bytes read at a time.
+
+    Returns:
+        dict[str, str]: Upper-case hex digest by algorithm.
+
+    Raises:
+        ValueError: If an algorithm is not supported.
+        ImportError: If ``BLAKE3`` is requested without the blake3 package installed.
+
+    """
+    algorithms = set(algorithms)
+    unknown = algorithms.difference(ALGORITHMS)
+    if unknown:
+        msg = f"Unsupported hash algorithms: {', '.join(sorted(unknown))}"
+        raise ValueError(msg)
+    if BLAKE3 in algorithms and blake3 is None:
+        msg = "BLAKE3 hashing requires the blake3 package: pip install blake3"
+        raise ImportError(msg)
+
+    sha256 = hashlib.sha256() if algorithms & {SHA256, AUTOV2} else None
+    autov1 = hashlib.sha256() if AUTOV1 in algorithms else None
+    blake = blake3.blake3() if BLAKE3 in algorithms else None
+    crc = 0 if CRC32 in algorithms else None
+
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    offset = 0
+    with open(path, "rb", buffering=0) as f:
+        while n := f.readinto(buffer):
+            chunk = view[:n]
+            if sha256 is not None:
+                sha256.update(chunk)
+            if blake is not None:
+                blake.update(chunk)
+            if crc is not None:
+                crc = zlib.crc32(chunk, crc)
+            if autov1 is not None:
+                start = max(offset, _AUTOV1_START)
+                end = min(offset + n, _AUTOV1_END)
+                if start < end:
+                    autov1.update(chunk[start - offset : end - offset])
+            offset += n
+
+    digests = {}
+    if sha256 is not None:
+        full = sha256.hexdigest().upper()
+        if SHA256 in algorithms:
+            digests[SHA256] = full
+        if AUTOV2 in algorithms:
+            digests[AUTOV2] = full[:10]
+    if autov1 is not None:
+        digests[AUTOV1] = autov1.hexdigest()[:8].upper()
+    if crc is not None:
+        digests[CRC32] = f"{crc:08X}"
+    if blake is not None:
+        digests[BLAKE3] = blake.hexdigest().upper()
+    return digests
+
+
+class FileHasher:
+    """Hashes files in parallel, caching digests by (path, size, mtime).
+
+    Attributes:
+        algorithms (tuple[str, ...]): Digests computed for every file.
+        chunk_size (int): Bytes read at a time.
+        max_workers (int): Number of files hashed concurrently.
+        disk_cache (DiskCache | None): Where digests are persisted across runs.
+        cache_ttl (float): Seconds digests are kept in ``disk_cache``.
+
+    """
+
+    KEY_PREFIX = "file-hash:"
+
+    def __init__(
+        self,
+        algorithms: Iterable[str] = DEFAULT_ALGORITHMS,
+        chunk_size: int = 8 * 1024 * 1024,
+        max_workers: int | None = None,
+        disk_cache: DiskCache | None = None,
+        cache_ttl: float = 30 * 24 * 3600,
+    ) -> None:
+        """Create a hasher.
+
+        Args:
+            algorithms (Iterable[str]): Digests computed for every file.
+            chunk_size (int): Bytes read at a time.
+            max_workers (int | None): Number of files hashed concurrently. Defaults to the number of CPUs.
+            disk_cache (DiskCache | None): Where digests are persisted across runs. Kept in memory only when omitted.
+            cache_ttl (float): Seconds digests are kept in ``disk_cache``.
+
+        """
+        self.algorithms = tuple(algorithms)
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.disk_cache = disk_cache
+        self.cache_ttl = cache_ttl
+        self._cache: dict[tuple[str, int, int], dict[str, str]] = {}
+        self._lock = threading.Lock()
+
+    def hash_file(self, path: str | os.PathLike) -> dict[str, str]:
+        """Return the digests of a file, hashing it only if it changed since last time.
+
+        Args:
+            path (str | os.PathLike): File to hash.
+
+        Returns:
+            dict[str, str]: Upper-case hex digest by algorithm.
+
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        key = (path, stat.st_size, stat.st_mtime_ns)
+        disk_key = f"{self.KEY_PREFIX}{path}:{stat.st_size}:{stat.st_mtime_ns}"
+
+        with self._lock:
+            digests = self._cache.get(key)
+        if digests is None and self.disk_cache is not None:
+            body = self.disk_cache.get(disk_key)
+            if body is not None:
+                digests = json.loads(body)
+        if digests is not None and all(a in digests for a in self.algorithms):
+            with self._lock:
+                self._cache[key] = digests
+            return {a: digests[a] for a in self.algorithms}
+
+        digests = {
+            **(digests or {}),
+            **hash_file(path, self.algorithms, self.chunk_size),
+        }
+        with self._lock:
+            self._cache[key] = digests
+        if self.disk_cache is not None:
+            self.disk_cache.set(
+                disk_key, json.dumps(digests).encode(), ttl=self.cache_ttl
+            )
+        return {a: digests[a] for a in self.algorithms}
+
+    def hash_files(
+        self, paths: Iterable[str | os.PathLike]
+    ) -> Iterator[BulkResult[dict[str, str]]]:
+        """Hash many files concurrently, yielding each as soon as it is done.
+
+        Args:
+            paths (Iterable[str | os.PathLike]): Files to hash; consumed lazily.
+
+        Yields:
+            BulkResult[dict[str, str]]: One result per path, in completion order, holding either its digests or the error raised for it (e.g. OSError).
+
+        """
+        return bulk_fetch(self.hash_file, paths, self.max_workers)
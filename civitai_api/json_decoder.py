@@ -0,0 +1,102 @@
+"""Pluggable JSON decoding of API responses.
+
+Decoding list pages, which carry description HTML and image metadata, is a large part
+of the CPU time of a crawl. ``get_decoder`` returns the fastest decoder installed:
+orjson, then msgspec, then the standard library. All of them decode the raw response
+bytes directly, skipping the text decoding step of ``response.json()``.
+
+The decoder is chosen per transport (see ``Transport(json_decoder=...)``), so every
+endpoint sharing it decodes the same way.
+"""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - exercised only without msgspec installed
+    msgspec = None
+
+ORJSON = "orjson"
+MSGSPEC = "msgspec"
+STDLIB = "json"
+
+BACKENDS = (ORJSON, MSGSPEC, STDLIB)
+
+JSONDecoder = Callable[[bytes | str], Any]
+
+
+def available_backends() -> list[str]:
+    """Return the installed backends, fastest first."""
+    installed = {ORJSON: orjson, MSGSPEC: msgspec, STDLIB: json}
+    return [name for name in BACKENDS if installed[name] is not None]
+
+
+def get_decoder(backend: str | JSONDecoder | None = None) -> JSONDecoder:
+    """Return a function decoding JSON bytes (or text) into Python objects.
+
+    Args:
+        backend (str | JSONDecoder | None): ``"orjson"``, ``"msgspec"`` or ``"json"``, a decoding function, or None for the fastest one installed.
+
+    Returns:
+        JSONDecoder: The decoding function. Invalid JSON raises a ValueError.
+
+    Raises:
+        ValueError: If the backend is unknown.
+        ImportError: If the backend is not installed.
+
+    """
+    if callable(backend):
+        return backend
+    if backend is None:
+        backend = available_backends()[0]
+    if backend not in BACKENDS:
+        msg = f"Unknown JSON backend {backend!r}, expected one of {', '.join(BACKENDS)}"
+        raise ValueError(msg)
+    if backend == ORJSON:
+        if orjson is None:
+            msg = "The orjson backend requires orjson: pip install orjson"
+            raise ImportError(msg)
+        return orjson.loads
+    if backend == MSGSPEC:
+        if msgspec is None:
+            msg = "The msgspec backend requires msgspec: pip install msgspec"
+            raise ImportError(msg)
+        return _msgspec_decoder()
+    return json.loads
+
+
+def _msgspec_decoder() -> JSONDecoder:
+    # msgspec.DecodeError is not a ValueError; raise one like the other backends.
+    decode = msgspec.json.Decoder().decode
+
+    def loads(data: bytes | str) -> Any:
+        try:
+            return decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    return loads
+
+
+def decode_response(response: Any, loads: JSONDecoder) -> Any:
+    """Decode the JSON body of a requests or httpx response with ``loads``.
+
+    Args:
+        response (Any): The response.
+        loads (JSONDecoder): The decoder, e.g. from ``get_decoder``.
+
+    Returns:
+        Any: The decoded body.
+
+    Raises:
+        ValueError: If the body is not valid JSON.
+
+    """
+    return loads(response.content)
@@ -0,0 +1,478 @@
+"""Local SQLite mirror of the model catalog.
+
+ModelMirror keeps models, their versions, files, images, tags and stats in a
+normalized SQLite database, so the catalog can be read without touching the API (see
+``offline`` for queries). Names, descriptions and tags are also indexed in an FTS5
+table, ``models_search``, whose rowid is the model ID.
+
+``sync`` walks ``ModelsAPI.list_models`` in ``Newest`` order and writes every page in
+one transaction with bulk inserts. The first sync loads the whole catalog and then
+records the highest model ID seen as the high-water mark. Later syncs stop after the
+first page holding only models at or below the mark, which is usually the first or
+second page. A model already in the mirror is replaced as a whole, so versions, files
+and images removed upstream disappear from the mirror too.
+
+An incremental sync only adds the models created since the last one. The models on
+the pages it walks are refreshed, but stats, new versions and file changes of older
+models are not picked up. ``sync(refresh_pages=n)`` walks ``n`` more pages below the
+mark, refreshing the newest mirrored models, whose stats change fastest;
+``sync(full=True)`` walks the whole catalog and refreshes every model.
+
+The mark is only moved once a sync has finished, so an interrupted sync is picked up
+again from the newest models on the next run.
+"""
+
+import json
+import os
+import re
+import sqlite3
+from collections.abc import Iterable
+from contextlib import closing
+from dataclasses import dataclass, field
+from html import unescape
+from types import TracebackType
+from typing import Any, Self
+
+from .api.models import ModelsAPI, ModelSort
+from .models.model import Model
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS models (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    description TEXT,
+    type TEXT,
+    nsfw INTEGER,
+    mode TEXT,
+    creator_username TEXT,
+    creator_image TEXT,
+    allow_no_credit INTEGER,
+    allow_commercial_use TEXT,
+    allow_derivatives INTEGER,
+    allow_different_license INTEGER
+);
+CREATE INDEX IF NOT EXISTS models_creator ON models (creator_username);
+CREATE INDEX IF NOT EXISTS models_type ON models (type);
+CREATE TABLE IF NOT EXISTS model_stats (
+    model_id INTEGER PRIMARY KEY REFERENCES models (id) ON DELETE CASCADE,
+    download_count INTEGER,
+    favorite_count INTEGER,
+    comment_count INTEGER,
+    rating_count INTEGER,
+    rating REAL
+);
+CREATE INDEX IF NOT EXISTS model_stats_downloads ON model_stats (download_count);
+CREATE INDEX IF NOT EXISTS model_stats_rating ON model_stats (rating, rating_count);
+CREATE TABLE IF NOT EXISTS model_tags (
+    model_id INTEGER NOT NULL REFERENCES models (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    tag TEXT NOT NULL COLLATE NOCASE,
+    PRIMARY KEY (model_id, position)
+);
+CREATE INDEX IF NOT EXISTS model_tags_tag ON model_tags (tag);
+CREATE TABLE IF NOT EXISTS model_versions (
+    id INTEGER PRIMARY KEY,
+    model_id INTEGER NOT NULL REFERENCES models (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT,
+    created_at TEXT,
+    download_url TEXT,
+    trained_words TEXT,
+    base_model TEXT
+);
+CREATE INDEX IF NOT EXISTS model_versions_model ON model_versions (model_id);
+CREATE INDEX IF NOT EXISTS model_versions_base ON model_versions (base_model);
+CREATE TABLE IF NOT EXISTS version_stats (
+    version_id INTEGER PRIMARY KEY REFERENCES model_versions (id) ON DELETE CASCADE,
+    download_count INTEGER,
+    rating_count INTEGER,
+    rating REAL
+);
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    version_id INTEGER NOT NULL REFERENCES model_versions (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT,
+    size_kb REAL,
+    type TEXT,
+    format TEXT,
+    pickle_scan_result TEXT,
+    pickle_scan_message TEXT,
+    virus_scan_result TEXT,
+    scanned_at TEXT,
+    hashes TEXT,
+    download_url TEXT,
+    is_primary INTEGER
+);
+CREATE INDEX IF NOT EXISTS files_version ON files (version_id);
+CREATE TABLE IF NOT EXISTS images (
+    version_id INTEGER NOT NULL REFERENCES model_versions (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    url TEXT,
+    nsfw INTEGER,
+    width INTEGER,
+    height INTEGER,
+    hash TEXT,
+    meta TEXT,
+    PRIMARY KEY (version_id, position)
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS models_search USING fts5 (
+    name, description, tags, tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+_HTML_TAG = re.compile(r"<[^>]*>")
+
+# Table -> (key columns, number of columns), in insertion order.
+TABLES: dict[str, tuple[tuple[str, ...], int]] = {
+    "models": (("id",), 12),
+    "model_stats": (("model_id",), 6),
+    "model_tags": (("model_id", "position"), 3),
+    "model_versions": (("id",), 8),
+    "version_stats": (("version_id",), 4),
+    "files": (("id",), 14),
+    "images": (("version_id", "position"), 8),
+}
+
+# How each table reaches the models being written, to find the rows they replace.
+_MODEL_COLUMN = {
+    "models": "id",
+    "model_stats": "model_id",
+    "model_tags": "model_id",
+    "model_versions": "model_id",
+}
+_VERSIONS_OF = "SELECT id FROM model_versions WHERE model_id IN ({})"
+
+HIGH_WATER_MARK = "high_water_mark"
+
+
+@dataclass
+class SyncStats:
+    """What a sync (or a single ``write``) changed in the mirror.
+
+    Attributes:
+        pages_fetched (int): Pages of models read from the API.
+        models (int): Models written, counting a model again if it appeared on two pages.
+        inserted (dict[str, int]): Rows added, by table.
+        updated (dict[str, int]): Rows replaced, by table.
+        high_water_mark (int | None): The highest model ID synced, after the sync.
+
+    """
+
+    pages_fetched: int = 0
+    models: int = 0
+    inserted: dict[str, int] = field(default_factory=lambda: dict.fromkeys(TABLES, 0))
+    updated: dict[str, int] = field(default_factory=lambda: dict.fromkeys(TABLES, 0))
+    high_water_mark: int | None = None
+
+    @property
+    def rows_inserted(self) -> int:
+        """Rows added across all tables."""
+        return sum(self.inserted.values())
+
+    @property
+    def rows_updated(self) -> int:
+        """Rows replaced across all tables."""
+        return sum(self.updated.values())
+
+
+def _json(value: Any) -> str | None:
+    return json.dumps(value) if value is not None else None
+
+
+def _isoformat(value: Any) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+def _value(enum: Any) -> Any:
+    return enum.value if enum is not None else None
+
+
+def search_text(html: str | None) -> str:
+    """Return the words of a description, without its HTML markup."""
+    return unescape(_HTML_TAG.sub(" ", html)) if html else ""
+
+
+def _search_rows(models: Iterable[Model]) -> list[tuple]:
+    # One row per model, the last one winning as in the other tables.
+    rows = {
+        model.id: (
+            model.id,
+            model.name or "",
+            search_text(model.description),
+            " ".join(model.tags or []),
+        )
+        for model in models
+    }
+    return list(rows.values())
+
+
+def model_rows(models: Iterable[Model]) -> dict[str, list[tuple]]:
+    """Flatten parsed models into rows of the mirror's tables.
+
+    Args:
+        models (Iterable[Model]): Fully parsed models.
+
+    Returns:
+        dict[str, list[tuple]]: Rows for every table in TABLES, in column order.
+
+    """
+    rows: dict[str, list[tuple]] = {table: [] for table in TABLES}
+    for model in models:
+        creator, stats = model.creator, model.stats
+        rows["models"].append(
+            (
+                model.id,
+                model.name,
+                model.description,
+                _value(model.type),
+                model.nsfw,
+                _value(model.mode),
+                creator.username if creator is not None else None,
+                creator.image if creator is not None else None,
+                model.allowNoCredit,
+                _json(model.allowCommercialUse),
+                model.allowDerivatives,
+                model.allowDifferentLicense,
+            )
+        )
+        if stats is not None:
+            rows["model_stats"].append(
+                (
+                    model.id,
+                    stats.downloadCount,
+                    stats.favoriteCount,
+                    stats.commentCount,
+                    stats.ratingCount,
+                    stats.rating,
+                )
+            )
+        rows["model_tags"].extend(
+            (model.id, i, tag) for i, tag in enumerate(model.tags or [])
+        )
+        for position, version in enumerate(model.modelVersions or []):
+            rows["model_versions"].append(
+                (
+                    version.id,
+                    model.id,
+                    position,
+                    version.name,
+                    _isoformat(version.createdAt),
+                    version.downloadUrl,
+                    _json(version.trainedWords),
+                    version.baseModel,
+                )
+            )
+            if version.stats is not None:
+                rows["version_stats"].append(
+                    (
+                        version.id,
+                        version.stats.downloadCount,
+                        version.stats.ratingCount,
+                        version.stats.rating,
+                    )
+                )
+            rows["files"].extend(
+                (
+                    f.id,
+                    version.id,
+                    i,
+                    f.name,
+                    f.sizeKb,
+                    f.type,
+                    f.format,
+                    f.pickleScanResult,
+                    f.pickleScanMessage,
+                    f.virusScanResult,
+                    _isoformat(f.scannedAt),
+                    _json(f.hashes),
+                    f.downloadUrl,
+                    f.primary,
+                )
+                for i, f in enumerate(version.files or [])
+            )
+            rows["images"].extend(
+                (
+                    version.id,
+                    i,
+                    image.url,
+                    image.nsfw,
+                    image.width,
+                    image.height,
+                    image.hash,
+                    _json(image.meta),
+                )
+                for i, image in enumerate(version.images or [])
+            )
+    return rows
+
+
+class ModelMirror:
+    """Normalized SQLite copy of the model catalog, kept current by ``sync``.
+
+    A mirror holds one connection and is meant to be used from one thread at a time.
+    It can be used as a context manager, closing the connection on exit.
+
+    Attributes:
+        path (str): Location of the SQLite file.
+
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        """Open (creating if needed) the mirror database.
+
+        Args:
+            path (str | os.PathLike): Location of the SQLite file.
+
+        """
+        self.path = os.fspath(path)
+        self.conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(_SCHEMA)
+
+    @property
+    def high_water_mark(self) -> int | None:
+        """The highest model ID of the last finished sync, or None before the first one."""
+        row = self.conn.execute(
+            "SELECT value FROM sync_state WHERE key = ?", (HIGH_WATER_MARK,)
+        ).fetchone()
+        return row[0] if row is not None else None
+
+    def sync(
+        self,
+        api: ModelsAPI,
+        limit: int = 100,
+        prefetch: int = 1,
+        full: bool = False,
+        refresh_pages: int = 0,
+    ) -> SyncStats:
+        """Bring the mirror up to date with the catalog.
+
+        Without ``full``, only models created since the last sync are added; models
+        already mirrored are refreshed only within the pages walked (see the module
+        docstring).
+
+        Args:
+            api (ModelsAPI): The API to read from, e.g. ``civitai.models``.
+            limit (int): Models per page (at most 100).
+            prefetch (int): Pages fetched ahead while the current one is written (see ``list_models``).
+            full (bool): Walk and refresh the whole catalog even if the mirror has a high-water mark.
+            refresh_pages (int): Pages below the high-water mark to walk anyway, refreshing the newest mirrored models.
+
+        Returns:
+            SyncStats: Pages fetched and rows inserted and updated.
+
+        """
+        mark = None if full else self.high_water_mark
+        stats = SyncStats()
+        newest = self.high_water_mark
+        pages = api.list_models(limit=limit, sort=ModelSort.NEWEST, prefetch=prefetch)
+        with closing(pages):
+            for page in pages:
+                stats.pages_fetched += 1
+                self.write(page, stats)
+                ids = [model.id for model in page if model.id is not None]
+                newest = max([newest or 0, *ids]) if ids else newest
+                if mark is not None and all(i <= mark for i in ids):
+                    if refresh_pages <= 0:
+                        break
+                    refresh_pages -= 1
+        if newest is not None:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)",
+                (HIGH_WATER_MARK, newest),
+            )
+        stats.high_water_mark = newest
+        return stats
+
+    def write(self, models: list[Model], stats: SyncStats | None = None) -> SyncStats:
+        """Insert or replace ``models`` in one transaction.
+
+        Args:
+            models (list[Model]): Fully parsed models, e.g. a page of ``list_models``.
+            stats (SyncStats | None): Counts to add to. A new one is created when omitted.
+
+        Returns:
+            SyncStats: The counts, including this write.
+
+        """
+        stats = stats if stats is not None else SyncStats()
+        rows = model_rows(models)
+        ids = [row[0] for row in rows["models"]]
+        conn = self.conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            existing = self._existing_keys(ids)
+            # Children go with their model (ON DELETE CASCADE) and are written anew.
+            conn.executemany("DELETE FROM models WHERE id = ?", [(i,) for i in ids])
+            conn.executemany(
+                "DELETE FROM models_search WHERE rowid = ?", [(i,) for i in ids]
+            )
+            conn.executemany(
+                "INSERT INTO models_search (rowid, name, description, tags)"
+                " VALUES (?, ?, ?, ?)",
+                _search_rows(models),
+            )
+            for table, (key, width) in TABLES.items():
+                table_rows = rows[table]
+                placeholders = ", ".join("?" * width)
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO {table} VALUES ({placeholders})",
+                    table_rows,
+                )
+                keys = {row[: len(key)] for row in table_rows}
+                old = existing[table]
+                stats.inserted[table] += len(keys - old)
+                stats.updated[table] += len(keys & old)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        stats.models += len(ids)
+        return stats
+
+    def _existing_keys(self, ids: list[int]) -> dict[str, set[tuple]]:
+        # Keys of the rows that belong to these models now, in every table.
+        marks = ", ".join("?" * len(ids))
+        versions = _VERSIONS_OF.format(marks)
+        existing = {}
+        for table, (key, _) in TABLES.items():
+            column = _MODEL_COLUMN.get(table)
+            where = (
+                f"{column} IN ({marks})" if column else f"version_id IN ({versions})"
+            )
+            existing[table] = set(
+                self.conn.execute(
+                    f"SELECT {', '.join(key)} FROM {table} WHERE {where}",
+                    ids,
+                )
+            )
+        return existing
+
+    def count(self, table: str = "models") -> int:
+        """Return the number of rows in one of the mirror's tables."""
+        if table not in TABLES:
+            msg = f"Unknown table {table!r}, expected one of {', '.join(TABLES)}"
+            raise ValueError(msg)
+        return self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the connection to the mirror database."""
+        self.conn.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
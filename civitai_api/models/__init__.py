@@ -3,6 +3,7 @@
 This package provides model classes for creators, images, models, model versions, and tags.
 """
 
+from .compact import compact, compact_class, expand
 from .creator import Creator
 from .image import Image, ImageStats
 from .model import BaseModel, Model, ModelCreator, ModelMode, ModelStats, ModelType
@@ -31,4 +32,7 @@ __all__ = [
     "ModelVersionImage",
     "ModelVersionStats",
     "Tag",
+    "compact",
+    "compact_class",
+    "expand",
 ]
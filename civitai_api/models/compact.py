@@ -0,0 +1,170 @@
+"""Compact, slotted variants of the model classes for large in-memory catalogs.
+
+The regular model classes keep their attributes in a per-instance ``__dict__``. Each
+has a slotted variant (``SlottedModel``, ``SlottedModelVersion``, ...) and a frozen,
+slotted one (``FrozenModel``, ...), generated from the same field definitions. Their
+instances store attributes in fixed slots, which takes a fraction of the memory of a
+dict.
+
+``compact`` converts a parsed object, and everything nested in it, to these variants.
+Lazy fields are resolved on the way, since a slotted object has nowhere to keep the
+raw JSON. Strings that repeat across a catalog (base models, file types and formats,
+tags, usernames, hash names) are interned, so every object shares one copy of each.
+Frozen variants hold tuples instead of lists, and reject attribute assignment.
+``expand`` turns a compact object back into the regular classes.
+"""
+
+import dataclasses
+import sys
+from typing import Any
+
+from .creator import Creator
+from .image import Image, ImageStats
+from .model import Model, ModelCreator, ModelStats
+from .model_version import (
+    ModelVersion,
+    ModelVersionFile,
+    ModelVersionImage,
+    ModelVersionStats,
+)
+from .tag import Tag
+
+# Attributes whose strings (or list items, or dict keys) are interned.
+INTERNED: dict[type, tuple[str, ...]] = {
+    Creator: ("username",),
+    Image: ("username",),
+    Model: ("tags",),
+    ModelCreator: ("username",),
+    ModelVersion: ("baseModel", "trainedWords"),
+    ModelVersionFile: (
+        "type",
+        "format",
+        "pickleScanResult",
+        "virusScanResult",
+        "hashes",
+    ),
+    Tag: ("name",),
+}
+
+_SLOTTED: dict[type, type] = {}
+_FROZEN: dict[type, type] = {}
+_REGULAR: dict[type, type] = {}
+
+
+def _variant(cls: type, prefix: str, frozen: bool) -> type:
+    fields = []
+    for f in dataclasses.fields(cls):
+        if f.default is not dataclasses.MISSING:
+            fields.append((f.name, f.type, dataclasses.field(default=f.default)))
+        else:
+            fields.append((f.name, f.type))
+    variant = dataclasses.make_dataclass(
+        prefix + cls.__name__,
+        fields,
+        slots=True,
+        frozen=frozen,
+        namespace={"__doc__": f"{prefix} variant of {cls.__name__}."},
+    )
+    # Published as a module attribute so instances can be pickled.
+    variant.__module__ = __name__
+    globals()[variant.__name__] = variant
+    _REGULAR[variant] = cls
+    return variant
+
+
+for _cls in (
+    Creator,
+    Image,
+    ImageStats,
+    Model,
+    ModelCreator,
+    ModelStats,
+    ModelVersion,
+    ModelVersionFile,
+    ModelVersionImage,
+    ModelVersionStats,
+    Tag,
+):
+    _SLOTTED[_cls] = _variant(_cls, "Slotted", frozen=False)
+    _FROZEN[_cls] = _variant(_cls, "Frozen", frozen=True)
+del _cls
+
+
+def compact_class(cls: type, frozen: bool = False) -> type:
+    """Return the slotted (or frozen) variant of a model class.
+
+    Args:
+        cls (type): A model class, e.g. Model.
+        frozen (bool): Return the frozen variant.
+
+    Returns:
+        type: The variant class.
+
+    Raises:
+        KeyError: If ``cls`` is not a model class.
+
+    """
+    return (_FROZEN if frozen else _SLOTTED)[_REGULAR.get(cls, cls)]
+
+
+def compact(obj: Any, frozen: bool = False, intern: bool = True) -> Any:
+    """Convert a model object, and everything nested in it, to the slotted variants.
+
+    Args:
+        obj (Any): A model object, or a list of them.
+        frozen (bool): Use the frozen variants, with tuples in place of lists.
+        intern (bool): Intern the strings listed in ``INTERNED``.
+
+    Returns:
+        Any: The compact copy. Values other than model objects and lists are returned as is.
+
+    """
+    cls = type(obj)
+    if cls is list or cls is tuple:
+        items = [compact(item, frozen, intern) for item in obj]
+        return tuple(items) if frozen else items
+    regular = _REGULAR.get(cls, cls)
+    variants = _FROZEN if frozen else _SLOTTED
+    if regular not in variants:
+        return obj
+    interned = INTERNED.get(regular, ()) if intern else ()
+    values = {}
+    for f in dataclasses.fields(regular):
+        value = compact(getattr(obj, f.name), frozen, intern)
+        if f.name in interned:
+            value = _intern(value)
+        values[f.name] = value
+    return variants[regular](**values)
+
+
+def expand(obj: Any) -> Any:
+    """Convert a compact object, and everything nested in it, back to the regular classes.
+
+    Args:
+        obj (Any): A compact object, or a list or tuple of them.
+
+    Returns:
+        Any: The regular copy, with lists in place of tuples.
+
+    """
+    cls = type(obj)
+    if cls is list or cls is tuple:
+        return [expand(item) for item in obj]
+    regular = _REGULAR.get(cls)
+    if regular is None:
+        return obj
+    return regular(
+        **{f.name: expand(getattr(obj, f.name)) for f in dataclasses.fields(regular)}
+    )
+
+
+def _intern(value: Any) -> Any:
+    if type(value) is str:
+        return sys.intern(value)
+    if type(value) is list:
+        return [_intern(item) for item in value]
+    if type(value) is tuple:
+        return tuple(_intern(item) for item in value)
+    if type(value) is dict:
+        return {_intern(key): item for key, item in value.items()}
+    return value
@@ -0,0 +1,81 @@
+"""Deferred parsing of nested fields.
+
+A dataclass field made lazy with ``lazy_fields`` can be given a Deferred instead of its
+value. The raw JSON is then kept as is, and only turned into objects the first time the
+attribute is read, after which the parsed value replaces it. Attribute access,
+assignment, equality, repr, ``dataclasses.asdict`` and ``dataclasses.replace`` all see
+the parsed value, so a lazy field behaves like a plain one apart from when the work
+happens.
+
+``lazy_fields`` installs the descriptors after ``dataclass`` has built the class, so
+the fields themselves stay plain fields without a default.
+"""
+
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T", bound=type)
+
+
+class Deferred:
+    """Raw JSON waiting to be parsed into a field's value.
+
+    Attributes:
+        parse (Callable[[Any], Any]): Builds the value from ``raw``.
+        raw (Any): The raw JSON.
+
+    """
+
+    __slots__ = ("parse", "raw")
+
+    def __init__(self, parse: Callable[[Any], Any], raw: Any) -> None:
+        self.parse = parse
+        self.raw = raw
+
+    def __repr__(self) -> str:
+        return f"Deferred({self.parse.__name__})"
+
+
+class LazyField:
+    """Descriptor of a dataclass field that resolves a Deferred value on first read.
+
+    Attributes:
+        name (str): The field's name, also its key in the instance ``__dict__``.
+
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj: object | None, objtype: type | None = None) -> Any:
+        if obj is None:
+            return self
+        value = obj.__dict__[self.name]
+        if type(value) is Deferred:
+            value = obj.__dict__[self.name] = value.parse(value.raw)
+        return value
+
+    def __set__(self, obj: object, value: Any) -> None:
+        obj.__dict__[self.name] = value
+
+
+def lazy_fields(*names: str) -> Callable[[T], T]:
+    """Return a class decorator making the named fields of a dataclass lazy.
+
+    Apply it above ``@dataclass``, so the descriptors are installed on the finished
+    class and ``dataclass`` sees ordinary fields.
+
+    Args:
+        *names (str): Fields that may be given a Deferred value.
+
+    Returns:
+        Callable[[T], T]: The decorator, returning the class it is given.
+
+    """
+
+    def install(cls: T) -> T:
+        for name in names:
+            setattr(cls, name, LazyField(name))
+        return cls
+
+    return install
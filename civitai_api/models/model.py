@@ -6,6 +6,8 @@ This module defines classes for model types, creators, statistics, versions, and
 from dataclasses import dataclass
 from enum import Enum
 
+from .lazy import lazy_fields
+
 
 class ModelType(Enum):
     """Enumeration of supported model types in the Civitai API.
@@ -79,6 +81,7 @@ class ModelMode(Enum):
     TAKEN_DOWN = "TakenDown"
 
 
+@lazy_fields("modelVersions")
 @dataclass
 class Model:
     """Represents a Civitai model with its metadata, creator, statistics, and versions.
@@ -92,8 +95,12 @@ class Model:
         tags (List[str]): List of tags associated with the model.
         creator (ModelCreator): Creator information.
         stats (ModelStats): Model statistics.
-        modelVersions (List[ModelVersion]): Available versions of the model.
+        modelVersions (List[ModelVersion]): Available versions of the model, parsed on first access.
         mode (Optional[ModelMode]): Mode of the model (e.g., archived, taken down).
+        allowNoCredit (Optional[bool]): Whether the model may be used without crediting the creator.
+        allowCommercialUse (Optional[list[str]]): Commercial uses the license allows, e.g. ``["Image", "Sell"]``.
+        allowDerivatives (Optional[bool]): Whether derivatives of the model may be shared.
+        allowDifferentLicense (Optional[bool]): Whether derivatives may use a different license.
 
     """
 
@@ -107,6 +114,10 @@ class Model:
     stats: ModelStats
     modelVersions: list[ModelVersion]
     mode: ModelMode | None = None
+    allowNoCredit: bool | None = None
+    allowCommercialUse: list[str] | None = None
+    allowDerivatives: bool | None = None
+    allowDifferentLicense: bool | None = None
 
 
 class BaseModel(Enum):
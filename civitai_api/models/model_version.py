@@ -8,6 +8,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
+from .lazy import lazy_fields
+
 
 @dataclass
 class ModelVersionFile:
@@ -81,6 +83,7 @@ class ModelVersionStats:
     rating: float
 
 
+@lazy_fields("files", "images")
 @dataclass
 class ModelVersion:
     """Represents a version of a model in the Civitai API.
@@ -93,8 +96,8 @@ class ModelVersion:
         downloadUrl (str): The download URL for the model version.
         trainedWords (list[str]): Words the model was trained on.
         baseModel (str): The base model used.
-        files (list[ModelVersionFile]): Files associated with the model version.
-        images (list[ModelVersionImage]): Images associated with the model version.
+        files (list[ModelVersionFile]): Files associated with the model version, parsed on first access.
+        images (list[ModelVersionImage]): Images associated with the model version, parsed on first access.
         stats (ModelVersionStats): Statistics for the model version.
 
     """
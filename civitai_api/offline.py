@@ -0,0 +1,414 @@
+"""Offline queries over a local ModelMirror.
+
+OfflineModels answers ``list_models`` and ``get_model`` from the mirror's indexed
+tables, taking the same arguments as ModelsAPI, and returns the same Model dataclasses.
+Free-text queries use the mirror's FTS5 index of names, descriptions and tags; each
+word is matched as a prefix, so partial input (``"synthw"``) already finds models.
+
+A few filters can only be approximated from the catalog data:
+
+- ``categories`` match the equally named tags, which is how Civitai tags categories.
+- ``period`` keeps models with a version created within the period. The API instead
+  ranks by stats of that period, which the mirror does not have.
+- ``favorites`` and ``hidden`` depend on the signed-in user and raise a ValueError.
+"""
+
+import json
+import re
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from .api.models import (
+    CommercialUse,
+    ModelCategory,
+    ModelPeriod,
+    ModelSort,
+)
+from .mirror import ModelMirror
+from .models.model import (
+    BaseModel,
+    Model,
+    ModelCreator,
+    ModelMode,
+    ModelStats,
+    ModelType,
+)
+from .models.model_version import (
+    ModelVersion,
+    ModelVersionFile,
+    ModelVersionImage,
+    ModelVersionStats,
+)
+from .timestamps import parse_timestamp
+
+_PERIODS = {
+    ModelPeriod.DAY: timedelta(days=1),
+    ModelPeriod.WEEK: timedelta(weeks=1),
+    ModelPeriod.MONTH: timedelta(days=30),
+    ModelPeriod.YEAR: timedelta(days=365),
+}
+
+_ORDER = {
+    ModelSort.NEWEST: "m.id DESC",
+    ModelSort.MOST_DOWNLOADED: "s.download_count DESC, m.id DESC",
+    ModelSort.HIGHEST_RATED: "s.rating DESC, s.rating_count DESC, m.id DESC",
+}
+
+_WORD = re.compile(r"\w+")
+
+
+def search_query(text: str) -> str | None:
+    """Turn free text into an FTS5 query matching every word as a prefix.
+
+    Args:
+        text (str): The user's search text. FTS5 syntax in it is not interpreted.
+
+    Returns:
+        str | None: The FTS5 query, or None if ``text`` has no words.
+
+    """
+    words = _WORD.findall(text)
+    return " ".join(f'"{word}"*' for word in words) if words else None
+
+
+def _marks(values: list) -> str:
+    return ", ".join("?" * len(values))
+
+
+def _bool(value: Any) -> bool | None:
+    return bool(value) if value is not None else None
+
+
+def _loads(value: str | None) -> Any:
+    return json.loads(value) if value is not None else None
+
+
+def _timestamp(value: str | None) -> datetime | None:
+    return parse_timestamp(value) if value is not None else None
+
+
+class OfflineModels:
+    """Read-only counterpart of ModelsAPI answering from a ModelMirror.
+
+    Attributes:
+        mirror (ModelMirror): The mirror queried.
+
+    """
+
+    def __init__(self, mirror: ModelMirror) -> None:
+        """Query ``mirror``.
+
+        Args:
+            mirror (ModelMirror): The mirror to query, usually kept current by ``sync``.
+
+        """
+        self.mirror = mirror
+
+    def list_models(
+        self,
+        limit: int | None = 100,
+        page: int | None = 1,
+        query: str | None = None,
+        tag: str | None = None,
+        username: str | None = None,
+        types: list[ModelType] | None = None,
+        sort: ModelSort | None = None,
+        period: ModelPeriod | None = None,
+        rating: int | None = None,
+        favorites: bool | None = None,
+        hidden: bool | None = None,
+        primary_file_only: bool | None = None,
+        allow_no_credit: bool | None = None,
+        allow_derivatives: bool | None = None,
+        allow_different_licenses: bool | None = None,
+        base_models: list[BaseModel] | None = None,
+        categories: list[ModelCategory] | None = None,
+        allow_commercial_use: list[CommercialUse] | None = None,
+    ) -> list[Model]:
+        """Return one page of the mirrored models matching the filters.
+
+        Takes the arguments of ModelsAPI.list_models (see the module docstring for
+        the approximated ones) and returns the page instead of iterating over pages.
+
+        Args:
+            limit (int | None): Models per page.
+            page (int | None): The page to return, from 1.
+            query (str | None): Free text matched against names, descriptions and tags.
+            tag (str | None): Only models with this tag, ignoring case.
+            username (str | None): Only models by this creator.
+            types (list[ModelType] | None): Only models of these types.
+            sort (ModelSort | None): Order of the results. None orders by relevance to ``query``, or newest first without one.
+            period (ModelPeriod | None): Only models with a version created within the period.
+            rating (int | None): Only models rated at least this.
+            favorites (bool | None): Not available offline; True raises a ValueError.
+            hidden (bool | None): Not available offline; True raises a ValueError.
+            primary_file_only (bool | None): Only include the primary file of each version.
+            allow_no_credit (bool | None): Only models whose license has this setting.
+            allow_derivatives (bool | None): Only models whose license has this setting.
+            allow_different_licenses (bool | None): Only models whose license has this setting.
+            base_models (list[BaseModel] | None): Only models with a version for one of these base models.
+            categories (list[ModelCategory] | None): Only models tagged with one of these categories.
+            allow_commercial_use (list[CommercialUse] | None): Only models allowing one of these commercial uses.
+
+        Returns:
+            list[Model]: The models of the page, in order.
+
+        Raises:
+            ValueError: If ``favorites`` or ``hidden`` is set, which need the signed-in API.
+
+        """
+        if favorites or hidden:
+            msg = "favorites and hidden depend on the signed-in user; use the API"
+            raise ValueError(msg)
+        joins = ["LEFT JOIN model_stats AS s ON s.model_id = m.id"]
+        where: list[str] = []
+        params: list[Any] = []
+
+        search = search_query(query) if query else None
+        if query and search is None:
+            return []
+        if search is not None:
+            joins.insert(
+                0,
+                "JOIN (SELECT rowid AS id, rank FROM models_search"
+                " WHERE models_search MATCH ?) AS f ON f.id = m.id",
+            )
+            params.append(search)
+        if tag is not None:
+            where.append("m.id IN (SELECT model_id FROM model_tags WHERE tag = ?)")
+            params.append(tag)
+        if username is not None:
+            where.append("m.creator_username = ?")
+            params.append(username)
+        if types:
+            where.append(f"m.type IN ({_marks(types)})")
+            params.extend(t.value for t in types)
+        if period in _PERIODS:
+            cutoff = datetime.now(UTC) - _PERIODS[period]
+            where.append(
+                "m.id IN (SELECT model_id FROM model_versions WHERE created_at >= ?)"
+            )
+            params.append(cutoff.isoformat())
+        if rating is not None:
+            where.append("s.rating >= ?")
+            params.append(rating)
+        for column, value in (
+            ("allow_no_credit", allow_no_credit),
+            ("allow_derivatives", allow_derivatives),
+            ("allow_different_license", allow_different_licenses),
+        ):
+            if value is not None:
+                where.append(f"m.{column} = ?")
+                params.append(int(value))
+        if base_models:
+            where.append(
+                "m.id IN (SELECT model_id FROM model_versions"
+                f" WHERE base_model IN ({_marks(base_models)}))"
+            )
+            params.extend(b.value for b in base_models)
+        if categories:
+            where.append(
+                "m.id IN (SELECT model_id FROM model_tags"
+                f" WHERE tag IN ({_marks(categories)}))"
+            )
+            params.extend(c.value for c in categories)
+        if allow_commercial_use:
+            where.append(
+                "EXISTS (SELECT 1 FROM json_each(m.allow_commercial_use)"
+                f" WHERE value IN ({_marks(allow_commercial_use)}))"
+            )
+            params.extend(u.value for u in allow_commercial_use)
+
+        if sort is not None:
+            order = _ORDER[sort]
+        else:
+            order = (
+                "f.rank, m.id DESC" if search is not None else _ORDER[ModelSort.NEWEST]
+            )
+        limit = 100 if limit is None else limit
+        page = 1 if page is None else page
+        sql = (
+            f"SELECT m.id FROM models AS m {' '.join(joins)}"
+            + (f" WHERE {' AND '.join(where)}" if where else "")
+            + f" ORDER BY {order} LIMIT ? OFFSET ?"
+        )
+        params += [limit, (page - 1) * limit]
+        ids = [row[0] for row in self.mirror.conn.execute(sql, params)]
+        return self._load(ids, primary_file_only=bool(primary_file_only))
+
+    def get_model(self, model_id: int) -> Model | None:
+        """Return the mirrored model with this ID, or None if the mirror does not have it."""
+        models = self._load([model_id])
+        return models[0] if models else None
+
+    def _load(self, ids: list[int], primary_file_only: bool = False) -> list[Model]:
+        # Builds the models, in the order of ``ids``, with one query per table.
+        if not ids:
+            return []
+        conn = self.mirror.conn
+        marks = _marks(ids)
+
+        def rows(sql: str) -> list[tuple]:
+            return conn.execute(sql.format(marks=marks), ids).fetchall()
+
+        tags: dict[int, list[str]] = {}
+        for model_id, tag in rows(
+            "SELECT model_id, tag FROM model_tags WHERE model_id IN ({marks})"
+            " ORDER BY model_id, position"
+        ):
+            tags.setdefault(model_id, []).append(tag)
+        stats = {
+            model_id: ModelStats(
+                downloadCount=download_count,
+                favoriteCount=favorite_count,
+                commentCount=comment_count,
+                ratingCount=rating_count,
+                rating=rating,
+            )
+            for (
+                model_id,
+                download_count,
+                favorite_count,
+                comment_count,
+                rating_count,
+                rating,
+            ) in rows(
+                "SELECT model_id, download_count, favorite_count, comment_count,"
+                " rating_count, rating FROM model_stats WHERE model_id IN ({marks})"
+            )
+        }
+        version_rows = rows(
+            "SELECT id, model_id, name, created_at, download_url, trained_words,"
+            " base_model FROM model_versions WHERE model_id IN ({marks})"
+            " ORDER BY model_id, position"
+        )
+        version_ids = [row[0] for row in version_rows]
+        version_marks = _marks(version_ids)
+        version_stats = {
+            version_id: ModelVersionStats(
+                downloadCount=download_count, ratingCount=rating_count, rating=rating
+            )
+            for version_id, download_count, rating_count, rating in conn.execute(
+                "SELECT version_id, download_count, rating_count, rating"
+                f" FROM version_stats WHERE version_id IN ({version_marks})",
+                version_ids,
+            )
+        }
+        files: dict[int, list[ModelVersionFile]] = {}
+        for (
+            file_id,
+            version_id,
+            name,
+            size_kb,
+            file_type,
+            file_format,
+            pickle_scan_result,
+            pickle_scan_message,
+            virus_scan_result,
+            scanned_at,
+            hashes,
+            download_url,
+            is_primary,
+        ) in conn.execute(
+            "SELECT id, version_id, name, size_kb, type, format, pickle_scan_result,"
+            " pickle_scan_message, virus_scan_result, scanned_at, hashes,"
+            f" download_url, is_primary FROM files WHERE version_id IN ({version_marks})"
+            + (" AND is_primary" if primary_file_only else "")
+            + " ORDER BY version_id, position",
+            version_ids,
+        ):
+            files.setdefault(version_id, []).append(
+                ModelVersionFile(
+                    id=file_id,
+                    name=name,
+                    sizeKb=size_kb,
+                    type=file_type,
+                    format=file_format,
+                    pickleScanResult=pickle_scan_result,
+                    pickleScanMessage=pickle_scan_message,
+                    virusScanResult=virus_scan_result,
+                    scannedAt=_timestamp(scanned_at),
+                    hashes=_loads(hashes),
+                    downloadUrl=download_url,
+                    primary=_bool(is_primary),
+                )
+            )
+        images: dict[int, list[ModelVersionImage]] = {}
+        for version_id, url, nsfw, width, height, image_hash, meta in conn.execute(
+            "SELECT version_id, url, nsfw, width, height, hash, meta FROM images"
+            f" WHERE version_id IN ({version_marks}) ORDER BY version_id, position",
+            version_ids,
+        ):
+            images.setdefault(version_id, []).append(
+                ModelVersionImage(
+                    url=url,
+                    nsfw=_bool(nsfw),
+                    width=width,
+                    height=height,
+                    hash=image_hash,
+                    meta=_loads(meta),
+                )
+            )
+        versions: dict[int, list[ModelVersion]] = {}
+        for (
+            version_id,
+            model_id,
+            name,
+            created_at,
+            download_url,
+            trained_words,
+            base_model,
+        ) in version_rows:
+            versions.setdefault(model_id, []).append(
+                ModelVersion(
+                    id=version_id,
+                    modelId=model_id,
+                    name=name,
+                    createdAt=_timestamp(created_at),
+                    downloadUrl=download_url,
+                    trainedWords=_loads(trained_words),
+                    baseModel=base_model,
+                    files=files.get(version_id, []),
+                    # As parsed from the API, a version without images has None.
+                    images=images.get(version_id),
+                    stats=version_stats.get(version_id),
+                )
+            )
+
+        models = {}
+        for (
+            model_id,
+            name,
+            description,
+            model_type,
+            nsfw,
+            mode,
+            creator_username,
+            creator_image,
+            allow_no_credit,
+            allow_commercial_use,
+            allow_derivatives,
+            allow_different_license,
+        ) in rows(
+            "SELECT id, name, description, type, nsfw, mode, creator_username,"
+            " creator_image, allow_no_credit, allow_commercial_use,"
+            " allow_derivatives, allow_different_license"
+            " FROM models WHERE id IN ({marks})"
+        ):
+            models[model_id] = Model(
+                id=model_id,
+                name=name,
+                description=description,
+                type=ModelType(model_type),
+                nsfw=_bool(nsfw),
+                tags=tags.get(model_id, []),
+                creator=ModelCreator(username=creator_username, image=creator_image),
+                stats=stats.get(model_id),
+                modelVersions=versions.get(model_id, []),
+                mode=ModelMode(mode) if mode else None,
+                allowNoCredit=_bool(allow_no_credit),
+                allowCommercialUse=_loads(allow_commercial_use),
+                allowDerivatives=_bool(allow_derivatives),
+                allowDifferentLicense=_bool(allow_different_license),
+            )
+        return [models[i] for i in ids if i in models]
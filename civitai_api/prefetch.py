@@ -0,0 +1,130 @@
+"""Read-ahead for paginated iterators.
+
+Pagination is sequential: the URL of page N+1 is only known from page N. Without
+read-ahead, the network round trip for the next page waits until the consumer has
+finished with the current one. ``read_ahead`` drives the page iterator from a
+background thread (or task), keeping up to ``depth`` pages ready. A crawl then runs at
+roughly the pace of the slower of fetching and processing, not of both added together.
+Pages still come out in order, and errors surface where the page would have been.
+"""
+
+import asyncio
+import contextlib
+import queue
+import threading
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from typing import TypeVar
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+class _Failure:
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+def read_ahead(items: Iterable[T], depth: int = 1) -> Iterator[T]:
+    """Iterate ``items`` on a background thread, keeping up to ``depth`` items ready.
+
+    Args:
+        items (Iterable[T]): The iterable to drive, e.g. a page generator.
+        depth (int): Number of items fetched ahead of the consumer.
+
+    Yields:
+        T: The items of ``items``, in order.
+
+    """
+    buffer: queue.SimpleQueue = queue.SimpleQueue()
+    slots = threading.Semaphore(depth)
+    stop = threading.Event()
+
+    def produce() -> None:
+        iterator = iter(items)
+        try:
+            while True:
+                while not slots.acquire(timeout=0.1):
+                    if stop.is_set():
+                        return
+                if stop.is_set():
+                    return
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    buffer.put(_DONE)
+                    return
+                buffer.put(item)
+        except BaseException as e:  # noqa: BLE001 - re-raised in the consumer
+            buffer.put(_Failure(e))
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    threading.Thread(target=produce, daemon=True).start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            slots.release()
+            yield item
+    finally:
+        stop.set()
+
+
+async def read_ahead_async(items: AsyncIterable[T], depth: int = 1) -> AsyncIterator[T]:
+    """Iterate ``items`` in a background task, keeping up to ``depth`` items ready.
+
+    Args:
+        items (AsyncIterable[T]): The async iterable to drive, e.g. a page generator.
+        depth (int): Number of items fetched ahead of the consumer.
+
+    Yields:
+        T: The items of ``items``, in order.
+
+    """
+    buffer: asyncio.Queue = asyncio.Queue()
+    slots = asyncio.Semaphore(depth)
+
+    async def produce() -> None:
+        iterator = aiter(items)
+        try:
+            while True:
+                await slots.acquire()
+                try:
+                    item = await anext(iterator)
+                except StopAsyncIteration:
+                    await buffer.put(_DONE)
+                    return
+                await buffer.put(item)
+        except asyncio.CancelledError:
+            raise
+        except BaseException as e:  # noqa: BLE001 - re-raised in the consumer
+            await buffer.put(_Failure(e))
+        finally:
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    task = asyncio.ensure_future(produce())
+    try:
+        while True:
+            item = await buffer.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            slots.release()
+            yield item
+    finally:
+        # Wait for the producer to close ``items``, e.g. a page generator holding a
+        # response open, instead of leaving it to the garbage collector.
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
@@ -0,0 +1,133 @@
+"""Field projections for parsed API objects.
+
+A projection lists the attributes to build, using dots for nested objects, e.g.
+``["id", "name", "stats.downloadCount", "modelVersions.files.hashes"]``. Attributes
+left out are set to None without being parsed, which saves both the parsing work and
+the memory of large values such as ``description`` HTML or image ``meta``.
+
+Parsers describe each class as a table of builders, one per attribute. A builder
+takes the raw item and the projection below that attribute, which is None when the
+whole value is wanted.
+"""
+
+from collections.abc import Callable, Iterable
+from functools import lru_cache
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+Projection = dict[str, "Projection"]
+Builders = dict[str, Callable[[dict, "Projection | None"], Any]]
+
+
+def parse_fields(fields: Iterable[str] | None) -> Projection | None:
+    """Turn dotted field names into a projection tree.
+
+    Args:
+        fields (Iterable[str] | None): Dotted attribute names, or None for every attribute.
+
+    Returns:
+        Projection | None: Nested dict of attribute names, where an empty dict selects the whole value.
+
+    """
+    if fields is None:
+        return None
+    tree: Projection = {}
+    for field in fields:
+        node = tree
+        parts = field.split(".")
+        for i, part in enumerate(parts):
+            if part in node and not node[part]:
+                break  # Already selected whole.
+            last = i == len(parts) - 1
+            node = node.setdefault(part, {})
+            if last:
+                node.clear()
+    return tree
+
+
+def fields_key(fields: Iterable[str] | None) -> str:
+    """Return a canonical string for a projection, for use in cache keys."""
+    return ",".join(sorted(fields)) if fields is not None else ""
+
+
+def projected(
+    parse: Callable[..., T], fields: Iterable[str] | None
+) -> Callable[..., T]:
+    """Return ``parse`` bound to a projection.
+
+    Bindings of the same parser to the same fields compare equal, so results memoised
+    per parser (see HTTPCache.parsed) are shared between calls.
+
+    Args:
+        parse (Callable[..., T]): A parser taking the raw item and a ``fields`` projection.
+        fields (Iterable[str] | None): Dotted attribute names, or None for every attribute.
+
+    Returns:
+        Callable[..., T]: A parser taking only the raw item.
+
+    """
+    if fields is None:
+        return parse
+    return _Projected(parse, fields_key(fields))
+
+
+class _Projected(Generic[T]):
+    """A parser bound to a projection, equal to other bindings of the same fields."""
+
+    __slots__ = ("_fields", "_key", "_parse")
+
+    def __init__(self, parse: Callable[..., T], key: str) -> None:
+        self._parse = parse
+        self._key = key
+        self._fields = _projection(key)
+
+    def __call__(self, item: Any) -> T:
+        return self._parse(item, fields=self._fields)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, _Projected):
+            return NotImplemented
+        return self._parse == other._parse and self._key == other._key
+
+    def __hash__(self) -> int:
+        return hash((self._parse, self._key))
+
+
+@lru_cache(maxsize=256)
+def _projection(key: str) -> Projection:
+    # Keyed on the fields alone: caching parsers here would keep bound methods, and
+    # through them their API instances and sessions, alive.
+    return parse_fields(key.split(",") if key else [])
+
+
+def build(
+    cls: type[T], item: dict, projection: Projection | None, builders: Builders
+) -> T:
+    """Build ``cls`` from a raw item, running only the builders the projection selects.
+
+    Args:
+        cls (type[T]): The class to instantiate.
+        item (dict): The raw API item.
+        projection (Projection | None): Attributes to build. None builds them all.
+        builders (Builders): Builder for each attribute of ``cls``.
+
+    Returns:
+        T: The new object, with attributes outside the projection set to None.
+
+    Raises:
+        ValueError: If the projection names attributes ``cls`` does not have.
+
+    """
+    if projection is None:
+        return cls(**{name: make(item, None) for name, make in builders.items()})
+    unknown = projection.keys() - builders.keys()
+    if unknown:
+        msg = f"Unknown fields for {cls.__name__}: {', '.join(sorted(unknown))}"
+        raise ValueError(msg)
+    return cls(
+        **{
+            name: make(item, projection[name] or None) if name in projection else None
+            for name, make in builders.items()
+        }
+    )
@@ -0,0 +1,188 @@
+"""Client-side token-bucket rate limiting for the Civitai API.
+
+A RateLimiter is shared by every endpoint API of a client. It spaces requests to a
+requests-per-second budget, pauses everyone when the server answers 429 with a
+``Retry-After`` (or reports an exhausted rate-limit window), and adapts the budget:
+it halves on every 429 and creeps back up to the configured rate on success.
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable, Mapping
+from email.utils import parsedate_to_datetime
+
+# Header names checked, in order, for the remaining requests / reset time of the current window.
+_REMAINING_HEADERS = ("X-RateLimit-Remaining", "RateLimit-Remaining")
+_RESET_HEADERS = ("X-RateLimit-Reset", "RateLimit-Reset")
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> float | None:
+    """Return the number of seconds a ``Retry-After`` header asks to wait.
+
+    Args:
+        headers (Mapping[str, str]): Response headers.
+
+    Returns:
+        float | None: Seconds to wait, or None if the header is missing or malformed.
+
+    """
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_reset(headers: Mapping[str, str]) -> float | None:
+    """Return seconds until the rate-limit window resets (delta or epoch formats)."""
+    for name in _RESET_HEADERS:
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            reset = float(value)
+        except ValueError:
+            return None
+        # Values this large are epoch timestamps rather than deltas.
+        return max(0.0, reset - time.time()) if reset > 1e9 else max(0.0, reset)
+    return None
+
+
+def _parse_remaining(headers: Mapping[str, str]) -> int | None:
+    for name in _REMAINING_HEADERS:
+        value = headers.get(name)
+        if value is not None:
+            try:
+                return int(float(value))
+            except ValueError:
+                return None
+    return None
+
+
+class RateLimiter:
+    """Thread-safe token bucket with adaptive budget.
+
+    Attributes:
+        rate (float): Current requests-per-second budget.
+        max_rate (float): Configured budget the limiter recovers to.
+        burst (int): Maximum number of requests sent back to back.
+
+    """
+
+    DECREASE_FACTOR = 0.5
+    INCREASE_FRACTION = 0.02
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        min_rate: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create a token bucket.
+
+        Args:
+            rate (float): Requests-per-second budget.
+            burst (int): Bucket size, i.e. requests that may be sent without spacing.
+            min_rate (float | None): Floor the budget never drops below. Defaults to 5% of ``rate``.
+            clock (Callable[[], float]): Monotonic clock, overridable in tests.
+
+        """
+        if rate <= 0 or burst < 1:
+            msg = "rate must be positive and burst at least 1"
+            raise ValueError(msg)
+        self.rate = float(rate)
+        self.max_rate = float(rate)
+        self.min_rate = min_rate if min_rate is not None else rate * 0.05
+        self.burst = burst
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = clock()
+
+    def _refill(self, now: float) -> None:
+        if now > self._updated:
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Take tokens and return how many seconds the caller must wait before sending.
+
+        Args:
+            tokens (float): Tokens to take, e.g. one per request or one per byte.
+
+        Returns:
+            float: Seconds to wait; 0 when the tokens were available immediately.
+
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= tokens
+            wait = max(0.0, self._updated - now)
+            if self._tokens < 0:
+                wait += -self._tokens / self.rate
+            return wait
+
+    def acquire(self, tokens: float = 1) -> None:
+        """Block the calling thread until a request (or ``tokens`` worth) may be sent."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens: float = 1) -> None:
+        """Wait, without blocking the event loop, until a request (or ``tokens`` worth) may be sent."""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for ``seconds`` and start refilling from empty afterwards."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens = min(self._tokens, 0.0)
+            self._updated = max(self._updated, now + seconds)
+
+    def observe(self, status_code: int, headers: Mapping[str, str]) -> float | None:
+        """Adjust the budget from a response.
+
+        Args:
+            status_code (int): HTTP status of the response.
+            headers (Mapping[str, str]): Response headers.
+
+        Returns:
+            float | None: Seconds the server asked to wait, if it did.
+
+        """
+        wait = None
+        if status_code == 429:
+            wait = parse_retry_after(headers)
+            if wait is None:
+                wait = _parse_reset(headers)
+            if wait is None:
+                wait = 1 / self.rate
+            with self._lock:
+                self.rate = max(self.min_rate, self.rate * self.DECREASE_FACTOR)
+            self.pause(wait)
+            return wait
+
+        if _parse_remaining(headers) == 0:
+            wait = _parse_reset(headers)
+            if wait:
+                self.pause(wait)
+        if 200 <= status_code < 300 and self.rate < self.max_rate:
+            with self._lock:
+                self.rate = min(
+                    self.max_rate, self.rate + self.max_rate * self.INCREASE_FRACTION
+                )
+        return wait
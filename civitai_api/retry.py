@@ -0,0 +1,213 @@
+"""Retry policy for transient Civitai API failures.
+
+A RetryPolicy decides which failures are retried (by status code, exception type and
+HTTP method), how long to back off between attempts (exponential with decorrelated
+jitter), and, through a RetryBudget shared by every endpoint API of a client, caps
+retries to a fraction of recent traffic so that retries cannot amplify an outage.
+"""
+
+import random
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import requests
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the async extra
+    httpx = None
+
+DEFAULT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+DEFAULT_RETRY_EXCEPTIONS: tuple[type[BaseException], ...] = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+if httpx is not None:
+    DEFAULT_RETRY_EXCEPTIONS += (httpx.TransportError,)
+
+# Methods that can be repeated without changing the outcome on the server.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+@dataclass
+class RetryEvent:
+    """Describes one retry, passed to the ``on_retry`` hook.
+
+    Attributes:
+        method (str): HTTP method of the retried request.
+        url (str): URL of the retried request.
+        attempt (int): Number of the attempt that failed, starting at 1.
+        delay (float): Seconds slept before the next attempt.
+        status_code (int | None): Status of the failed response, if one was received.
+        exception (BaseException | None): Exception raised by the failed attempt, if any.
+
+    """
+
+    method: str
+    url: str
+    attempt: int
+    delay: float
+    status_code: int | None = None
+    exception: BaseException | None = None
+
+
+class RetryBudget:
+    """Token bucket limiting retries to a fraction of requests.
+
+    Every request deposits ``ratio`` tokens and every retry spends one. A trickle of
+    ``min_per_second`` tokens keeps retries possible when traffic is low.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_per_second: float = 1.0,
+        max_balance: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create a retry budget.
+
+        Args:
+            ratio (float): Retries allowed per request sent.
+            min_per_second (float): Retries allowed per second regardless of traffic.
+            max_balance (float): Maximum retries that can be saved up.
+            clock (Callable[[], float]): Monotonic clock, overridable in tests.
+
+        """
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_balance = max_balance
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._balance = max_balance
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._balance = min(
+            self.max_balance,
+            self._balance + (now - self._updated) * self.min_per_second,
+        )
+        self._updated = now
+
+    def deposit(self) -> None:
+        """Record a request sent."""
+        with self._lock:
+            self._refill()
+            self._balance = min(self.max_balance, self._balance + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Spend one retry if the budget allows it.
+
+        Returns:
+            bool: True if the retry may go ahead.
+
+        """
+        with self._lock:
+            self._refill()
+            if self._balance < 1:
+                return False
+            self._balance -= 1
+            return True
+
+
+class RetryPolicy:
+    """Decides whether and when a failed request is retried.
+
+    Attributes:
+        retries (int): Total number of retries performed under this policy.
+
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        retry_statuses: frozenset[int] = DEFAULT_RETRY_STATUSES,
+        retry_exceptions: tuple[type[BaseException], ...] = DEFAULT_RETRY_EXCEPTIONS,
+        retry_methods: frozenset[str] = IDEMPOTENT_METHODS,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 30.0,
+        budget: RetryBudget | None = None,
+        on_retry: Callable[[RetryEvent], None] | None = None,
+    ) -> None:
+        """Create a retry policy.
+
+        Args:
+            max_attempts (int): Attempts per request, including the first. 1 disables retries.
+            retry_statuses (frozenset[int]): Response statuses that are retried.
+            retry_exceptions (tuple[type[BaseException], ...]): Exceptions that are retried.
+            retry_methods (frozenset[str]): HTTP methods that may be retried. Defaults to the idempotent ones.
+            backoff_base (float): Minimum delay between attempts, in seconds.
+            backoff_cap (float): Maximum delay between attempts, in seconds.
+            budget (RetryBudget | None): Budget shared by all requests under this policy. A default one is created when omitted.
+            on_retry (Callable[[RetryEvent], None] | None): Called before sleeping for each retry.
+
+        """
+        self.max_attempts = max_attempts
+        self.retry_statuses = retry_statuses
+        self.retry_exceptions = retry_exceptions
+        self.retry_methods = retry_methods
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.budget = budget if budget is not None else RetryBudget()
+        self.on_retry = on_retry
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    def record_request(self) -> None:
+        """Record an attempt sent, which earns retry budget."""
+        self.budget.deposit()
+
+    def should_retry(
+        self,
+        method: str,
+        attempt: int,
+        status_code: int | None = None,
+        exception: BaseException | None = None,
+    ) -> bool:
+        """Decide whether a failed attempt is retried, spending budget if so.
+
+        Args:
+            method (str): HTTP method of the request.
+            attempt (int): Number of the attempt that just failed, starting at 1.
+            status_code (int | None): Status of the response, if one was received.
+            exception (BaseException | None): Exception raised by the attempt, if any.
+
+        Returns:
+            bool: True if the request should be sent again.
+
+        """
+        if attempt >= self.max_attempts or method.upper() not in self.retry_methods:
+            return False
+        if exception is not None:
+            retryable = isinstance(exception, self.retry_exceptions)
+        else:
+            retryable = status_code in self.retry_statuses
+        return retryable and self.budget.withdraw()
+
+    def backoff(self, previous: float | None) -> float:
+        """Return the next delay using decorrelated jitter.
+
+        Args:
+            previous (float | None): The previous delay, or None before the first retry.
+
+        Returns:
+            float: Seconds to wait before the next attempt.
+
+        """
+        if previous is None:
+            previous = self.backoff_base
+        return min(
+            self.backoff_cap,
+            random.uniform(self.backoff_base, previous * 3),
+        )
+
+    def notify(self, event: RetryEvent) -> None:
+        """Count a retry and pass it to the ``on_retry`` hook."""
+        with self._lock:
+            self.retries += 1
+        if self.on_retry is not None:
+            self.on_retry(event)
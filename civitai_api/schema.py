@@ -0,0 +1,150 @@
+"""Declarative parsers for API objects, compiled into one function per class.
+
+A Schema says where each attribute of a dataclass comes from in the raw item: a key,
+optionally run through a converter, a nested schema, or a custom builder. On first
+use it generates the source of a decoder specialised to that class, the way
+``dataclasses`` generates ``__init__``: one ``item.get`` per attribute and a single
+constructor call, with no per-field function calls or repeated lookups.
+
+Missing keys are tolerated as before: they give None (or the field's default), and a
+missing nested object gives a nested object of Nones.
+
+Projected parses (see ``projection``) go through the builder table the schema
+derives from the same fields, since they only build part of the object.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+from .projection import Builders, Projection, build
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Field:
+    """Where an attribute comes from in the raw item.
+
+    Attributes:
+        key (str | None): Raw key, when it differs from the attribute name.
+        convert (Callable[[Any], Any] | None): Applied to the raw value.
+        default (Any): Used instead of a missing or empty (falsy) raw value.
+        optional (bool): Only convert truthy values, giving None for the others.
+        schema (Schema | None): Parse the raw value, a dict, with this schema.
+        builder (Callable[[dict, Projection | None], Any] | None): Builds the attribute from the whole item and its projection, for anything the options above cannot express.
+
+    """
+
+    key: str | None = None
+    convert: Callable[[Any], Any] | None = None
+    default: Any = None
+    optional: bool = False
+    schema: "Schema | None" = None
+    builder: Callable[[dict, Projection | None], Any] | None = None
+
+
+class Schema(Generic[T]):
+    """Parser of one dataclass, compiled on first use.
+
+    Call it with a raw item, and optionally a projection, to get an object.
+    """
+
+    def __init__(self, cls: type[T], fields: dict[str, Field | None]) -> None:
+        """Describe how to build ``cls``.
+
+        Args:
+            cls (type[T]): The class to build.
+            fields (dict[str, Field | None]): Source of every attribute of ``cls``. None copies the raw key of the same name.
+
+        """
+        self.cls = cls
+        self.fields = {name: field or Field() for name, field in fields.items()}
+        self.builders: Builders = {
+            name: _builder(name, field) for name, field in self.fields.items()
+        }
+        self._decode: Callable[[dict], T] | None = None
+
+    def __call__(self, item: dict, fields: Projection | None = None) -> T:
+        """Build an object from a raw item.
+
+        Args:
+            item (dict): The raw API item.
+            fields (Projection | None): Only build these attributes, leaving the others None.
+
+        Returns:
+            T: The new object.
+
+        Raises:
+            ValueError: If the projection names attributes the class does not have.
+
+        """
+        if fields is not None:
+            return build(self.cls, item, fields, self.builders)
+        decode = self._decode
+        if decode is None:
+            decode = self._decode = self.compile()
+        return decode(item)
+
+    def compile(self) -> Callable[[dict], T]:
+        """Generate the decoder building a whole object from a raw item."""
+        namespace: dict[str, Any] = {"cls": self.cls}
+        arguments = []
+        for name, field in self.fields.items():
+            arguments.append(f"        {name}={_expression(name, field, namespace)},")
+        name = f"decode_{self.cls.__name__}"
+        source = "\n".join(
+            [
+                f"def {name}(item):",
+                "    get = item.get",
+                "    return cls(",
+                *arguments,
+                "    )",
+            ]
+        )
+        exec(compile(source, f"<schema {self.cls.__qualname__}>", "exec"), namespace)  # noqa: S102 - generated from the field names above
+        return namespace[name]
+
+
+def _expression(name: str, field: Field, namespace: dict[str, Any]) -> str:
+    # Python expression computing the attribute from ``item``/``get``. Callables and
+    # defaults are bound in the namespace under names derived from the attribute.
+    if field.builder is not None:
+        namespace[f"build_{name}"] = field.builder
+        return f"build_{name}(item, None)"
+    value = f"get({field.key or name!r})"
+    if field.schema is not None:
+        namespace[f"schema_{name}"] = field.schema
+        return f"schema_{name}({value} or {{}})"
+    if field.default is not None:
+        namespace[f"default_{name}"] = field.default
+        value = f"({value} or default_{name})"
+    if field.convert is None:
+        return value
+    namespace[f"convert_{name}"] = field.convert
+    if field.optional:
+        return f"(convert_{name}(value) if (value := {value}) else None)"
+    return f"convert_{name}({value})"
+
+
+def _builder(name: str, field: Field) -> Callable[[dict, Projection | None], Any]:
+    # Interpreted counterpart of _expression, for projected parses.
+    if field.builder is not None:
+        return field.builder
+    key = field.key or name
+    if field.schema is not None:
+        schema = field.schema
+        return lambda item, fields: schema(item.get(key) or {}, fields)
+    convert, default, optional = field.convert, field.default, field.optional
+
+    def make(item: dict, _: Projection | None) -> Any:
+        value = item.get(key)
+        if default is not None:
+            value = value or default
+        if convert is None:
+            return value
+        if optional:
+            return convert(value) if value else None
+        return convert(value)
+
+    return make
@@ -0,0 +1,127 @@
+"""Coalescing of concurrent identical requests.
+
+While a call for a key is in flight, further calls for the same key wait for it and
+receive its result (or exception) instead of doing the work again. SingleFlight serves
+threads; AsyncSingleFlight serves coroutines on one event loop.
+"""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    __slots__ = ("done", "error", "result")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Thread-safe in-flight call deduplication.
+
+    Attributes:
+        shared (int): Number of calls answered with another call's result.
+
+    """
+
+    def __init__(self) -> None:
+        """Create a group with no calls in flight."""
+        self.shared = 0
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run ``fn`` unless a call for ``key`` is already in flight, then share its outcome.
+
+        Args:
+            key (Hashable): Identifies identical calls.
+            fn (Callable[[], T]): The work to run.
+
+        Returns:
+            T: The result of ``fn``, whichever caller ran it.
+
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.shared += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class _LeaderCancelled(Exception):
+    """The leading coroutine was cancelled; waiting callers try again."""
+
+
+class AsyncSingleFlight:
+    """In-flight call deduplication for coroutines.
+
+    Attributes:
+        shared (int): Number of calls answered with another call's result.
+
+    """
+
+    def __init__(self) -> None:
+        """Create a group with no calls in flight."""
+        self.shared = 0
+        self._calls: dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await ``fn()`` unless a call for ``key`` is already in flight, then share its outcome.
+
+        Args:
+            key (Hashable): Identifies identical calls.
+            fn (Callable[[], Awaitable[T]]): Returns the awaitable doing the work.
+
+        Returns:
+            T: The result of ``fn()``, whichever caller awaited it.
+
+        If the caller running ``fn()`` is cancelled, the callers waiting for it are
+        not: one of them runs ``fn()`` again and the others wait for that call.
+
+        """
+        while (future := self._calls.get(key)) is not None:
+            self.shared += 1
+            try:
+                return await asyncio.shield(future)
+            except _LeaderCancelled:
+                self.shared -= 1
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.set_exception(_LeaderCancelled())
+            future.exception()  # Mark retrieved when no other caller was waiting.
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when no other caller was waiting.
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
@@ -0,0 +1,130 @@
+"""Incremental parsing of the ``items`` array of list responses.
+
+A list page is one JSON object whose ``items`` array holds nearly all of its bytes.
+Decoding it in one go keeps three copies of the page alive at once: the body, the
+decoded dict and the parsed objects. ItemSplitter is fed the body as it arrives and
+cuts out each element of ``items`` as soon as its closing brace is seen, so only the
+element being received is buffered. The other fields (``metadata``) are collected on
+the side and decoded at the end.
+
+The splitter only tracks strings, escapes and nesting. Each item is decoded by a
+regular JSON decoder (see ``json_decoder``), which also validates it.
+"""
+
+import re
+from typing import Any
+
+from .json_decoder import JSONDecoder
+
+# A whole string (group 1 is the closing quote, missing if the string is not complete
+# yet), or a bracket. Everything else is skipped by the regex engine.
+_TOKEN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*(")?|[{}\[\]]', re.DOTALL)
+
+_QUOTE, _OPEN_BRACE, _OPEN_BRACKET = b'"{['
+
+
+class ItemSplitter:
+    """Push parser splitting the elements of a top-level JSON array field out of a byte stream.
+
+    Feed the body chunk by chunk to ``feed``, which returns the raw bytes of every
+    element completed so far, then call ``close`` for the remaining fields. Elements
+    must be objects or arrays, as list items always are.
+    """
+
+    def __init__(self, key: str = "items") -> None:
+        """Create a splitter for the array stored under ``key`` in the top-level object.
+
+        Args:
+            key (str): Name of the array field to split.
+
+        """
+        self._key = key.encode()
+        self._buffer = bytearray()
+        self._pos = 0
+        self._depth = 0
+        self._last_string: bytes | None = None
+        self._in_array = False
+        self._item_start: int | None = None
+        self._outer = bytearray()
+        self._outer_from = 0
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """Add the next chunk of the body.
+
+        Args:
+            chunk (bytes): The next bytes of the body.
+
+        Returns:
+            list[bytes]: The raw JSON of every element completed by this chunk, in order.
+
+        """
+        buffer = self._buffer
+        buffer += chunk
+        items = []
+        pos, depth = len(buffer), self._depth
+        for match in _TOKEN.finditer(buffer, self._pos):
+            i = match.start()
+            char = buffer[i]
+            if char == _QUOTE:
+                if match.group(1) is None:
+                    pos = i  # Rescan the string once more of it has arrived.
+                    break
+                if depth == 1:
+                    self._last_string = bytes(buffer[i + 1 : match.end() - 1])
+            elif char == _OPEN_BRACE or char == _OPEN_BRACKET:
+                if (
+                    depth == 1
+                    and char == _OPEN_BRACKET
+                    and self._last_string == self._key
+                ):
+                    # Entering the array: keep "key": [ with the other fields.
+                    self._in_array = True
+                    self._outer += buffer[self._outer_from : i + 1]
+                elif self._in_array and depth == 2:
+                    self._item_start = i
+                depth += 1
+            else:
+                depth -= 1
+                if self._in_array and depth == 2:
+                    items.append(bytes(buffer[self._item_start : i + 1]))
+                    self._item_start = None
+                elif self._in_array and depth == 1:
+                    self._in_array = False
+                    self._last_string = None
+                    self._outer_from = i
+
+        if not self._in_array:
+            self._outer += buffer[self._outer_from : pos]
+            self._outer_from = pos
+        # Drop what has been consumed, keeping the element still incomplete.
+        cut = pos if self._item_start is None else self._item_start
+        if self._item_start is not None:
+            self._item_start -= cut
+        self._outer_from -= cut
+        del buffer[:cut]
+        self._pos, self._depth = pos - cut, depth
+        return items
+
+    def close(self, loads: JSONDecoder) -> dict[str, Any]:
+        """Finish the body and decode the fields other than the split array.
+
+        Args:
+            loads (JSONDecoder): The decoder for the remaining fields.
+
+        Returns:
+            dict[str, Any]: The top-level object, with the split array left empty.
+
+        Raises:
+            ValueError: If the body ended early.
+            TypeError: If the body is not a JSON object.
+
+        """
+        if self._depth != 0 or self._in_array or self._pos < len(self._buffer):
+            msg = "JSON body ended before it was complete"
+            raise ValueError(msg)
+        self._outer += self._buffer[self._outer_from :]
+        rest = loads(bytes(self._outer))
+        if not isinstance(rest, dict):
+            msg = f"Expected a JSON object, got {type(rest).__name__}"
+            raise TypeError(msg)
+        return rest
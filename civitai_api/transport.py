@@ -0,0 +1,149 @@
+"""Shared HTTP transport for the Civitai API client.
+
+A single Transport owns the pooled requests.Session used by every endpoint API of a
+Civitai instance, so connections (and their TLS sessions) are reused across endpoints.
+"""
+
+import socket
+from types import TracebackType
+from typing import Any, Self
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+from .cache import HTTPCache, ObjectCache
+from .disk_cache import DiskCache
+from .json_decoder import JSONDecoder, get_decoder
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .singleflight import SingleFlight
+
+
+class _PoolAdapter(HTTPAdapter):
+    """HTTPAdapter that applies TCP keep-alive socket options to pooled connections."""
+
+    def __init__(
+        self, socket_options: list[tuple[int, int, int]] | None, **kwargs: Any
+    ) -> None:
+        self._socket_options = socket_options
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        if self._socket_options:
+            kwargs["socket_options"] = self._socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
+class Transport:
+    """Pooled HTTP transport shared by all endpoint APIs of a client.
+
+    Attributes:
+        session (requests.Session): The session every request is sent through.
+        rate_limiter (RateLimiter | None): Limiter every request waits on, if any.
+        retry_policy (RetryPolicy): Policy deciding which failed requests are retried.
+        http_cache (HTTPCache | None): Cache GET requests are revalidated against, if any.
+        object_cache (ObjectCache | None): Cache of parsed objects returned by single-entity getters, if any.
+        single_flight (SingleFlight | None): Coalesces concurrent identical GETs, unless disabled.
+        disk_cache (DiskCache | None): Persistent cache fresh GET responses are served from, if any.
+        json_loads (JSONDecoder): Decodes response bodies.
+
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        keep_alive_idle: int | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        http_cache: HTTPCache | None = None,
+        object_cache: ObjectCache | None = None,
+        coalesce: bool = True,
+        disk_cache: DiskCache | None = None,
+        json_decoder: str | JSONDecoder | None = None,
+    ) -> None:
+        """Create the shared session and mount a tuned connection pool on it.
+
+        Args:
+            api_key (str | None): Optional API key sent as a Bearer token on every request.
+            pool_connections (int): Number of per-host connection pools to keep.
+            pool_maxsize (int): Maximum number of connections kept open per host.
+            pool_block (bool): Block when a host's pool is exhausted instead of opening
+                throwaway connections beyond ``pool_maxsize``.
+            keep_alive (bool): Keep connections open between requests. When False every
+                request sends ``Connection: close``.
+            keep_alive_idle (int | None): Seconds a pooled connection may sit idle before
+                TCP keep-alive probes are sent. None leaves the OS default.
+            rate_limiter (RateLimiter | None): Limiter shared by every request sent through this transport.
+            retry_policy (RetryPolicy | None): Retry policy, and with it the retry budget, shared by every
+                request. A default policy is used when omitted; pass ``RetryPolicy(max_attempts=1)`` to disable retries.
+            http_cache (HTTPCache | None): Conditional-request cache for GET responses.
+            object_cache (ObjectCache | None): Cache of parsed Model / ModelVersion objects returned by getters.
+            coalesce (bool): Let concurrent identical GETs share one request and one parsed result.
+            disk_cache (DiskCache | None): Persistent cache for GET responses, shared across restarts and processes.
+            json_decoder (str | JSONDecoder | None): JSON backend (``"orjson"``, ``"msgspec"`` or ``"json"``) or decoding
+                function for response bodies. Defaults to the fastest one installed.
+
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.keep_alive_idle = keep_alive_idle
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.http_cache = http_cache
+        self.object_cache = object_cache
+        self.single_flight = SingleFlight() if coalesce else None
+        self.disk_cache = disk_cache
+        self.json_loads = get_decoder(json_decoder)
+
+        self.session = requests.Session()
+        adapter = _PoolAdapter(
+            self._socket_options(),
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        if api_key:
+            self.session.headers.update({"Authorization": f"Bearer {api_key}"})
+        if not keep_alive:
+            self.session.headers.update({"Connection": "close"})
+
+    def _socket_options(self) -> list[tuple[int, int, int]] | None:
+        if not self.keep_alive or self.keep_alive_idle is None:
+            return None
+        options = [
+            *HTTPConnection.default_socket_options,
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        ]
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            options.append(
+                (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, self.keep_alive_idle)
+            )
+        elif hasattr(socket, "TCP_KEEPALIVE"):  # macOS
+            options.append(
+                (socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, self.keep_alive_idle)
+            )
+        return options
+
+    def close(self) -> None:
+        """Close the session and every pooled connection."""
+        self.session.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
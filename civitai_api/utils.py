@@ -1,12 +1,14 @@
-"""Utility functions for parsing datetimes, API responses, enums, and safely accessing dictionary keys."""
+"""Utility functions for parsing datetimes, API responses, pagination, enums, and safely accessing dictionary keys."""
 
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
+from .timestamps import parse_timestamp
+
 
 def parse_datetime(dt_str: str) -> datetime:
-    """Parse an ISO 8601 datetime string with a compatability shim for earlier versions of Python.
+    """Parse an ISO 8601 datetime string, including the ``Z`` suffix the API sends.
 
     Args:
         dt_str (str): The datetime string to parse.
@@ -14,13 +16,11 @@ def parse_datetime(dt_str: str) -> datetime:
     Returns:
         datetime: A datetime object parsed from the input string.
 
+    Raises:
+        ValueError: If the string is not an ISO 8601 datetime.
+
     """
-    try:
-        return datetime.fromisoformat(dt_str)
-    except ValueError:
-        if dt_str.endswith("Z"):
-            return datetime.fromisoformat(dt_str[:-1] + "+00:00")  # noqa: FURB162
-        raise
+    return parse_timestamp(dt_str)
 
 
 def parse_response(response: dict[str, Any]) -> dict[str, Any]:
@@ -37,6 +37,33 @@ def parse_response(response: dict[str, Any]) -> dict[str, Any]:
     return response
 
 
+def next_page(
+    metadata: dict[str, Any], url: str, params: dict[str, Any] | None
+) -> tuple[str, dict[str, Any] | None] | None:
+    """Return the request for the page after the one described by ``metadata``.
+
+    Follows ``nextPage`` when the server sends it, then ``nextCursor``, and finally
+    page numbers when only ``currentPage`` and ``totalPages`` are given.
+
+    Args:
+        metadata (dict[str, Any]): The ``metadata`` of a list response.
+        url (str): The URL the page was requested from.
+        params (dict[str, Any] | None): The query parameters it was requested with.
+
+    Returns:
+        tuple[str, dict[str, Any] | None] | None: URL and parameters of the next page, or None on the last page.
+
+    """
+    if metadata.get("nextPage"):
+        return metadata["nextPage"], None
+    if metadata.get("nextCursor") is not None:
+        return url, {**(params or {}), "cursor": metadata["nextCursor"]}
+    current, total = metadata.get("currentPage"), metadata.get("totalPages")
+    if current is not None and total is not None and int(current) < int(total):
+        return url, {**(params or {}), "page": int(current) + 1}
+    return None
+
+
 def create_enum_list(enum_class: type[Enum], values: list[str]) -> list[Any]:
     """Create a list of enum instances from a list of string values.
 
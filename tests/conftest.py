@@ -0,0 +1,80 @@
+"""Shared pytest fixtures."""
+
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+import pytest
+
+
+class StandInServer:
+    """Local HTTP server standing in for the Civitai API.
+
+    Register routes with ``route(path, handler)``; a handler receives the request
+    handler and returns ``(status, headers, body)`` where a dict/list body is sent as JSON.
+    A ``Content-Length`` header larger than the body simulates a dropped connection.
+    Every request path (with query) is recorded in ``requests``.
+    """
+
+    def __init__(self) -> None:
+        self.routes = {}
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                server.requests.append(self.path)
+                handler = server.routes.get(urlparse(self.path).path)
+                status, headers, body = handler(self) if handler else (404, {}, {})
+                if not isinstance(body, bytes):
+                    body = json.dumps(body).encode()
+                    headers = {"Content-Type": "application/json", **headers}
+                headers = {"Content-Length": str(len(body)), **headers}
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(body)
+                if int(headers["Content-Length"]) > len(body):
+                    self.close_connection = True
+
+            def log_message(self, *args) -> None:
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def route(self, path: str, handler) -> None:
+        self.routes[path] = handler
+
+    def json(self, path: str, payload, status: int = 200, headers=None) -> None:
+        self.routes[path] = lambda _request: (status, headers or {}, payload)
+
+    def file(self, path: str, data: bytes, ranges: bool = True) -> None:
+        """Serve ``data``, honouring single ``Range: bytes=a-b`` requests if ``ranges``."""
+
+        def handler(request):
+            match = re.fullmatch(r"bytes=(\d+)-(\d*)", request.headers.get("Range", ""))
+            if not ranges or match is None:
+                return 200, {}, data
+            start = int(match[1])
+            end = min(int(match[2]) if match[2] else len(data) - 1, len(data) - 1)
+            headers = {"Content-Range": f"bytes {start}-{end}/{len(data)}"}
+            return 206, headers, data[start : end + 1]
+
+        self.routes[path] = handler
+
+
+@pytest.fixture
+def stand_in_server():
+    server = StandInServer()
+    server.thread.start()
+    yield server
+    server.httpd.shutdown()
+    server.httpd.server_close()
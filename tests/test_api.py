@@ -4,6 +4,7 @@ This module contains tests for ModelsAPI, ImagesAPI, CreatorsAPI, TagsAPI, and M
 including parsing and error handling.
 """
 
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -49,7 +50,7 @@ def test_modelsapi_list_models_parsing():
         "metadata": {"nextPage": None},
     }
     with patch.object(api, "session") as mock_session:
-        mock_session.get.return_value.json.return_value = mock_response
+        mock_session.get.return_value.content = json.dumps(mock_response).encode()
         mock_session.get.return_value.raise_for_status.return_value = None
         models = next(api.list_models())
         assert isinstance(models[0], Model)
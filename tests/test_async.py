@@ -0,0 +1,175 @@
+"""Tests for the asyncio client against a local stand-in server."""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from civitai_api import (
+    AsyncCivitai,
+    CivitaiAPIError,
+    HTTPCache,
+    RateLimitError,
+    RetryPolicy,
+)
+from civitai_api.civitai_api.models import Creator, Image, Model, ModelVersion, Tag
+
+FIXTURES = json.loads(
+    (Path(__file__).parent / "fixtures" / "api_responses.json").read_text()
+)
+
+MODEL_VERSION = {
+    "id": 1,
+    "modelId": 2,
+    "name": "ver",
+    "createdAt": "2025-08-14T12:34:56Z",
+    "downloadUrl": "http://dl",
+    "trainedWords": ["word"],
+    "baseModel": "SD 1.5",
+    "files": [],
+    "images": [],
+    "stats": {"downloadCount": 1, "ratingCount": 2, "rating": 3.0},
+}
+
+
+def test_async_list_models_follows_next_page(stand_in_server):
+    page = FIXTURES["models_list_page1"]
+    first = {
+        "items": page["items"][:2],
+        "metadata": {"nextPage": f"{stand_in_server.url}/models-page2?cursor=abc"},
+    }
+    second = {"items": page["items"][2:3], "metadata": {}}
+    stand_in_server.json("/models", first)
+    stand_in_server.json("/models-page2", second)
+
+    async def crawl():
+        async with AsyncCivitai(base_url=stand_in_server.url) as civitai:
+            return [models async for models in civitai.models.list_models(limit=2)]
+
+    pages = asyncio.run(crawl())
+    assert [len(p) for p in pages] == [2, 1]
+    assert all(isinstance(m, Model) for p in pages for m in p)
+    assert stand_in_server.requests[-1] == "/models-page2?cursor=abc"
+
+
+def test_async_getters(stand_in_server):
+    stand_in_server.json("/models/1102", FIXTURES["model_get_1102"])
+    stand_in_server.json("/model-versions/1", MODEL_VERSION)
+    stand_in_server.json("/model-versions/by-hash/ABCDEF", MODEL_VERSION)
+    stand_in_server.json(
+        "/images",
+        {
+            "items": [
+                {
+                    "id": 1,
+                    "url": "http://img",
+                    "createdAt": "2025-08-14T12:34:56",
+                    "stats": {},
+                }
+            ]
+        },
+    )
+    stand_in_server.json(
+        "/creators", {"items": [{"username": "user", "modelCount": 5, "link": "l"}]}
+    )
+    stand_in_server.json(
+        "/tags", {"items": [{"name": "tag", "modelCount": 10, "link": "l"}]}
+    )
+
+    async def fetch():
+        async with AsyncCivitai(base_url=stand_in_server.url) as civitai:
+            return await asyncio.gather(
+                civitai.models.get_model(1102),
+                civitai.model_versions.get_model_version(1),
+                civitai.model_versions.get_model_version_by_hash("ABCDEF"),
+                civitai.images.list_images(limit=1),
+                civitai.creators.list_creators(query="user"),
+                civitai.tags.list_tags(),
+            )
+
+    model, version, by_hash, images, creators, tags = asyncio.run(fetch())
+    assert isinstance(model, Model) and model.id == 1102
+    assert isinstance(version, ModelVersion) and version == by_hash
+    assert isinstance(images[0], Image)
+    assert isinstance(creators[0], Creator)
+    assert isinstance(tags[0], Tag)
+    assert "/creators?query=user" in stand_in_server.requests
+
+
+def test_async_errors(stand_in_server):
+    stand_in_server.json("/tags", {}, status=429)
+
+    async def fetch(path):
+        async with AsyncCivitai(base_url=stand_in_server.url) as civitai:
+            return await civitai.tags.get(path)
+
+    with pytest.raises(RateLimitError):
+        asyncio.run(fetch("tags"))
+    with pytest.raises(CivitaiAPIError):
+        asyncio.run(fetch("missing"))
+    stand_in_server.route("/broken", lambda _request: (200, {}, b"{not json"))
+    with pytest.raises(CivitaiAPIError, match="Invalid JSON response"):
+        asyncio.run(fetch("broken"))
+
+
+def test_async_concurrency_is_bounded(stand_in_server):
+    state = {"active": 0, "peak": 0}
+
+    async def crawl():
+        async with AsyncCivitai(
+            base_url=stand_in_server.url, max_concurrency=3
+        ) as civitai:
+            original = civitai.transport.client.request
+
+            async def tracking_request(*args, **kwargs):
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+                try:
+                    await asyncio.sleep(0.01)
+                    return await original(*args, **kwargs)
+                finally:
+                    state["active"] -= 1
+
+            civitai.transport.client.request = tracking_request
+            await asyncio.gather(*(civitai.tags.list_tags(page=i) for i in range(12)))
+
+    stand_in_server.json("/tags", {"items": []})
+    asyncio.run(crawl())
+    assert state["peak"] == 3
+
+
+def test_async_retries_transient_errors(stand_in_server):
+    answers = iter([(502, {}, {}), (200, {}, {"items": []})])
+    stand_in_server.route("/tags", lambda _request: next(answers))
+
+    async def fetch():
+        policy = RetryPolicy(backoff_base=0.001, backoff_cap=0.002)
+        async with AsyncCivitai(
+            base_url=stand_in_server.url, retry_policy=policy
+        ) as civitai:
+            return await civitai.tags.list_tags(), policy.retries
+
+    assert asyncio.run(fetch()) == ([], 1)
+
+
+def test_async_http_cache_revalidates(stand_in_server):
+    def handler(request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            return 304, {}, b""
+        return 200, {"ETag": '"v1"'}, MODEL_VERSION
+
+    stand_in_server.route("/model-versions/1", handler)
+
+    async def fetch():
+        async with AsyncCivitai(
+            base_url=stand_in_server.url, http_cache=HTTPCache()
+        ) as civitai:
+            first = await civitai.model_versions.get_model_version(1)
+            second = await civitai.model_versions.get_model_version(1)
+            return first, second
+
+    first, second = asyncio.run(fetch())
+    assert second is first
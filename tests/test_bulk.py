@@ -0,0 +1,84 @@
+"""Unit tests for the concurrent bulk getters."""
+
+import asyncio
+import threading
+import time
+
+from civitai_api import Civitai
+from civitai_api.civitai_api.bulk import bulk_fetch, bulk_fetch_async
+from civitai_api.civitai_api.client import CivitaiAPIError
+
+
+def version(version_id):
+    return {"id": version_id, "modelId": 1, "name": "v", "files": [], "stats": {}}
+
+
+def test_bulk_fetch_streams_in_completion_order_and_bounds_concurrency():
+    lock = threading.Lock()
+    running = peak = 0
+
+    def fetch(item_id):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05 if item_id == 0 else 0.001)
+        with lock:
+            running -= 1
+        if item_id == 3:
+            raise ValueError("bad id")
+        return item_id * 10
+
+    results = list(bulk_fetch(fetch, range(20), max_workers=4))
+    assert len(results) == 20
+    assert peak <= 4
+    assert results[-1].id == 0
+    failed = [r for r in results if not r.ok]
+    assert [r.id for r in failed] == [3]
+    assert isinstance(failed[0].error, ValueError)
+    assert {r.id: r.value for r in results if r.ok} == {
+        i: i * 10 for i in range(20) if i != 3
+    }
+
+
+def test_bulk_fetch_consumes_ids_lazily():
+    consumed = []
+
+    def ids():
+        for i in range(1000):
+            consumed.append(i)
+            yield i
+
+    results = bulk_fetch(lambda i: i, ids(), max_workers=2)
+    next(results)
+    results.close()
+    assert len(consumed) < 10
+
+
+def test_bulk_fetch_async_bounds_concurrency():
+    running = peak = 0
+
+    async def fetch(item_id):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+        return item_id
+
+    async def run():
+        return [r async for r in bulk_fetch_async(fetch, range(10), 3)]
+
+    results = asyncio.run(run())
+    assert sorted(r.value for r in results) == list(range(10))
+    assert peak <= 3
+
+
+def test_get_model_versions_reports_per_item_errors(stand_in_server):
+    for i in (1, 2, 4):
+        stand_in_server.json(f"/model-versions/{i}", version(i))
+    civitai = Civitai()
+    civitai.model_versions.BASE_URL = stand_in_server.url
+    results = {r.id: r for r in civitai.model_versions.get_model_versions([1, 2, 3, 4])}
+    assert {i: r.value.id for i, r in results.items() if r.ok} == {1: 1, 2: 2, 4: 4}
+    assert isinstance(results[3].error, CivitaiAPIError)
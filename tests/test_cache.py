@@ -0,0 +1,97 @@
+"""Unit tests for the conditional-request HTTP cache."""
+
+import json
+from pathlib import Path
+
+from civitai_api import Civitai, HTTPCache, ObjectCache
+
+FIXTURES = json.loads(
+    (Path(__file__).parent / "fixtures" / "api_responses.json").read_text()
+)
+
+
+def etag_route(payload, etag='"v1"'):
+    def handler(request):
+        if request.headers.get("If-None-Match") == etag:
+            return 304, {"ETag": etag}, b""
+        return 200, {"ETag": etag}, payload
+
+    return handler
+
+
+def test_get_model_revalidates_and_reuses_parsed_object(stand_in_server):
+    stand_in_server.route("/models/1102", etag_route(FIXTURES["model_get_1102"]))
+    civitai = Civitai(http_cache=HTTPCache())
+    civitai.models.BASE_URL = stand_in_server.url
+
+    first = civitai.models.get_model(1102)
+    second = civitai.models.get_model(1102)
+
+    assert second is first
+    assert civitai.transport.http_cache.revalidations == 1
+    assert len(stand_in_server.requests) == 2
+
+
+def test_changed_response_is_parsed_again(stand_in_server):
+    versions = iter(['"v1"', '"v2"'])
+    payload = {"items": [], "metadata": {}}
+
+    def handler(request):
+        return 200, {"ETag": next(versions)}, payload
+
+    stand_in_server.route("/tags", handler)
+    cache = HTTPCache()
+    civitai = Civitai(http_cache=cache)
+    url = f"{stand_in_server.url}/tags"
+    first = civitai.tags.get(url)
+    second = civitai.tags.get(url)
+    assert first == second and first is not second
+    assert cache.lookup(url).etag == '"v2"'
+    assert cache.revalidations == 0
+
+
+def test_store_requires_validators_and_evicts_lru():
+    cache = HTTPCache(max_entries=2)
+    cache.store("a", {}, {"a": 1})
+    assert cache.lookup("a") is None
+    cache.store("a", {"ETag": "1"}, {"a": 1})
+    cache.store("b", {"Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}, {"b": 1})
+    cache.lookup("a")
+    cache.store("c", {"ETag": "3"}, {"c": 1})
+    assert cache.lookup("b") is None
+    assert cache.lookup("a").validators() == {"If-None-Match": "1"}
+    assert len(cache) == 2
+
+
+def test_object_cache_lru_ttl_and_invalidation():
+    now = [0.0]
+    cache = ObjectCache(max_entries=2, ttl=10, clock=lambda: now[0])
+    cache.put("/models/1", "one")
+    cache.put("models/2", "two")
+    assert cache.get("models/1") == "one"
+    cache.put("models/3", "three")
+    assert cache.get("models/2") is None
+    assert cache.invalidate("models/3")
+    assert cache.get("models/3") is None
+    now[0] = 11
+    assert cache.get("models/1") is None
+    assert (cache.hits, cache.misses) == (1, 3)
+    cache.put("model-versions/1", 1)
+    cache.put("model-versions/by-hash/AB", 1)
+    assert cache.invalidate_prefix("model-versions/") == 2
+
+
+def test_getters_answer_from_object_cache(stand_in_server):
+    stand_in_server.json("/models/1102", FIXTURES["model_get_1102"])
+    objects = ObjectCache()
+    civitai = Civitai(object_cache=objects)
+    civitai.models.BASE_URL = stand_in_server.url
+
+    first = civitai.models.get_model(1102)
+    assert civitai.models.get_model(1102) is first
+    assert len(stand_in_server.requests) == 1
+    assert objects.hits == 1
+
+    objects.invalidate("models/1102")
+    assert civitai.models.get_model(1102) is not first
+    assert len(stand_in_server.requests) == 2
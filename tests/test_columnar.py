@@ -0,0 +1,95 @@
+"""Unit tests for columnar batches."""
+
+import math
+
+import pytest
+
+from civitai_api import Civitai
+from civitai_api.civitai_api.api.images import parse_image
+from civitai_api.civitai_api.columnar import IMAGE_COLUMNS, MODEL_COLUMNS, ColumnBatch
+from civitai_api.civitai_api.models.image import Image
+
+
+def image(i, likes, nsfw=False):
+    return {
+        "id": i,
+        "url": f"http://img/{i}",
+        "hash": "h",
+        "width": 512,
+        "height": 768,
+        "nsfw": nsfw,
+        "createdAt": "2025-08-14T12:34:56Z",
+        "postId": 1,
+        "stats": {"likeCount": likes},
+        "meta": None,
+        "username": "u",
+    }
+
+
+ITEMS = [image(1, 5), image(2, 50, nsfw=True), image(3, 20), image(4, 50), image(5, 0)]
+
+
+def ids(batch):
+    return list(batch["id"])
+
+
+def test_columns_are_built_from_raw_items_and_parsed_on_read():
+    batch = ColumnBatch.from_rows(ITEMS, IMAGE_COLUMNS, parse_image)
+    assert len(batch) == 5
+    assert list(batch["likeCount"]) == [5, 50, 20, 50, 0]
+    assert list(batch["heartCount"]) == [0] * 5
+    assert [bool(v) for v in batch["nsfw"]] == [False, True, False, False, False]
+    assert batch.rows[0] is ITEMS[0]
+    assert batch.item(2) == parse_image(ITEMS[2])
+    assert batch.to_list() == [parse_image(item) for item in ITEMS]
+
+
+def test_filter_sort_and_top_reorder_rows_with_their_columns():
+    batch = ColumnBatch.from_rows(ITEMS, IMAGE_COLUMNS, parse_image)
+    sfw = batch.filter([not v for v in batch["nsfw"]])
+    assert ids(sfw) == [1, 3, 4, 5]
+    assert [i.id for i in sfw] == [1, 3, 4, 5]
+    assert ids(batch.sort("likeCount")) == [5, 1, 3, 2, 4]
+    assert ids(batch.sort("likeCount", descending=True)) == [2, 4, 3, 1, 5]
+    top = batch.top("likeCount", 3)
+    assert ids(top) == [2, 4, 3]
+    assert [i.id for i in top.to_list()] == [2, 4, 3]
+    assert len(batch.top("likeCount", 0)) == 0
+    assert ids(batch.top("likeCount", 10)) == [2, 4, 3, 1, 5]
+
+
+def test_missing_floats_are_nan_and_sort_last():
+    models = [
+        {"id": 1, "stats": {"rating": 4.5}},
+        {"id": 2, "stats": {}},
+        {"id": 3, "stats": {"rating": 4.9}},
+    ]
+    batch = ColumnBatch.from_rows(models, MODEL_COLUMNS)
+    assert math.isnan(batch["rating"][1])
+    assert ids(batch.sort("rating")) == [1, 3, 2]
+    assert ids(batch.sort("rating", descending=True)) == [3, 1, 2]
+    assert ids(batch.top("rating", 2)) == [3, 1]
+    assert batch.item(1) is models[1]
+
+
+def test_columns_can_be_built_from_objects_and_concatenated():
+    objects = [parse_image(item) for item in ITEMS]
+    first = ColumnBatch.from_rows(objects[:2], IMAGE_COLUMNS)
+    second = ColumnBatch.from_rows(objects[2:], IMAGE_COLUMNS)
+    joined = ColumnBatch.concat([first, second])
+    assert list(joined["likeCount"]) == [5, 50, 20, 50, 0]
+    assert joined.top("likeCount", 1).item(0) is objects[1]
+    with pytest.raises(ValueError, match="different columns"):
+        ColumnBatch.concat([first, ColumnBatch.from_rows([], MODEL_COLUMNS)])
+
+
+def test_list_images_can_return_a_batch(stand_in_server):
+    stand_in_server.json("/images", {"items": ITEMS, "metadata": {}})
+    civitai = Civitai()
+    civitai.images.BASE_URL = stand_in_server.url
+
+    batch = civitai.images.list_images(columnar=True)
+    assert isinstance(batch, ColumnBatch)
+    best = batch.top("likeCount", 1).item(0)
+    assert isinstance(best, Image)
+    assert best.id == 2
@@ -0,0 +1,60 @@
+"""Unit tests for the compact, slotted model variants."""
+
+import dataclasses
+import json
+import pickle
+from pathlib import Path
+
+import pytest
+
+from civitai_api.civitai_api.api.models import parse_model
+from civitai_api.civitai_api.models import compact, compact_class, expand
+from civitai_api.civitai_api.models.model import Model
+from civitai_api.civitai_api.models.tag import Tag
+
+FIXTURES = json.loads(
+    (Path(__file__).parent / "fixtures" / "api_responses.json").read_text()
+)
+ITEM = FIXTURES["model_get_1102"]
+
+
+def test_compact_models_are_slotted_and_round_trip():
+    model = parse_model(ITEM)
+    slim = compact(model)
+    assert type(slim) is compact_class(Model)
+    assert not hasattr(slim, "__dict__")
+    version = slim.modelVersions[0]
+    assert not hasattr(version, "__dict__")
+    assert not hasattr(version.files[0], "__dict__")
+    assert expand(slim) == model
+    assert dataclasses.asdict(slim) == dataclasses.asdict(model)
+    assert pickle.loads(pickle.dumps(slim)) == slim
+
+
+def test_frozen_variants_use_tuples_and_reject_assignment():
+    model = parse_model(ITEM)
+    frozen = compact(model, frozen=True)
+    assert type(frozen) is compact_class(Model, frozen=True)
+    assert isinstance(frozen.modelVersions, tuple)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        frozen.name = "renamed"
+    assert expand(frozen) == model
+    assert compact(frozen) == compact(model)
+
+
+def test_repeated_strings_are_interned():
+    first, second = (json.loads(json.dumps(ITEM)) for _ in range(2))
+    a, b = compact(parse_model(first)), compact(parse_model(second))
+    assert a.modelVersions[0].baseModel is b.modelVersions[0].baseModel
+    assert a.modelVersions[0].files[0].type is b.modelVersions[0].files[0].type
+    assert a.tags[0] is b.tags[0]
+    assert a.creator.username is b.creator.username
+    key = next(iter(a.modelVersions[0].files[0].hashes))
+    assert key is next(iter(b.modelVersions[0].files[0].hashes))
+    assert a.name is not b.name
+
+
+def test_compact_leaves_other_values_alone():
+    assert compact(Tag("anime", 3, "/t")) == compact_class(Tag)("anime", 3, "/t")
+    assert compact({"a": [1]}) == {"a": [1]}
+    assert compact("text") == "text"
@@ -0,0 +1,68 @@
+"""Unit tests for the persistent SQLite response cache."""
+
+import time
+
+from civitai_api import Civitai, DiskCache, HTTPCache
+
+
+def test_round_trip_and_ttl(tmp_path):
+    cache = DiskCache(tmp_path / "cache.db", ttls={"tags": 60, "models": 0})
+    cache.set("https://civitai.com/api/v1/tags?limit=1", b'{"items": []}')
+    cache.set("https://civitai.com/api/v1/models/1", b"{}")
+    assert cache.get("https://civitai.com/api/v1/tags?limit=1") == b'{"items": []}'
+    assert cache.get("https://civitai.com/api/v1/models/1") is None
+    cache.set("expired", b"{}", ttl=-1)
+    assert cache.get("expired") is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_ttl_uses_longest_prefix(tmp_path):
+    cache = DiskCache(
+        tmp_path / "cache.db",
+        ttls={"model-versions": 60, "model-versions/by-hash": 86400},
+        default_ttl=None,
+    )
+    base = "https://civitai.com/api/v1"
+    assert cache.ttl_for(f"{base}/model-versions/by-hash/ABC") == 86400
+    assert cache.ttl_for(f"{base}/model-versions/12") == 60
+    assert cache.ttl_for(f"{base}/images") is None
+
+
+def test_evicts_least_recently_used_past_max_bytes(tmp_path):
+    cache = DiskCache(tmp_path / "cache.db", max_bytes=2500, compression_level=0)
+    for key in ("a", "b", "c"):
+        cache.set(key, bytes(1000))
+        time.sleep(0.01)
+    cache.get("a")
+    assert cache.evict() == 1
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+
+def test_shared_between_instances(tmp_path):
+    DiskCache(tmp_path / "cache.db").set("k", b"payload")
+    assert DiskCache(tmp_path / "cache.db").get("k") == b"payload"
+
+
+def test_client_serves_fresh_responses_from_disk(stand_in_server, tmp_path):
+    stand_in_server.json("/tags", {"items": [{"name": "tag"}]})
+    url = f"{stand_in_server.url}/tags"
+    first = Civitai(disk_cache=DiskCache(tmp_path / "cache.db"))
+    assert first.tags.get(url) == {"items": [{"name": "tag"}]}
+
+    restarted = Civitai(disk_cache=DiskCache(tmp_path / "cache.db"))
+    assert restarted.tags.get(url) == {"items": [{"name": "tag"}]}
+    assert len(stand_in_server.requests) == 1
+
+
+def test_client_refetches_corrupt_disk_entries(stand_in_server, tmp_path):
+    stand_in_server.json("/tags", {"items": [{"name": "tag"}]})
+    url = f"{stand_in_server.url}/tags"
+    civitai = Civitai(disk_cache=DiskCache(tmp_path / "cache.db"))
+    civitai.tags.get(url)
+    civitai.transport.disk_cache.set(HTTPCache.key(url, None), b'{"items": [{"na')
+
+    assert civitai.tags.get(url) == {"items": [{"name": "tag"}]}
+    assert len(stand_in_server.requests) == 2
+    assert civitai.tags.get(url) == {"items": [{"name": "tag"}]}
+    assert len(stand_in_server.requests) == 2
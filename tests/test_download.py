@@ -0,0 +1,137 @@
+"""Unit tests for the streaming downloader."""
+
+import hashlib
+import json
+import os
+import threading
+
+import pytest
+
+from civitai_api import Civitai, DownloadError, RetryPolicy
+from civitai_api.civitai_api import download
+from civitai_api.civitai_api.models.model_version import ModelVersionFile
+
+DATA = os.urandom(1024 * 1024 + 123)
+SHA256 = hashlib.sha256(DATA).hexdigest().upper()
+
+
+def make_downloader(**kwargs):
+    civitai = Civitai(retry_policy=RetryPolicy(backoff_base=0))
+    downloader = civitai.downloads
+    downloader.chunk_size = 16 * 1024
+    downloader.min_segment_size = 128 * 1024
+    for key, value in kwargs.items():
+        setattr(downloader, key, value)
+    return downloader
+
+
+def model_file(url):
+    return ModelVersionFile(
+        name="model.safetensors",
+        id=1,
+        sizeKb=len(DATA) / 1024,
+        type="Model",
+        format="SafeTensor",
+        pickleScanResult="Success",
+        pickleScanMessage="",
+        virusScanResult="Success",
+        scannedAt=None,
+        hashes={"SHA256": SHA256},
+        downloadUrl=url,
+        primary=True,
+    )
+
+
+def test_segmented_download_verifies_sha256(stand_in_server, tmp_path):
+    stand_in_server.file("/download", DATA)
+    seen = []
+    path = make_downloader().download(
+        model_file(stand_in_server.url + "/download"),
+        tmp_path,
+        progress=lambda done, total: seen.append((done, total)),
+    )
+    assert path == tmp_path / "model.safetensors"
+    assert path.read_bytes() == DATA
+    assert sorted(os.listdir(tmp_path)) == ["model.safetensors"]
+    assert len(stand_in_server.requests) == 1 + 4
+    assert seen[-1] == (len(DATA), len(DATA))
+
+
+def test_dropped_connection_resumes_from_received_bytes(stand_in_server, tmp_path):
+    stand_in_server.file("/download", DATA)
+    serve = stand_in_server.routes["/download"]
+    calls = []
+
+    def flaky(request):
+        status, headers, body = serve(request)
+        calls.append(request.headers["Range"])
+        if len(calls) == 2:
+            return status, {**headers, "Content-Length": str(len(body))}, body[:50000]
+        return status, headers, body
+
+    stand_in_server.route("/download", flaky)
+    dest = tmp_path / "model.bin"
+    make_downloader(segments=1).download(
+        stand_in_server.url + "/download", dest, sha256=SHA256
+    )
+    assert dest.read_bytes() == DATA
+    assert calls[2].startswith("bytes=")
+    assert int(calls[2][6:].split("-")[0]) >= 16 * 1024
+
+
+def test_resumes_partial_file_from_saved_state(stand_in_server, tmp_path):
+    stand_in_server.file("/download", DATA)
+    dest = tmp_path / "model.bin"
+    half = len(DATA) // 2
+    (tmp_path / "model.bin.part").write_bytes(DATA[:half] + bytes(len(DATA) - half))
+    (tmp_path / "model.bin.part.json").write_text(
+        json.dumps({"size": len(DATA), "segments": [[0, len(DATA), half]]})
+    )
+    make_downloader().download(stand_in_server.url + "/download", dest, SHA256)
+    assert dest.read_bytes() == DATA
+    assert len(stand_in_server.requests) == 2
+
+
+def test_sha256_mismatch_discards_file(stand_in_server, tmp_path):
+    stand_in_server.file("/download", DATA)
+    with pytest.raises(DownloadError):
+        make_downloader().download(
+            stand_in_server.url + "/download", tmp_path / "model.bin", "00" * 32
+        )
+    assert os.listdir(tmp_path) == []
+
+
+def test_server_without_range_support_streams_whole_file(stand_in_server, tmp_path):
+    stand_in_server.file("/download", DATA, ranges=False)
+    dest = tmp_path / "model.bin"
+    make_downloader().download(stand_in_server.url + "/download", dest, SHA256)
+    assert dest.read_bytes() == DATA
+    assert len(stand_in_server.requests) == 1
+
+
+def test_hash_catch_up_does_not_block_segment_writers(tmp_path, monkeypatch):
+    part = tmp_path / "model.bin.part"
+    part.write_bytes(DATA[:300])
+    first, second, third = (
+        download._Segment(start, start + 100, start) for start in (0, 100, 200)
+    )
+    second.pos = 200  # Written ahead of the cursor, so it is read back.
+    hasher = download._OrderedHasher(part, [first, second, third], 64)
+    release = threading.Event()
+
+    def slow_open(*args, **kwargs):
+        release.wait(5)
+        return open(*args, **kwargs)
+
+    monkeypatch.setattr(download, "open", slow_open, raising=False)
+    reader = threading.Thread(target=hasher.update, args=(0, DATA[:100]))
+    reader.start()
+    writer = threading.Thread(target=hasher.update, args=(200, DATA[200:300]))
+    writer.start()
+    writer.join(1)
+    assert not writer.is_alive()
+    first.pos = third.pos = 300
+
+    release.set()
+    reader.join()
+    assert hasher.hexdigest() == hashlib.sha256(DATA[:300]).hexdigest()
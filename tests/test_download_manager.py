@@ -0,0 +1,95 @@
+"""Unit tests for the download manager."""
+
+import hashlib
+import os
+import time
+
+from civitai_api import Civitai, DownloadManager, DownloadStatus, RetryPolicy
+from civitai_api.civitai_api.models.model_version import ModelVersion, ModelVersionFile
+
+
+def model_file(server, name, data):
+    server.file(f"/{name}", data)
+    return ModelVersionFile(
+        name=name,
+        id=1,
+        sizeKb=len(data) / 1024,
+        type="Model",
+        format="SafeTensor",
+        pickleScanResult="Success",
+        pickleScanMessage="",
+        virusScanResult="Success",
+        scannedAt=None,
+        hashes={"SHA256": hashlib.sha256(data).hexdigest().upper()},
+        downloadUrl=f"{server.url}/{name}",
+        primary=True,
+    )
+
+
+def make_manager(tmp_path, **kwargs):
+    civitai = Civitai(retry_policy=RetryPolicy(max_attempts=1))
+    return DownloadManager(civitai.downloads, tmp_path / "models", **kwargs)
+
+
+def test_runs_highest_priority_first_and_deduplicates(stand_in_server, tmp_path):
+    low = model_file(stand_in_server, "low.bin", b"low")
+    high = model_file(stand_in_server, "high.bin", b"high")
+    copy = model_file(stand_in_server, "copy.bin", b"low")
+    manager = make_manager(tmp_path, max_concurrency=1)
+    task = manager.enqueue(low)
+    manager.enqueue(high, priority=10)
+    assert manager.enqueue(copy) is task
+
+    with manager:
+        pass
+    assert [t.status for t in manager.tasks] == [DownloadStatus.DONE] * 2
+    assert list(dict.fromkeys(stand_in_server.requests)) == ["/high.bin", "/low.bin"]
+    assert (tmp_path / "models" / "low.bin").read_bytes() == b"low"
+    assert not (tmp_path / "models" / "copy.bin").exists()
+
+
+def test_enqueue_version_queues_its_files(stand_in_server, tmp_path):
+    files = [model_file(stand_in_server, f"{i}.bin", bytes([i])) for i in range(3)]
+    files[2].primary = False
+    version = ModelVersion(
+        id=1,
+        modelId=1,
+        name="v",
+        createdAt=None,
+        downloadUrl="",
+        trainedWords=[],
+        baseModel="SD 1.5",
+        files=files,
+        images=[],
+        stats=None,
+    )
+    manager = make_manager(tmp_path)
+    assert len(manager.enqueue_version(version, primary_only=True)) == 2
+
+
+def test_bandwidth_cap_throttles_downloads(stand_in_server, tmp_path):
+    data = os.urandom(300 * 1024)
+    manager = make_manager(tmp_path, bytes_per_second=200 * 1024)
+    manager.downloader.chunk_size = 16 * 1024
+    manager.enqueue(model_file(stand_in_server, "big.bin", data))
+    started = time.monotonic()
+    with manager:
+        pass
+    assert time.monotonic() - started >= 0.4
+    assert (tmp_path / "models" / "big.bin").read_bytes() == data
+
+
+def test_queue_state_survives_restart(stand_in_server, tmp_path):
+    first = make_manager(tmp_path)
+    first.enqueue(model_file(stand_in_server, "a.bin", b"a"))
+    first.enqueue(stand_in_server.url + "/missing", dest=tmp_path / "missing.bin")
+
+    seen = []
+    second = make_manager(tmp_path, on_progress=lambda task: seen.append(task.status))
+    with second:
+        pass
+    statuses = {os.path.basename(t.dest): t for t in second.tasks}
+    assert statuses["a.bin"].status == DownloadStatus.DONE
+    assert statuses["missing.bin"].status == DownloadStatus.FAILED
+    assert statuses["missing.bin"].error
+    assert DownloadStatus.RUNNING in seen
@@ -1,3 +1,4 @@
+import json
 from unittest.mock import patch
 
 import pytest
@@ -17,7 +18,7 @@ def test_modelsapi_list_models_empty():
     api = ModelsAPI()
     mock_response = {"items": [], "metadata": {}}
     with patch.object(api, "session") as mock_session:
-        mock_session.get.return_value.json.return_value = mock_response
+        mock_session.get.return_value.content = json.dumps(mock_response).encode()
         mock_session.get.return_value.raise_for_status.return_value = None
         models = next(api.list_models())
         assert models == []
@@ -0,0 +1,71 @@
+"""Unit tests for bulk hash resolution."""
+
+import pytest
+
+from civitai_api import Civitai, DiskCache, HashResolver
+from civitai_api.civitai_api.exceptions import CivitaiAPIError
+
+
+def version(version_id, *hashes):
+    files = [{"name": "f", "id": version_id, "hashes": {"SHA256": h}} for h in hashes]
+    return {"id": version_id, "modelId": 1, "name": "v", "files": files, "stats": {}}
+
+
+def make_civitai(server, **kwargs):
+    civitai = Civitai(**kwargs)
+    civitai.model_versions.BASE_URL = server.url
+    return civitai
+
+
+def test_resolve_caches_found_and_unknown_hashes(stand_in_server):
+    stand_in_server.json("/model-versions/by-hash/AAAA", version(1, "AAAA", "BBBB"))
+    resolver = HashResolver(make_civitai(stand_in_server).model_versions)
+
+    first = resolver.resolve(["aaaa", "AAAA", "CCCC"])
+    assert first["aaaa"].id == 1 and first["AAAA"] is first["aaaa"]
+    assert first["CCCC"] is None
+    assert len(stand_in_server.requests) == 2
+
+    second = resolver.resolve(["AAAA", "bbbb", "CCCC"])
+    assert second["bbbb"] is first["aaaa"]
+    assert second["CCCC"] is None
+    assert len(stand_in_server.requests) == 2
+
+
+def test_unknown_hashes_expire_after_negative_ttl(stand_in_server):
+    now = [0.0]
+    resolver = HashResolver(
+        make_civitai(stand_in_server).model_versions,
+        negative_ttl=60,
+        clock=lambda: now[0],
+    )
+    resolver.resolve(["DDDD"])
+    resolver.resolve(["DDDD"])
+    assert len(stand_in_server.requests) == 1
+    now[0] = 61
+    resolver.resolve(["DDDD"])
+    assert len(stand_in_server.requests) == 2
+
+
+def test_unknown_hashes_persist_in_disk_cache(stand_in_server, tmp_path):
+    disk = DiskCache(tmp_path / "cache.sqlite")
+    civitai = make_civitai(stand_in_server, disk_cache=disk)
+    HashResolver(civitai.model_versions).resolve(["EEEE"])
+    assert HashResolver(civitai.model_versions).resolve(["EEEE"]) == {"EEEE": None}
+    assert len(stand_in_server.requests) == 1
+
+
+def test_other_errors_are_raised_and_not_cached(stand_in_server):
+    stand_in_server.json("/model-versions/by-hash/AAAA", version(1, "AAAA"))
+    stand_in_server.json("/model-versions/by-hash/FFFF", {}, status=400)
+    resolver = HashResolver(make_civitai(stand_in_server).model_versions)
+    with pytest.raises(CivitaiAPIError) as excinfo:
+        resolver.resolve(["AAAA", "FFFF"])
+    assert excinfo.value.status_code == 400
+    with pytest.raises(CivitaiAPIError):
+        resolver.resolve(["AAAA", "FFFF"])
+    assert sorted(stand_in_server.requests) == [
+        "/model-versions/by-hash/AAAA",
+        "/model-versions/by-hash/FFFF",
+        "/model-versions/by-hash/FFFF",
+    ]
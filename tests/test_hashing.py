@@ -0,0 +1,62 @@
+"""Unit tests for local file hashing."""
+
+import hashlib
+import os
+import zlib
+
+import pytest
+
+from civitai_api import DiskCache, FileHasher, hash_file
+
+
+@pytest.fixture
+def model_file(tmp_path):
+    path = tmp_path / "model.safetensors"
+    path.write_bytes(os.urandom(0x130000))
+    return path
+
+
+def expected(data):
+    sha = hashlib.sha256(data).hexdigest().upper()
+    return {
+        "AutoV1": hashlib.sha256(data[0x100000:0x110000]).hexdigest()[:8].upper(),
+        "AutoV2": sha[:10],
+        "SHA256": sha,
+        "CRC32": f"{zlib.crc32(data):08X}",
+    }
+
+
+@pytest.mark.parametrize("chunk_size", [0x7000, 0x100000, 8 * 1024 * 1024])
+def test_hash_file_matches_reference_digests(model_file, chunk_size):
+    algorithms = ["AutoV1", "AutoV2", "SHA256", "CRC32"]
+    digests = hash_file(model_file, algorithms, chunk_size=chunk_size)
+    assert digests == expected(model_file.read_bytes())
+
+
+def test_hash_file_rejects_unknown_algorithm(model_file):
+    with pytest.raises(ValueError):
+        hash_file(model_file, ["MD5"])
+
+
+def test_file_hasher_caches_by_path_size_and_mtime(model_file, tmp_path):
+    disk = DiskCache(tmp_path / "cache.sqlite")
+    hasher = FileHasher(["SHA256"], disk_cache=disk)
+    first = hasher.hash_file(model_file)
+    assert FileHasher(["SHA256"], disk_cache=disk).hash_file(model_file) == first
+    assert disk.hits == 1
+
+    model_file.write_bytes(b"changed")
+    assert hasher.hash_file(model_file) == {
+        "SHA256": hashlib.sha256(b"changed").hexdigest().upper()
+    }
+
+
+def test_hash_files_reports_per_file_errors(model_file, tmp_path):
+    results = {
+        r.id: r
+        for r in FileHasher(["CRC32"]).hash_files([model_file, tmp_path / "missing"])
+    }
+    assert results[model_file].value == {
+        "CRC32": expected(model_file.read_bytes())["CRC32"]
+    }
+    assert isinstance(results[tmp_path / "missing"].error, OSError)
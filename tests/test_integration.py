@@ -76,7 +76,7 @@ def test_models_list_with_real_data():
 
     api = ModelsAPI()
     with patch.object(api, "session") as mock_session:
-        mock_session.get.return_value.json.return_value = recorded_response
+        mock_session.get.return_value.content = json.dumps(recorded_response).encode()
         mock_session.get.return_value.raise_for_status.return_value = None
 
         models = next(api.list_models(limit=10))
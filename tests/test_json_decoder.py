@@ -0,0 +1,86 @@
+"""Unit tests for the pluggable JSON decoder."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from civitai_api import Civitai, CivitaiAPIError
+from civitai_api.civitai_api import json_decoder
+from civitai_api.civitai_api.json_decoder import (
+    available_backends,
+    decode_response,
+    get_decoder,
+)
+
+BODY = {"items": [{"id": 1, "name": "Ünïcode", "stats": {"rating": 4.5}}]}
+
+
+@pytest.mark.parametrize("backend", available_backends())
+def test_backends_decode_bytes_and_text(backend):
+    loads = get_decoder(backend)
+    raw = json.dumps(BODY, ensure_ascii=False)
+    assert loads(raw.encode()) == BODY
+    assert loads(raw) == BODY
+    with pytest.raises(ValueError):
+        loads(b"{not json")
+
+
+def test_default_is_the_fastest_installed_backend(monkeypatch):
+    assert available_backends()[-1] == "json"
+    monkeypatch.setattr(json_decoder, "orjson", None)
+    monkeypatch.setattr(json_decoder, "msgspec", None)
+    assert get_decoder() is json.loads
+    spy = MagicMock(return_value={})
+    assert get_decoder(spy) is spy
+
+
+def test_unknown_or_missing_backends_are_rejected(monkeypatch):
+    with pytest.raises(ValueError, match="Unknown JSON backend"):
+        get_decoder("simdjson")
+    monkeypatch.setattr(json_decoder, "msgspec", None)
+    with pytest.raises(ImportError, match="msgspec"):
+        get_decoder("msgspec")
+
+
+def test_msgspec_decode_errors_are_value_errors(monkeypatch):
+    class DecodeError(Exception):
+        pass
+
+    def decode(data):
+        if data == b"{not json":
+            raise DecodeError("malformed")
+        return json.loads(data)
+
+    fake = SimpleNamespace(
+        DecodeError=DecodeError,
+        json=SimpleNamespace(Decoder=lambda: SimpleNamespace(decode=decode)),
+    )
+    monkeypatch.setattr(json_decoder, "msgspec", fake)
+    loads = get_decoder("msgspec")
+    assert loads(b"[1]") == [1]
+    with pytest.raises(ValueError, match="malformed"):
+        loads(b"{not json")
+
+
+def test_decode_response_reads_raw_bytes():
+    response = requests.Response()
+    response._content = json.dumps(BODY).encode()
+    loads = MagicMock(side_effect=json.loads)
+    assert decode_response(response, loads) == BODY
+    loads.assert_called_once_with(response._content)
+
+
+def test_client_uses_the_transport_decoder(stand_in_server):
+    stand_in_server.json("/tags", {"items": [{"name": "anime"}]})
+    stand_in_server.route("/broken", lambda _request: (200, {}, b"{not json"))
+    loads = MagicMock(side_effect=json.loads)
+    civitai = Civitai(json_decoder=loads)
+    civitai.tags.BASE_URL = stand_in_server.url
+
+    assert civitai.tags.get("tags")["items"] == [{"name": "anime"}]
+    assert loads.call_count == 1
+    with pytest.raises(CivitaiAPIError, match="Invalid JSON response"):
+        civitai.tags.get("broken")
@@ -0,0 +1,51 @@
+"""Unit tests for lazily parsed nested fields."""
+
+import copy
+import dataclasses
+import json
+import pickle
+from pathlib import Path
+
+from civitai_api.civitai_api.api.models import parse_model
+from civitai_api.civitai_api.models.lazy import Deferred
+from civitai_api.civitai_api.models.model_version import ModelVersion
+
+FIXTURES = json.loads(
+    (Path(__file__).parent / "fixtures" / "api_responses.json").read_text()
+)
+ITEM = FIXTURES["model_get_1102"]
+
+
+def test_model_versions_are_parsed_on_first_access_and_cached():
+    model = parse_model(ITEM)
+    assert isinstance(vars(model)["modelVersions"], Deferred)
+    versions = model.modelVersions
+    assert all(isinstance(v, ModelVersion) for v in versions)
+    assert model.modelVersions is versions
+    assert len(versions) == len(ITEM["modelVersions"])
+    assert isinstance(vars(versions[0])["files"], Deferred)
+    assert versions[0].files[0].name == ITEM["modelVersions"][0]["files"][0]["name"]
+
+
+def test_lazy_models_compare_copy_and_pickle_like_eager_ones():
+    untouched, touched = parse_model(ITEM), parse_model(ITEM)
+    for version in touched.modelVersions:
+        assert version.files is not None
+    assert untouched == touched
+    assert dataclasses.asdict(untouched) == dataclasses.asdict(touched)
+    assert pickle.loads(pickle.dumps(parse_model(ITEM))) == touched
+    assert copy.deepcopy(parse_model(ITEM)) == touched
+    touched.modelVersions = []
+    assert touched.modelVersions == []
+    assert untouched != touched
+
+
+def test_lazy_fields_are_plain_required_dataclass_fields():
+    fields = {f.name: f for f in dataclasses.fields(ModelVersion)}
+    assert fields["files"].default is dataclasses.MISSING
+    assert fields["images"].default is dataclasses.MISSING
+    model = parse_model(ITEM)
+    renamed = dataclasses.replace(model, name="renamed")
+    assert renamed.name == "renamed"
+    assert renamed.modelVersions == parse_model(ITEM).modelVersions
+    assert not isinstance(vars(renamed)["modelVersions"], Deferred)
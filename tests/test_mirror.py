@@ -0,0 +1,196 @@
+"""Tests for the local SQLite mirror."""
+
+import sqlite3
+
+import pytest
+
+from civitai_api import Civitai
+from civitai_api.civitai_api.api.models import parse_model
+from civitai_api.civitai_api.mirror import ModelMirror
+
+
+def model(i, downloads=10, versions=1):
+    return {
+        "id": i,
+        "name": f"model {i}",
+        "description": "<p>desc</p>",
+        "type": "LORA",
+        "nsfw": False,
+        "tags": ["style", f"tag{i}"],
+        "creator": {"username": f"user{i % 3}", "image": None},
+        "stats": {
+            "downloadCount": downloads,
+            "favoriteCount": 1,
+            "commentCount": 2,
+            "ratingCount": 3,
+            "rating": 4.5,
+        },
+        "modelVersions": [
+            {
+                "id": i * 10 + v,
+                "modelId": i,
+                "name": f"v{v}",
+                "createdAt": "2024-01-02T03:04:05.678Z",
+                "downloadUrl": f"http://dl/{i * 10 + v}",
+                "trainedWords": ["word"],
+                "baseModel": "SDXL 1.0",
+                "stats": {"downloadCount": 1, "ratingCount": 2, "rating": 5.0},
+                "files": [
+                    {
+                        "id": i * 100 + v,
+                        "name": "file.safetensors",
+                        "sizeKB": 1024.5,
+                        "type": "Model",
+                        "format": "SafeTensor",
+                        "pickleScanResult": "Success",
+                        "pickleScanMessage": "No Pickle imports",
+                        "virusScanResult": "Success",
+                        "scannedAt": "2024-01-02T03:04:05Z",
+                        "hashes": {"SHA256": f"{i:064X}"},
+                        "downloadUrl": f"http://dl/{i * 10 + v}",
+                        "primary": True,
+                    }
+                ],
+                "images": [
+                    {
+                        "url": f"http://img/{i}/{v}",
+                        "nsfw": False,
+                        "width": 512,
+                        "height": 768,
+                        "hash": "h",
+                        "meta": {"prompt": "p"},
+                    }
+                ],
+            }
+            for v in range(versions)
+        ],
+    }
+
+
+class Catalog:
+    """Models served newest (highest ID) first, ``size`` per page."""
+
+    def __init__(self, stand_in_server, size=2):
+        self.models = {}
+        self.size = size
+        self.server = stand_in_server
+        stand_in_server.route("/models", self.page)
+
+    def page(self, request):
+        page = int(request.path.partition("page=")[2].partition("&")[0] or 1)
+        newest = sorted(self.models.values(), key=lambda m: -m["id"])
+        items = newest[(page - 1) * self.size : page * self.size]
+        more = page * self.size < len(newest)
+        next_page = f"{self.server.url}/models?page={page + 1}" if more else None
+        return 200, {}, {"items": items, "metadata": {"nextPage": next_page}}
+
+
+@pytest.fixture
+def api(stand_in_server):
+    civitai = Civitai()
+    civitai.models.BASE_URL = stand_in_server.url
+    return civitai.models
+
+
+def test_first_sync_loads_the_whole_catalog(tmp_path, stand_in_server, api):
+    catalog = Catalog(stand_in_server)
+    catalog.models = {i: model(i) for i in range(1, 6)}
+    with ModelMirror(tmp_path / "mirror.db") as mirror:
+        stats = mirror.sync(api, prefetch=0)
+        assert stats.pages_fetched == 3
+        assert stats.models == 5
+        assert stats.inserted == {
+            "models": 5,
+            "model_stats": 5,
+            "model_tags": 10,
+            "model_versions": 5,
+            "version_stats": 5,
+            "files": 5,
+            "images": 5,
+        }
+        assert stats.rows_updated == 0
+        assert stats.high_water_mark == mirror.high_water_mark == 5
+        assert mirror.count("files") == 5
+        assert "sortBy=Newest" in stand_in_server.requests[0]
+
+
+def test_incremental_sync_stops_at_the_high_water_mark(tmp_path, stand_in_server, api):
+    catalog = Catalog(stand_in_server)
+    catalog.models = {i: model(i) for i in range(1, 9)}
+    path = tmp_path / "mirror.db"
+    with ModelMirror(path) as mirror:
+        mirror.sync(api, prefetch=0)
+
+    catalog.models[9] = model(9)
+    catalog.models[8] = model(8, downloads=99, versions=2)
+    requests = len(stand_in_server.requests)
+    with ModelMirror(path) as mirror:
+        stats = mirror.sync(api, prefetch=0)
+        assert stats.pages_fetched == 2  # [9, 8], then [7, 6], all below the mark.
+        assert len(stand_in_server.requests) - requests == 2
+        assert stats.inserted["models"] == 1
+        assert stats.updated["models"] == 3
+        assert stats.inserted["model_versions"] == 2
+        assert mirror.high_water_mark == 9
+        assert mirror.count() == 9
+        assert mirror.count("model_versions") == 10
+        downloads = mirror.conn.execute(
+            "SELECT download_count FROM model_stats WHERE model_id = 8"
+        ).fetchone()
+        assert downloads == (99,)
+
+
+def test_rewriting_a_model_replaces_its_children(tmp_path):
+    with ModelMirror(tmp_path / "mirror.db") as mirror:
+        first = mirror.write([parse_model(model(1, versions=3))])
+        assert first.inserted["files"] == 3
+        second = mirror.write([parse_model(model(1, versions=1))])
+        assert second.updated == {
+            "models": 1,
+            "model_stats": 1,
+            "model_tags": 2,
+            "model_versions": 1,
+            "version_stats": 1,
+            "files": 1,
+            "images": 1,
+        }
+        assert second.rows_inserted == 0
+        assert mirror.count("model_versions") == 1
+        assert mirror.count("images") == 1
+        row = mirror.conn.execute(
+            "SELECT created_at, trained_words FROM model_versions"
+        ).fetchone()
+        assert row == ("2024-01-02T03:04:05.678000+00:00", '["word"]')
+        with pytest.raises(ValueError, match="Unknown table"):
+            mirror.count("nope")
+
+
+def test_failed_write_leaves_the_mirror_unchanged(tmp_path):
+    with ModelMirror(tmp_path / "mirror.db") as mirror:
+        mirror.write([parse_model(model(1))])
+        broken = parse_model(model(1, downloads=99))
+        broken.modelVersions[0].files[0].name = object()  # Cannot be stored.
+        with pytest.raises(sqlite3.Error):
+            mirror.write([parse_model(model(3)), broken])
+        assert mirror.count() == 1
+        assert mirror.count("files") == 1
+        downloads = mirror.conn.execute("SELECT download_count FROM model_stats")
+        assert downloads.fetchone() == (10,)
+
+
+def test_refresh_pages_rewalk_below_the_high_water_mark(tmp_path, stand_in_server, api):
+    catalog = Catalog(stand_in_server)
+    catalog.models = {i: model(i) for i in range(1, 9)}
+    with ModelMirror(tmp_path / "mirror.db") as mirror:
+        mirror.sync(api, prefetch=0)
+        catalog.models[5] = model(5, downloads=99)
+        stats = mirror.sync(api, prefetch=0)
+        assert stats.pages_fetched == 1
+        stats = mirror.sync(api, prefetch=0, refresh_pages=1)
+        assert stats.pages_fetched == 2  # [8, 7], then [6, 5].
+        assert stats.updated["models"] == 4
+        downloads = mirror.conn.execute(
+            "SELECT download_count FROM model_stats WHERE model_id = 5"
+        ).fetchone()
+        assert downloads == (99,)
+        assert mirror.sync(api, prefetch=0, full=True).pages_fetched == 4
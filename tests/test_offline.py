@@ -0,0 +1,151 @@
+"""Tests for offline queries over the local mirror."""
+
+import json
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from civitai_api import ModelMirror, OfflineModels
+from civitai_api.civitai_api.api.models import (
+    CommercialUse,
+    ModelCategory,
+    ModelPeriod,
+    ModelSort,
+    parse_model,
+)
+from civitai_api.civitai_api.models.model import BaseModel, ModelType
+from civitai_api.civitai_api.offline import search_query
+
+FIXTURES = json.loads(
+    (Path(__file__).parent / "fixtures" / "api_responses.json").read_text()
+)
+
+NOW = datetime.now(UTC)
+
+
+def model(i, name, tags, downloads, rating, **overrides):
+    created = (NOW - timedelta(days=overrides.pop("age_days", 400))).isoformat()
+    return {
+        "id": i,
+        "name": name,
+        "description": f"<p>A <b>{name}</b> model</p>",
+        "type": overrides.pop("type", "LORA"),
+        "nsfw": False,
+        "tags": tags,
+        "creator": {"username": overrides.pop("username", "alice"), "image": None},
+        "stats": {
+            "downloadCount": downloads,
+            "favoriteCount": 0,
+            "commentCount": 0,
+            "ratingCount": 10,
+            "rating": rating,
+        },
+        "allowNoCredit": overrides.pop("allowNoCredit", True),
+        "allowCommercialUse": overrides.pop("allowCommercialUse", ["Image"]),
+        "allowDerivatives": True,
+        "allowDifferentLicense": False,
+        "modelVersions": [
+            {
+                "id": i * 10,
+                "modelId": i,
+                "name": "v1",
+                "createdAt": created,
+                "downloadUrl": f"http://dl/{i}",
+                "trainedWords": [],
+                "baseModel": overrides.pop("baseModel", "SD 1.5"),
+                "stats": {"downloadCount": downloads, "ratingCount": 1, "rating": 5},
+                "files": [
+                    {"id": i * 100, "name": "a.safetensors", "primary": True},
+                    {"id": i * 100 + 1, "name": "b.ckpt", "primary": False},
+                ],
+                "images": [],
+            }
+        ],
+    }
+
+
+CATALOG = [
+    model(1, "Synthwave Punk", ["style", "synthwave"], 500, 4.9),
+    model(2, "Anime Girl", ["Character", "anime"], 900, 4.5, username="bob"),
+    model(
+        3,
+        "Café Racer",
+        ["vehicle"],
+        100,
+        3.9,
+        type="Checkpoint",
+        baseModel="SDXL 1.0",
+        age_days=2,
+        allowCommercialUse=["Image", "Sell"],
+        allowNoCredit=False,
+    ),
+    model(4, "Neon Style", ["style"], 50, 5.0),
+]
+
+
+@pytest.fixture
+def offline(tmp_path):
+    with ModelMirror(tmp_path / "mirror.db") as mirror:
+        mirror.write([parse_model(item) for item in CATALOG])
+        mirror.write([parse_model(FIXTURES["model_get_1102"])])
+        yield OfflineModels(mirror)
+
+
+def ids(models):
+    return [m.id for m in models]
+
+
+def test_query_searches_names_descriptions_and_tags(offline):
+    assert sorted(ids(offline.list_models(query="synthw"))) == [1, 1102]
+    assert ids(offline.list_models(query="neon style", sort=ModelSort.NEWEST)) == [4]
+    assert ids(offline.list_models(query="cafe")) == [3]  # Diacritics are ignored.
+    assert ids(offline.list_models(query="anime", tag="style")) == []
+    assert offline.list_models(query='" OR *') == []
+    assert search_query('foo "bar" -baz') == '"foo"* "bar"* "baz"*'
+
+
+def test_filters_match_list_models_arguments(offline):
+    assert ids(offline.list_models(tag="style")) == [1102, 4, 1]
+    assert ids(offline.list_models(username="bob")) == [2]
+    assert ids(offline.list_models(tag="CHARACTER")) == [2]
+    assert ids(offline.list_models(types=[ModelType.CHECKPOINT])) == [1102, 3]
+    assert ids(offline.list_models(base_models=[BaseModel.SDXL_1_0])) == [3]
+    assert ids(offline.list_models(rating=5)) == [4]
+    assert ids(offline.list_models(allow_no_credit=False)) == [3]
+    assert ids(offline.list_models(categories=[ModelCategory.CHARACTER])) == [2]
+    assert ids(offline.list_models(allow_commercial_use=[CommercialUse.SELL])) == [
+        1102,
+        3,
+    ]
+    assert ids(offline.list_models(period=ModelPeriod.WEEK)) == [3]
+    with pytest.raises(ValueError, match="favorites"):
+        offline.list_models(favorites=True)
+
+
+def test_sorting_and_paging(offline):
+    by_downloads = offline.list_models(sort=ModelSort.MOST_DOWNLOADED, limit=2)
+    assert ids(by_downloads) == [1102, 2]
+    page_two = offline.list_models(sort=ModelSort.MOST_DOWNLOADED, limit=2, page=2)
+    assert ids(page_two) == [1, 3]
+    assert ids(offline.list_models(sort=ModelSort.HIGHEST_RATED, limit=2)) == [4, 1]
+
+
+def test_models_round_trip_through_the_mirror(offline):
+    original = parse_model(FIXTURES["model_get_1102"])
+    for version in original.modelVersions:
+        version.modelId = 1102  # The mirror keys versions by their model.
+    assert offline.get_model(1102) == original
+    assert offline.get_model(999) is None
+    primary = offline.list_models(username="alice", primary_file_only=True)
+    assert all(len(v.files) == 1 for m in primary for v in m.modelVersions)
+
+
+def test_rewritten_models_are_reindexed(offline):
+    renamed = parse_model(CATALOG[0])
+    renamed.name = "Vaporwave Punk"
+    renamed.description = None
+    renamed.tags = ["style"]
+    offline.mirror.write([renamed])
+    assert ids(offline.list_models(query="synthwave")) == [1102]
+    assert ids(offline.list_models(query="vaporwave")) == [1]
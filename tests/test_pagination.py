@@ -0,0 +1,118 @@
+"""Unit tests for the item-level list iterators."""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from civitai_api import AsyncCivitai, Civitai
+from civitai_api.civitai_api.utils import next_page
+
+FIXTURES = json.loads(
+    (Path(__file__).parent / "fixtures" / "api_responses.json").read_text()
+)
+
+
+def tag(i):
+    return {"name": f"tag{i}", "modelCount": i, "link": f"/tags/{i}"}
+
+
+@pytest.fixture
+def civitai(stand_in_server):
+    client = Civitai()
+    for api in (client.creators, client.images, client.models, client.tags):
+        api.BASE_URL = stand_in_server.url
+    return client
+
+
+def test_next_page_prefers_next_page_then_cursor_then_page_numbers():
+    assert next_page({"nextPage": "http://x/next"}, "u", {"a": 1}) == (
+        "http://x/next",
+        None,
+    )
+    assert next_page({"nextCursor": "c2"}, "u", {"a": 1}) == (
+        "u",
+        {"a": 1, "cursor": "c2"},
+    )
+    assert next_page({"currentPage": 1, "totalPages": 2}, "u", None) == (
+        "u",
+        {"page": 2},
+    )
+    assert next_page({"currentPage": 2, "totalPages": 2}, "u", None) is None
+
+
+def test_iter_images_follows_cursors(stand_in_server, civitai):
+    image = {
+        "url": "http://img",
+        "hash": "h",
+        "width": 1,
+        "height": 1,
+        "nsfw": False,
+        "createdAt": "2025-08-14T12:34:56Z",
+        "postId": 1,
+        "stats": {},
+        "meta": {},
+        "username": "u",
+    }
+
+    def images(request):
+        cursor = request.path.partition("cursor=")[2] or "0"
+        n = int(cursor)
+        metadata = {"nextCursor": str(n + 1)} if n < 2 else {}
+        return 200, {}, {"items": [{**image, "id": n}], "metadata": metadata}
+
+    stand_in_server.route("/images", images)
+    assert [i.id for i in civitai.images.iter_images(limit=1)] == [0, 1, 2]
+
+
+def test_iter_tags_follows_page_numbers_and_stops_at_max_items(
+    stand_in_server, civitai
+):
+    def tags(request):
+        page = int(request.path.partition("page=")[2] or 1)
+        items = [tag(page * 10 + i) for i in range(2)]
+        total = 3 if page <= 3 else 9
+        return (
+            200,
+            {},
+            {"items": items, "metadata": {"currentPage": page, "totalPages": total}},
+        )
+
+    stand_in_server.route("/tags", tags)
+    assert [t.modelCount for t in civitai.tags.iter_tags()] == [10, 11, 20, 21, 30, 31]
+    requests_before = len(stand_in_server.requests)
+    assert len(list(civitai.tags.iter_tags(max_items=3, page=5))) == 3
+    assert len(stand_in_server.requests) - requests_before == 2
+
+
+def test_iter_models_and_creators_follow_next_page(stand_in_server, civitai):
+    items = FIXTURES["models_list_page1"]["items"]
+    stand_in_server.json(
+        "/models",
+        {"items": items[:2], "metadata": {"nextPage": f"{stand_in_server.url}/m2"}},
+    )
+    stand_in_server.json("/m2", {"items": items[2:3], "metadata": {}})
+    stand_in_server.json("/creators", {"items": [], "metadata": {"nextPage": "x"}})
+    assert len(list(civitai.models.iter_models(limit=2))) == 3
+    assert list(civitai.creators.iter_creators()) == []
+
+
+def test_async_iter_tags(stand_in_server):
+    pytest.importorskip("httpx")
+
+    def tags(request):
+        page = int(request.path.partition("page=")[2] or 1)
+        return (
+            200,
+            {},
+            {"items": [tag(page)], "metadata": {"currentPage": page, "totalPages": 2}},
+        )
+
+    stand_in_server.route("/tags", tags)
+
+    async def crawl():
+        async with AsyncCivitai(base_url=stand_in_server.url) as civitai:
+            return [t.name async for t in civitai.tags.iter_tags()]
+
+    assert asyncio.run(crawl()) == ["tag1", "tag2"]
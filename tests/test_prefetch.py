@@ -0,0 +1,105 @@
+"""Unit tests for read-ahead pagination."""
+
+import asyncio
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from civitai_api import Civitai
+from civitai_api.civitai_api.prefetch import read_ahead, read_ahead_async
+
+FIXTURES = json.loads(
+    (Path(__file__).parent / "fixtures" / "api_responses.json").read_text()
+)
+
+
+def slow_pages(count, delay=0.05, produced=None):
+    for i in range(count):
+        time.sleep(delay)
+        if produced is not None:
+            produced.append(i)
+        yield i
+
+
+def test_read_ahead_overlaps_fetching_and_processing():
+    started = time.monotonic()
+    for _ in read_ahead(slow_pages(6), depth=1):
+        time.sleep(0.05)
+    assert time.monotonic() - started < 0.5
+
+
+def test_read_ahead_keeps_order_and_bounds_depth():
+    produced = []
+    pages = read_ahead(slow_pages(10, delay=0, produced=produced), depth=2)
+    assert next(pages) == 0
+    time.sleep(0.1)
+    assert len(produced) == 3
+    assert list(pages) == list(range(1, 10))
+
+
+def test_read_ahead_raises_errors_in_place():
+    def failing():
+        yield 1
+        raise ValueError("page 2")
+
+    pages = read_ahead(failing(), depth=3)
+    assert next(pages) == 1
+    with pytest.raises(ValueError):
+        next(pages)
+
+
+def test_read_ahead_async_preserves_order():
+    async def pages():
+        for i in range(5):
+            await asyncio.sleep(0.001)
+            yield i
+
+    async def run():
+        return [page async for page in read_ahead_async(pages(), depth=2)]
+
+    assert asyncio.run(run()) == list(range(5))
+
+
+def test_read_ahead_async_closes_pages_when_the_consumer_stops():
+    closed = []
+
+    async def pages():
+        try:
+            for i in range(5):
+                yield i
+        finally:
+            closed.append(True)
+
+    async def run():
+        ahead = read_ahead_async(pages(), depth=2)
+        first = await anext(ahead)
+        await ahead.aclose()
+        return first, [
+            t for t in asyncio.all_tasks() if t is not asyncio.current_task()
+        ]
+
+    first, pending = asyncio.run(run())
+    assert first == 0
+    assert closed == [True]
+    assert pending == []
+
+
+def test_list_models_with_prefetch_follows_next_page(stand_in_server):
+    items = FIXTURES["models_list_page1"]["items"]
+    stand_in_server.json(
+        "/models",
+        {
+            "items": items[:2],
+            "metadata": {"nextPage": f"{stand_in_server.url}/page2?cursor=abc"},
+        },
+    )
+    stand_in_server.json("/page2", {"items": items[2:3], "metadata": {}})
+    models = Civitai().models
+    models.BASE_URL = stand_in_server.url
+    pages = list(models.list_models(limit=2, prefetch=2))
+    assert [[m.id for m in page] for page in pages] == [
+        [item["id"] for item in items[:2]],
+        [items[2]["id"]],
+    ]
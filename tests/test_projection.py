@@ -0,0 +1,116 @@
+"""Unit tests for field projections."""
+
+import gc
+import json
+import weakref
+from pathlib import Path
+
+import pytest
+
+from civitai_api import Civitai, ObjectCache
+from civitai_api.civitai_api.api.images import parse_image
+from civitai_api.civitai_api.api.models import parse_model
+from civitai_api.civitai_api.projection import parse_fields, projected
+
+FIXTURES = json.loads(
+    (Path(__file__).parent / "fixtures" / "api_responses.json").read_text()
+)
+ITEM = FIXTURES["model_get_1102"]
+IMAGE = {
+    "id": 7,
+    "url": "http://img",
+    "hash": "h",
+    "width": 512,
+    "height": 768,
+    "nsfw": False,
+    "createdAt": "2025-08-14T12:34:56Z",
+    "postId": 1,
+    "stats": {"likeCount": 3, "heartCount": 2},
+    "meta": {"prompt": "a very long prompt"},
+    "username": "u",
+}
+
+
+def test_parse_fields_builds_a_tree():
+    assert parse_fields(None) is None
+    assert parse_fields(
+        ["id", "stats.downloadCount", "modelVersions.files.hashes"]
+    ) == {
+        "id": {},
+        "stats": {"downloadCount": {}},
+        "modelVersions": {"files": {"hashes": {}}},
+    }
+    # Selecting a whole object wins over selecting parts of it, in either order.
+    assert parse_fields(["stats.rating", "stats"]) == {"stats": {}}
+    assert parse_fields(["stats", "stats.rating"]) == {"stats": {}}
+
+
+def test_projected_model_only_builds_requested_fields():
+    fields = ["id", "name", "stats.downloadCount", "modelVersions.files.hashes"]
+    model = parse_model(ITEM, parse_fields(fields))
+    full = parse_model(ITEM)
+
+    assert (model.id, model.name) == (full.id, full.name)
+    assert model.description is None
+    assert model.type is None
+    assert model.creator is None
+    assert model.stats.downloadCount == full.stats.downloadCount
+    assert model.stats.rating is None
+    version = model.modelVersions[0]
+    assert version.name is None
+    assert version.images is None
+    assert version.files[0].hashes == full.modelVersions[0].files[0].hashes
+    assert version.files[0].name is None
+
+
+def test_projected_image_skips_meta():
+    image = parse_image(IMAGE, parse_fields(["id", "url", "stats.likeCount"]))
+    assert (image.id, image.url, image.stats.likeCount) == (7, "http://img", 3)
+    assert image.meta is None
+    assert image.createdAt is None
+    assert image.stats.heartCount is None
+    assert parse_image(IMAGE).meta == IMAGE["meta"]
+
+
+def test_unknown_fields_are_rejected():
+    with pytest.raises(ValueError, match="Unknown fields for ModelStats: downloads"):
+        parse_model(ITEM, parse_fields(["stats.downloads"]))
+
+
+def test_projected_parsers_do_not_keep_their_instances_alive():
+    civitai = Civitai()
+    parse = civitai.models._parse_model_version
+    slim = projected(parse, ["id", "name"])
+    assert slim == projected(civitai.models._parse_model_version, ["name", "id"])
+    assert slim != projected(parse, ["id"])
+    assert slim(ITEM["modelVersions"][0]).id == ITEM["modelVersions"][0]["id"]
+
+    instance = weakref.ref(civitai.models)
+    del civitai, parse, slim
+    gc.collect()
+    assert instance() is None
+
+
+def test_projected_objects_are_cached_apart_from_full_ones(stand_in_server):
+    stand_in_server.json("/models/1102", ITEM)
+    civitai = Civitai(object_cache=ObjectCache())
+    civitai.models.BASE_URL = stand_in_server.url
+
+    slim = civitai.models.get_model(1102, fields=["id", "name"])
+    assert slim.description is None
+    assert civitai.models.get_model(1102, fields=["name", "id"]) is slim
+    full = civitai.models.get_model(1102)
+    assert full.description == ITEM["description"]
+    assert civitai.models.get_model(1102) is full
+    assert len(stand_in_server.requests) == 2
+
+
+def test_list_models_applies_the_projection(stand_in_server):
+    page = {**FIXTURES["models_list_page1"], "metadata": {}}
+    stand_in_server.json("/models", page)
+    civitai = Civitai()
+    civitai.models.BASE_URL = stand_in_server.url
+
+    models = next(civitai.models.list_models(fields=["id"]))
+    assert [m.id for m in models] == [item["id"] for item in page["items"]]
+    assert all(m.name is None and m.modelVersions is None for m in models)
@@ -0,0 +1,68 @@
+"""Unit tests for the client-side rate limiter."""
+
+import pytest
+
+from civitai_api import Civitai, RateLimiter, RateLimitError, RetryPolicy
+from civitai_api.civitai_api.ratelimit import parse_retry_after
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_reserve_spaces_requests_after_burst():
+    clock = FakeClock()
+    limiter = RateLimiter(rate=2, burst=2, clock=clock)
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == pytest.approx(0.5)
+    assert limiter.reserve() == pytest.approx(1.0)
+    clock.now += 1.0
+    assert limiter.reserve() == pytest.approx(0.5)
+
+
+def test_observe_429_pauses_and_halves_budget():
+    clock = FakeClock()
+    limiter = RateLimiter(rate=10, burst=5, clock=clock)
+    assert limiter.observe(429, {"Retry-After": "3"}) == 3
+    assert limiter.rate == 5
+    assert limiter.reserve() == pytest.approx(3 + 1 / 5)
+    for _ in range(100):
+        limiter.observe(200, {})
+    assert limiter.rate == 10
+
+
+def test_observe_exhausted_window_pauses_until_reset():
+    clock = FakeClock()
+    limiter = RateLimiter(rate=10, burst=5, clock=clock)
+    limiter.observe(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "2"})
+    assert limiter.reserve() == pytest.approx(2 + 1 / 10)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after({"Retry-After": "7"}) == 7
+    assert parse_retry_after({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0
+    assert parse_retry_after({"Retry-After": "soon"}) is None
+    assert parse_retry_after({}) is None
+
+
+def test_client_waits_out_429_and_retries(stand_in_server):
+    answers = iter([(429, {"Retry-After": "0"}, {}), (200, {}, {"items": []})])
+    stand_in_server.route("/tags", lambda _request: next(answers))
+    civitai = Civitai(requests_per_second=50)
+    assert civitai.tags.get(f"{stand_in_server.url}/tags") == {"items": []}
+    assert len(stand_in_server.requests) == 2
+    assert civitai.models.transport.rate_limiter is civitai.tags.transport.rate_limiter
+
+
+def test_client_raises_after_max_attempts(stand_in_server):
+    stand_in_server.json("/tags", {}, status=429, headers={"Retry-After": "0"})
+    civitai = Civitai(requests_per_second=50, retry_policy=RetryPolicy(max_attempts=2))
+    with pytest.raises(RateLimitError) as excinfo:
+        civitai.tags.get(f"{stand_in_server.url}/tags")
+    assert excinfo.value.retry_after == 0
+    assert len(stand_in_server.requests) == 2
@@ -0,0 +1,90 @@
+"""Unit tests for the retry policy and its use by the clients."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from civitai_api import Civitai, CivitaiAPIError, RateLimitError, RetryPolicy
+from civitai_api.civitai_api.api.models import ModelsAPI
+from civitai_api.civitai_api.retry import RetryBudget
+from civitai_api.civitai_api.transport import Transport
+
+
+def fast_policy(**kwargs) -> RetryPolicy:
+    return RetryPolicy(backoff_base=0.001, backoff_cap=0.002, **kwargs)
+
+
+def test_should_retry_respects_status_method_and_attempts():
+    policy = RetryPolicy(max_attempts=3)
+    assert policy.should_retry("GET", 1, status_code=502)
+    assert not policy.should_retry("GET", 1, status_code=404)
+    assert not policy.should_retry("POST", 1, status_code=502)
+    assert not policy.should_retry("GET", 3, status_code=502)
+    assert policy.should_retry("GET", 1, exception=requests.ConnectionError())
+    assert not policy.should_retry("GET", 1, exception=ValueError())
+
+
+def test_budget_caps_retries():
+    now = [0.0]
+    budget = RetryBudget(
+        ratio=0.5, min_per_second=0, max_balance=2, clock=lambda: now[0]
+    )
+    policy = RetryPolicy(budget=budget)
+    assert policy.should_retry("GET", 1, status_code=503)
+    assert policy.should_retry("GET", 1, status_code=503)
+    assert not policy.should_retry("GET", 1, status_code=503)
+    policy.record_request()
+    policy.record_request()
+    assert policy.should_retry("GET", 1, status_code=503)
+
+
+def test_backoff_uses_decorrelated_jitter_within_bounds():
+    policy = RetryPolicy(backoff_base=1, backoff_cap=10)
+    delay = None
+    for _ in range(50):
+        delay = policy.backoff(delay)
+        assert 1 <= delay <= 10
+
+
+def test_client_retries_5xx_and_reports_through_hook(stand_in_server):
+    answers = iter([(502, {}, {}), (503, {}, {}), (200, {}, {"items": []})])
+    stand_in_server.route("/tags", lambda _request: next(answers))
+    events = []
+    civitai = Civitai(retry_policy=fast_policy(on_retry=events.append))
+    assert civitai.tags.get(f"{stand_in_server.url}/tags") == {"items": []}
+    assert [e.status_code for e in events] == [502, 503]
+    assert [e.attempt for e in events] == [1, 2]
+    assert civitai.transport.retry_policy.retries == 2
+
+
+def test_client_gives_up_after_max_attempts(stand_in_server):
+    stand_in_server.json("/tags", {}, status=500)
+    civitai = Civitai(retry_policy=fast_policy(max_attempts=2))
+    with pytest.raises(CivitaiAPIError):
+        civitai.tags.get(f"{stand_in_server.url}/tags")
+    assert len(stand_in_server.requests) == 2
+
+
+def test_list_models_pagination_retries_connection_errors():
+    api = ModelsAPI(transport=Transport(retry_policy=fast_policy()))
+    ok = MagicMock(status_code=200)
+    ok.content = json.dumps({"items": [], "metadata": {}}).encode()
+    with patch.object(api, "session") as mock_session:
+        mock_session.get.side_effect = [requests.ConnectionError("reset"), ok]
+        assert next(api.list_models()) == []
+        assert mock_session.get.call_count == 2
+
+
+def test_list_models_pagination_raises_api_errors(stand_in_server):
+    civitai = Civitai(retry_policy=fast_policy(max_attempts=2))
+    civitai.models.BASE_URL = stand_in_server.url
+    stand_in_server.json("/models", {}, status=500)
+    with pytest.raises(CivitaiAPIError) as error:
+        next(civitai.models.list_models())
+    assert error.value.status_code == 500
+    assert len(stand_in_server.requests) == 2
+    stand_in_server.json("/models", {}, status=429)
+    with pytest.raises(RateLimitError):
+        next(civitai.models.list_models())
@@ -0,0 +1,103 @@
+"""Unit tests for the compiled schema parsers."""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+from civitai_api.civitai_api.api.creators import parse_creator
+from civitai_api.civitai_api.api.models import parse_model, parse_model_version
+from civitai_api.civitai_api.api.tags import parse_tag
+from civitai_api.civitai_api.projection import build, parse_fields
+from civitai_api.civitai_api.schema import Field, Schema
+
+FIXTURES = json.loads(
+    (Path(__file__).parent / "fixtures" / "api_responses.json").read_text()
+)
+
+
+@dataclass
+class Inner:
+    a: int | None
+    b: int | None
+
+
+@dataclass
+class Outer:
+    id: int | None
+    size: int | None
+    count: int
+    label: str
+    when: str | None
+    inner: Inner
+    extra: object
+
+
+INNER = Schema(Inner, {"a": None, "b": None})
+OUTER = Schema(
+    Outer,
+    {
+        "id": None,
+        "size": Field(key="sizeKB"),
+        "count": Field(convert=int, default=0),
+        "label": Field(default=""),
+        "when": Field(convert=str.upper, optional=True),
+        "inner": Field(schema=INNER),
+        "extra": Field(builder=lambda item, fields: (item.get("id"), fields)),
+    },
+)
+
+
+@pytest.mark.parametrize(
+    "item",
+    [
+        {
+            "id": 1,
+            "sizeKB": 2,
+            "count": "3",
+            "label": "x",
+            "when": "now",
+            "inner": {"a": 4},
+        },
+        {},
+        {"count": None, "label": None, "when": "", "inner": None},
+    ],
+)
+def test_compiled_decoder_matches_the_builders(item):
+    assert OUTER(item) == build(Outer, item, None, OUTER.builders)
+
+
+def test_missing_keys_give_defaults():
+    assert OUTER({}) == Outer(None, None, 0, "", None, Inner(None, None), (None, None))
+
+
+def test_projection_uses_the_builders():
+    outer = OUTER({"id": 1, "inner": {"a": 4, "b": 5}}, parse_fields(["inner.b"]))
+    assert outer == Outer(None, None, None, None, None, Inner(None, 5), None)
+    with pytest.raises(ValueError, match="Unknown fields for Outer: nope"):
+        OUTER({}, parse_fields(["nope"]))
+
+
+def test_decoder_is_compiled_once():
+    schema = Schema(Inner, {"a": None, "b": None})
+    schema({"a": 1})
+    decode = schema._decode
+    schema({"a": 2})
+    assert schema._decode is decode
+    assert decode.__name__ == "decode_Inner"
+
+
+def test_api_parsers_keep_their_output():
+    item = FIXTURES["model_get_1102"]
+    model = parse_model(item)
+    assert model.id == item["id"]
+    assert model.creator.username == item["creator"]["username"]
+    assert model.stats.downloadCount == item["stats"]["downloadCount"]
+    version = parse_model_version(item["modelVersions"][0])
+    file = version.files[0]
+    assert file.sizeKb == item["modelVersions"][0]["files"][0]["sizeKB"]
+    assert file.scannedAt is None or file.scannedAt.year >= 2000
+    assert parse_creator({}).username == ""
+    assert parse_creator({"modelCount": "4"}).modelCount == 4
+    assert parse_tag({"name": "t"}).link is None
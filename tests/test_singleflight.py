@@ -0,0 +1,100 @@
+"""Unit tests for coalescing concurrent identical requests."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from civitai_api import Civitai
+from civitai_api.civitai_api.singleflight import AsyncSingleFlight, SingleFlight
+
+MODEL_VERSION = {"id": 1, "modelId": 2, "name": "ver", "files": [], "stats": {}}
+
+
+def test_single_flight_shares_result_and_errors():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def work():
+        calls.append(1)
+        started.set()
+        release.wait()
+        return object()
+
+    with ThreadPoolExecutor(4) as pool:
+        leader = pool.submit(flight.do, "k", work)
+        started.wait()
+        followers = [pool.submit(flight.do, "k", work) for _ in range(3)]
+        while flight.shared < 3:
+            time.sleep(0.001)
+        release.set()
+        results = {id(f.result()) for f in [leader, *followers]}
+
+    assert len(calls) == 1 and len(results) == 1
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        flight.do("k", fail)
+
+
+def test_async_single_flight_shares_result():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return object()
+
+    async def run():
+        return await asyncio.gather(*(flight.do("k", work) for _ in range(5)))
+
+    results = asyncio.run(run())
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+
+
+def test_async_followers_survive_a_cancelled_leader():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return 42
+
+    async def run():
+        leader = asyncio.create_task(flight.do("k", work))
+        await asyncio.sleep(0)
+        followers = [asyncio.create_task(flight.do("k", work)) for _ in range(3)]
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await asyncio.gather(*followers)
+
+    assert asyncio.run(run()) == [42, 42, 42]
+    assert len(calls) == 2  # The cancelled call, then one rerun for all followers.
+    assert flight.shared == 2
+
+
+def test_concurrent_getters_share_one_request(stand_in_server):
+    def slow(_request):
+        time.sleep(0.2)
+        return 200, {}, MODEL_VERSION
+
+    stand_in_server.route("/model-versions/1", slow)
+    civitai = Civitai()
+    civitai.model_versions.BASE_URL = stand_in_server.url
+    with ThreadPoolExecutor(8) as pool:
+        versions = list(
+            pool.map(lambda _: civitai.model_versions.get_model_version(1), range(8))
+        )
+    assert len(stand_in_server.requests) == 1
+    assert all(v is versions[0] for v in versions)
@@ -0,0 +1,168 @@
+"""Tests for streaming list pages item by item."""
+
+import asyncio
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from civitai_api import AsyncCivitai, Civitai, CivitaiAPIError
+from civitai_api.civitai_api.streaming import ItemSplitter
+
+FIXTURES = json.loads(
+    (Path(__file__).parent / "fixtures" / "api_responses.json").read_text()
+)
+
+TRICKY = {
+    "text": 'quote " backslash \\ closing ] } and "items": [',
+    "unicode": "ünïcødé €",
+    "nested": [[1, {"a": []}], []],
+    "trailing": "\\",
+}
+
+
+def split(body, sizes):
+    splitter = ItemSplitter()
+    items, start = [], 0
+    while start < len(body):
+        size = next(sizes)
+        items += splitter.feed(body[start : start + size])
+        start += size
+    return [json.loads(item) for item in items], splitter.close(json.loads)
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_splitter_matches_a_whole_decode_for_any_chunking(indent):
+    body = {
+        "metadata": {"hint": "items", "nextPage": "http://x/models?a=[1]"},
+        "items": [FIXTURES["model_get_1102"], TRICKY, {}, []],
+        "after": {"items": [1, 2]},
+    }
+    raw = json.dumps(body, ensure_ascii=False, indent=indent).encode()
+    rng = random.Random(0)
+    for sizes in ([1], [3, 7], [64], [len(raw)], [1, 1000, 5, 100000]):
+        chunks = iter(lambda sizes=sizes: rng.choice(sizes), None)
+        items, rest = split(raw, chunks)
+        assert items == body["items"]
+        assert rest == {**body, "items": []}
+
+
+def test_splitter_buffers_one_item_at_a_time():
+    item = FIXTURES["model_get_1102"]
+    raw = json.dumps({"items": [item] * 50, "metadata": {}}).encode()
+    item_size = len(json.dumps(item).encode())
+    splitter = ItemSplitter()
+    for start in range(0, len(raw), 1024):
+        splitter.feed(raw[start : start + 1024])
+        assert len(splitter._buffer) <= item_size + 1024
+    assert splitter.close(json.loads) == {"items": [], "metadata": {}}
+
+
+@pytest.mark.parametrize(
+    "body", [b'{"items": [{"a": 1}, {"b"', b'{"items": [], "m": "ab', b'{"items": [']
+)
+def test_splitter_rejects_truncated_bodies(body):
+    splitter = ItemSplitter()
+    splitter.feed(body)
+    with pytest.raises(ValueError):
+        splitter.close(json.loads)
+
+
+def test_splitter_rejects_bodies_that_are_not_objects():
+    splitter = ItemSplitter()
+    splitter.feed(b"[1, 2]")
+    with pytest.raises(TypeError, match="list"):
+        splitter.close(json.loads)
+
+
+def pages(stand_in_server):
+    model = FIXTURES["model_get_1102"]
+
+    def models(request):
+        page = int(request.path.partition("page=")[2] or 1)
+        items = [{**model, "id": page * 10 + i} for i in range(3)]
+        metadata = {"currentPage": page, "totalPages": 3}
+        return 200, {}, {"items": items, "metadata": metadata}
+
+    stand_in_server.route("/models", models)
+
+
+def test_iter_models_stream_matches_whole_pages(stand_in_server):
+    pages(stand_in_server)
+    civitai = Civitai()
+    civitai.models.BASE_URL = stand_in_server.url
+    civitai.models.STREAM_CHUNK_SIZE = 100
+
+    whole = list(civitai.models.iter_models())
+    streamed = list(civitai.models.iter_models(stream=True))
+
+    assert [m.id for m in streamed] == [10, 11, 12, 20, 21, 22, 30, 31, 32]
+    assert [m.id for m in streamed] == [m.id for m in whole]
+    assert [v.name for v in streamed[0].modelVersions] == [
+        v.name for v in whole[0].modelVersions
+    ]
+    assert list(civitai.models.iter_models(max_items=4, stream=True))[-1].id == 20
+
+
+def test_iter_images_stream_follows_cursors(stand_in_server):
+    image = {"url": "http://img", "createdAt": "2025-08-14T12:34:56Z", "stats": {}}
+
+    def images(request):
+        cursor = int(request.path.partition("cursor=")[2] or 0)
+        metadata = {"nextCursor": str(cursor + 1)} if cursor < 2 else {}
+        return 200, {}, {"items": [{**image, "id": cursor}], "metadata": metadata}
+
+    stand_in_server.route("/images", images)
+    civitai = Civitai()
+    civitai.images.BASE_URL = stand_in_server.url
+
+    assert [i.id for i in civitai.images.iter_images(stream=True)] == [0, 1, 2]
+
+
+def test_stream_errors_are_api_errors(stand_in_server):
+    stand_in_server.json("/models", {}, status=500)
+    stand_in_server.route("/images", lambda _request: (200, {}, b'{"items": [{"a'))
+    civitai = Civitai()
+    civitai.models.BASE_URL = civitai.images.BASE_URL = stand_in_server.url
+
+    with pytest.raises(CivitaiAPIError) as error:
+        list(civitai.models.iter_models(stream=True))
+    assert error.value.status_code == 500
+    with pytest.raises(CivitaiAPIError, match="Invalid JSON"):
+        list(civitai.images.iter_images(stream=True))
+
+
+@pytest.mark.parametrize("body", [b"[]", b"null"])
+def test_stream_bodies_that_are_not_objects_are_api_errors(stand_in_server, body):
+    stand_in_server.route("/models", lambda _request: (200, {}, body))
+    civitai = Civitai()
+    civitai.models.BASE_URL = stand_in_server.url
+    with pytest.raises(CivitaiAPIError, match="Expected a JSON object"):
+        list(civitai.models.iter_models(stream=True))
+
+    pytest.importorskip("httpx")
+
+    async def run():
+        async with AsyncCivitai(base_url=stand_in_server.url) as client:
+            return [m async for m in client.models.iter_models(stream=True)]
+
+    with pytest.raises(CivitaiAPIError, match="Expected a JSON object"):
+        asyncio.run(run())
+
+
+def test_async_iter_models_stream(stand_in_server):
+    pytest.importorskip("httpx")
+    pages(stand_in_server)
+
+    async def run():
+        async with AsyncCivitai(base_url=stand_in_server.url) as civitai:
+            streamed = [m.id async for m in civitai.models.iter_models(stream=True)]
+            first = [
+                m.id async for m in civitai.models.iter_models(max_items=2, stream=True)
+            ]
+            return streamed, first
+
+    streamed, first = asyncio.run(run())
+    assert streamed == [10, 11, 12, 20, 21, 22, 30, 31, 32]
+    assert first == [10, 11]
@@ -0,0 +1,83 @@
+"""Unit tests for timestamp decoding."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from civitai_api.civitai_api.api.images import parse_image
+from civitai_api.civitai_api.api.models import parse_model_version
+from civitai_api.civitai_api.columnar import IMAGE_COLUMNS, ColumnBatch
+from civitai_api.civitai_api.timestamps import (
+    epoch_ms,
+    parse_timestamp,
+    timestamp_decoder,
+)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("2023-03-06T21:36:56.472Z", datetime(2023, 3, 6, 21, 36, 56, 472000, UTC)),
+        ("2023-03-06T21:36:56Z", datetime(2023, 3, 6, 21, 36, 56, tzinfo=UTC)),
+        ("2023-03-06T22:36:56+01:00", datetime(2023, 3, 6, 21, 36, 56, tzinfo=UTC)),
+        ("2023-03-06T21:36:56", datetime(2023, 3, 6, 21, 36, 56)),
+    ],
+)
+def test_parse_timestamp_formats(value, expected):
+    assert parse_timestamp(value) == expected
+
+
+def test_invalid_timestamps_raise_value_error():
+    with pytest.raises(ValueError):
+        parse_timestamp("not-a-date")
+    with pytest.raises(ValueError):
+        epoch_ms("2023-13-01T00:00:00Z")
+
+
+def test_epoch_ms():
+    assert epoch_ms("1970-01-01T00:00:00Z") == 0
+    assert epoch_ms("2023-03-06T21:36:56.472Z") == 1678138616472
+    assert epoch_ms("2023-03-06T21:36:56.472") == 1678138616472
+    assert epoch_ms(datetime(2023, 3, 6, 21, 36, 56, 472000, UTC)) == 1678138616472
+    assert epoch_ms("1969-12-31T23:59:59.999Z") == -1
+
+
+def test_memo_returns_the_remembered_value_and_stays_bounded():
+    decode = timestamp_decoder(memo=2)
+    first = decode("2023-03-06T21:36:56Z")
+    assert decode("2023-03-06T21:36:56Z") is first
+    decode("2023-03-07T00:00:00Z")
+    decode("2023-03-08T00:00:00Z")  # Over the bound: the memo starts over.
+    again = decode("2023-03-06T21:36:56Z")
+    assert again == first
+    assert again is not first
+    with pytest.raises(ValueError):
+        decode("nope")
+
+
+def test_decoder_options():
+    assert timestamp_decoder() is parse_timestamp
+    assert timestamp_decoder(epoch=True) is epoch_ms
+    assert timestamp_decoder(memo=10, epoch=True)("1970-01-01T00:00:01Z") == 1000
+    with pytest.raises(ValueError, match="memo"):
+        timestamp_decoder(memo=-1)
+
+
+def test_image_columns_hold_epoch_milliseconds():
+    items = [
+        {"id": 1, "createdAt": "2023-03-06T21:36:56.472Z", "stats": {}},
+        {"id": 2, "createdAt": "2021-01-01T00:00:00Z", "stats": {}},
+        {"id": 3, "stats": {}},
+    ]
+    raw = ColumnBatch.from_rows(items, IMAGE_COLUMNS)
+    assert list(raw["createdAt"]) == [1678138616472, 1609459200000, 0]
+    assert list(raw.sort("createdAt", descending=True)["id"]) == [1, 2, 3]
+    parsed = ColumnBatch.from_rows([parse_image(i) for i in items[:2]], IMAGE_COLUMNS)
+    assert list(parsed["createdAt"]) == [1678138616472, 1609459200000]
+
+
+def test_repeated_version_timestamps_are_decoded_once():
+    raw = {"id": 1, "createdAt": "2023-03-06T21:36:56.472Z", "files": []}
+    first, second = parse_model_version(raw), parse_model_version(dict(raw))
+    assert first.createdAt == datetime(2023, 3, 6, 21, 36, 56, 472000, UTC)
+    assert second.createdAt is first.createdAt
@@ -0,0 +1,43 @@
+"""Unit tests for the shared Transport and its use by the Civitai client."""
+
+from unittest.mock import patch
+
+from civitai_api import Civitai, Transport
+
+
+def test_civitai_endpoints_share_one_session():
+    civitai = Civitai(api_key="testkey")
+    sessions = {
+        id(api.session)
+        for api in (
+            civitai.creators,
+            civitai.images,
+            civitai.models,
+            civitai.model_versions,
+            civitai.model_versions._models_api,
+            civitai.tags,
+        )
+    }
+    assert sessions == {id(civitai.transport.session)}
+    assert civitai.transport.session.headers["Authorization"] == "Bearer testkey"
+
+
+def test_transport_pool_settings():
+    transport = Transport(pool_connections=3, pool_maxsize=25, pool_block=True)
+    adapter = transport.session.get_adapter("https://civitai.com/api/v1/models")
+    assert adapter._pool_connections == 3
+    assert adapter._pool_maxsize == 25
+    assert adapter._pool_block is True
+
+
+def test_transport_keep_alive_options():
+    assert Transport().session.headers["Connection"] == "keep-alive"
+    assert Transport(keep_alive=False).session.headers["Connection"] == "close"
+    adapter = Transport(keep_alive_idle=30).session.get_adapter("https://civitai.com")
+    assert adapter.poolmanager.connection_pool_kw["socket_options"]
+
+
+def test_civitai_context_manager_closes_transport():
+    with patch.object(Transport, "close") as mock_close, Civitai():
+        pass
+    mock_close.assert_called_once()